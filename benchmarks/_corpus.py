@@ -0,0 +1,65 @@
+"""Synthetic service metadata generator shared by the benchmark scripts."""
+import json
+import os
+from typing import Any, Dict
+
+import yaml
+
+
+def generate_service_dict(n_use_cases: int, name: str = "benchmark service") -> Dict[str, Any]:
+    """Build a valid service metadata dictionary with ``n_use_cases`` use cases."""
+    use_cases = {}
+    for i in range(n_use_cases):
+        triggers = [{
+            "type": "http",
+            "options": {
+                "method": ("get", "post", "put", "delete")[i % 4],
+                "path": f"/resource-{i}/{{uid}}",
+                "apigw": ("internal", "public")[i % 2],
+                "authenticator": "employee",
+                "timeout": 1000 + i % 7,
+                "mapper": {"path_query.uid": "uid", "body": "data"},
+            },
+        }]
+        if i % 3 == 0:
+            triggers.append({
+                "type": "consumer",
+                "options": {"queue": f"queue-{i % 50}", "max_retries": 3,
+                            "delivery_semantic": "at-least-once"},
+            })
+        use_cases[f"useCase{i}"] = {
+            "name": f"use case {i}",
+            "description": f"Synthetic use case number {i} used for benchmarking",
+            "actor": ("end user", "employee", "system")[i % 3],
+            "criticality": ("low", "medium", "high", "critical")[i % 4],
+            "type": "read functional data",
+            "tags": {"accessibility": ("public", "private")[i % 2], "domain": f"domain-{i % 10}"},
+            "triggers": triggers,
+            "external_interactions": [{
+                "keyname": f"division_{i % 20}",
+                "type_interaction": "database",
+                "operation": f"operation_{i}",
+            }],
+        }
+    return {
+        "name": name,
+        "type": "microservice",
+        "description": "Synthetic service for benchmarks",
+        "service_type": "functional",
+        "team": "benchmark-team",
+        "tags": {"service": "benchmark"},
+        "use_cases": use_cases,
+    }
+
+
+def write_service_file(directory: str, n_use_cases: int, format_file: str = "yaml",
+                       name: str = "benchmark service") -> str:
+    """Write a synthetic metadata file and return its path."""
+    data = generate_service_dict(n_use_cases, name)
+    path = os.path.join(directory, f"metadata-{n_use_cases}.{format_file}")
+    with open(path, "w", encoding="utf-8") as file:
+        if format_file == "json":
+            json.dump(data, file)
+        else:
+            yaml.safe_dump(data, file, sort_keys=False)
+    return path
@@ -0,0 +1,41 @@
+"""Benchmark the binary codec against pickle protocol 5.
+
+The codec trades speed for size: its payloads are smaller, but ``decode`` is pure
+Python and loads more slowly than ``pickle.loads``.
+
+Usage: python benchmarks/bench_binary_codec.py [n_use_cases]
+"""
+import pickle
+import sys
+import time
+
+from _corpus import generate_service_dict
+from bisslog_schema.schema.binary_codec import decode, encode
+from bisslog_schema.schema.service_info import ServiceInfo
+
+
+def _timed(label: str, function, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    size = f"{len(result):12,d} bytes" if isinstance(result, bytes) else ""
+    print(f"{label:<20}{best * 1e3:10.1f} ms{size}")
+    return result
+
+
+def main(n_use_cases: int):
+    """Print the payload sizes and the encoding and decoding timings."""
+    service_info = ServiceInfo.from_dict(generate_service_dict(n_use_cases))
+    print(f"{n_use_cases} use cases")
+
+    data = _timed("pickle 5 dumps", lambda: pickle.dumps(service_info, protocol=5))
+    assert _timed("pickle 5 loads", lambda: pickle.loads(data)) == service_info
+
+    data = _timed("encode", lambda: encode(service_info))
+    assert _timed("decode", lambda: decode(data)) == service_info
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,69 @@
+"""Benchmark fleet reports on a columnar catalog against walking the service objects.
+
+The reports are the count of use cases by criticality, trigger types per team and the
+mean HTTP timeout per team.
+
+Usage: python benchmarks/bench_columnar_catalog.py [n_services] [n_use_cases]
+"""
+import sys
+import time
+from collections import Counter, defaultdict
+
+from _corpus import generate_service_dict
+from bisslog_schema import ColumnarCatalog
+from bisslog_schema.schema.service_info import ServiceInfo
+
+
+def _timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:<32}{(time.perf_counter() - start) * 1e3:10.1f} ms")
+    return result
+
+
+def _walk_reports(services):
+    """Compute the reports walking the nested objects."""
+    by_criticality = Counter()
+    types_per_team = Counter()
+    timeouts = defaultdict(list)
+    for service_info in services:
+        for use_case in service_info.use_cases.values():
+            by_criticality[use_case.criticality.value] += 1
+            for trigger in use_case.triggers:
+                types_per_team[(service_info.team, trigger.type.val)] += 1
+                timeout = getattr(trigger.options, "timeout", None)
+                if timeout is not None:
+                    timeouts[service_info.team].append(timeout)
+    mean_timeouts = {team: sum(values) / len(values) for team, values in timeouts.items()}
+    return dict(by_criticality), dict(types_per_team), mean_timeouts
+
+
+def _columnar_reports(catalog: ColumnarCatalog):
+    """Compute the reports on the columnar tables."""
+    return (catalog.use_cases.value_counts("criticality"),
+            catalog.triggers.group_by(["team", "type"]),
+            catalog.triggers.group_by("team", "timeout", "mean"))
+
+
+def main(n_services: int, n_use_cases: int):
+    """Print the build and report timings."""
+    raw = []
+    for i in range(n_services):
+        data = generate_service_dict(n_use_cases, name=f"service-{i}")
+        data["team"] = f"team-{i % 25}"
+        raw.append(data)
+    services = [ServiceInfo.from_dict(data) for data in raw]
+    print(f"{n_services} services x {n_use_cases} use cases")
+
+    walked = _timed("reports walking objects", lambda: _walk_reports(services))
+    catalog = _timed("build from objects", lambda: ColumnarCatalog.from_services(services))
+    _timed("build from raw dicts", lambda: ColumnarCatalog.from_dicts(raw))
+    columnar = _timed("reports on columns", lambda: _columnar_reports(catalog))
+    assert walked[0] == columnar[0] and walked[1] == columnar[1]
+    _timed("filter http triggers of a team",
+           lambda: catalog.triggers.filter(team="team-3", type="http"))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 50)
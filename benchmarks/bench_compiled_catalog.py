@@ -0,0 +1,47 @@
+"""Benchmark single use case lookups in a compiled catalog against loading a pickle.
+
+Usage: python benchmarks/bench_compiled_catalog.py [n_use_cases]
+"""
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+from _corpus import generate_service_dict
+from bisslog_schema.schema.compiled_catalog import CompiledCatalog, compile_catalog
+from bisslog_schema.schema.service_info import ServiceInfo
+
+
+def main(n_use_cases: int):
+    """Print the time to get one use case from a pickle and from a compiled catalog."""
+    service_info = ServiceInfo.from_dict(generate_service_dict(n_use_cases))
+    keyname = f"useCase{n_use_cases // 2}"
+    with tempfile.TemporaryDirectory() as tmp:
+        pickle_path = os.path.join(tmp, "service.pickle")
+        catalog_path = os.path.join(tmp, "service.bscat")
+        with open(pickle_path, "wb") as file:
+            pickle.dump(service_info, file, protocol=pickle.HIGHEST_PROTOCOL)
+        compile_catalog(service_info, catalog_path)
+        print(f"{n_use_cases} use cases, pickle {os.path.getsize(pickle_path) / 1e6:.1f} MB, "
+              f"catalog {os.path.getsize(catalog_path) / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        with open(pickle_path, "rb") as file:
+            pickle.load(file).use_cases[keyname]
+        print(f"pickle load + lookup:     {(time.perf_counter() - start) * 1e3:8.2f} ms")
+
+        start = time.perf_counter()
+        with CompiledCatalog(catalog_path) as catalog:
+            catalog.get(keyname)
+            opened = time.perf_counter()
+            for i in range(1000):
+                catalog.get(f"useCase{i * 7 % n_use_cases}")
+            looked_up = time.perf_counter()
+            catalog.find_by_route("GET", "/resource-4/{uid}")
+        print(f"catalog open + lookup:    {(opened - start) * 1e3:8.2f} ms")
+        print(f"catalog lookup (mean):    {(looked_up - opened) * 1e3:8.2f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,59 @@
+"""Benchmark the memory saved by interning a fleet of services.
+
+Each service is decoded from its own JSON document, as when reading one file per
+service, and built with and without an ``InternTable``. Only the built services are
+kept alive.
+
+Usage: python benchmarks/bench_interning.py [n_services] [n_use_cases]
+"""
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from _corpus import generate_service_dict
+from bisslog_schema.schema.intern_table import InternTable, interning
+from bisslog_schema.schema.service_info import ServiceInfo
+
+
+def _load(documents, table):
+    """Build every service, interning with ``table`` if given."""
+    if table is None:
+        return [ServiceInfo.from_dict(json.loads(document)) for document in documents]
+    with interning(table):
+        return [ServiceInfo.from_dict(json.loads(document)) for document in documents]
+
+
+def _measure(documents, table):
+    """Return the bytes held by the loaded services and the seconds spent."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    services = _load(documents, table)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del services
+    return size, elapsed
+
+
+def main(n_services: int, n_use_cases: int):
+    """Print the memory and time of both loads and the table statistics."""
+    documents = [json.dumps(generate_service_dict(n_use_cases, name=f"service-{i}"))
+                 for i in range(n_services)]
+    total = n_services * n_use_cases
+    plain, plain_time = _measure(documents, None)
+    table = InternTable()
+    interned, interned_time = _measure(documents, table)
+    print(f"{n_services} services x {n_use_cases} use cases")
+    print(f"without interning: {plain / total:8.0f} bytes per use case, {plain_time:6.2f} s")
+    print(f"with interning:    {interned / total:8.0f} bytes per use case, "
+          f"{interned_time:6.2f} s ({1 - interned / plain:.0%} less memory)")
+    print(table.stats())
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 50)
@@ -0,0 +1,60 @@
+"""Benchmark the schema-directed JSON decoder against json.load + ServiceInfo.from_dict.
+
+Reports wall time and peak traced memory on a generated metadata file.
+
+Usage: python benchmarks/bench_json_decoder.py [size_mb]
+"""
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from _corpus import generate_service_dict
+from bisslog_schema.schema.json_service_decoder import load_service_info
+from bisslog_schema.schema.service_info import ServiceInfo
+
+_BYTES_PER_USE_CASE = 620
+
+
+def _two_pass(path):
+    with open(path, encoding="utf-8") as file:
+        return ServiceInfo.from_dict(json.load(file))
+
+
+def _streaming(path):
+    with open(path, encoding="utf-8") as file:
+        return load_service_info(file)
+
+
+def _measure(func, path):
+    gc.collect()
+    start = time.perf_counter()
+    func(path)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    func(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(size_mb: float):
+    """Print wall time and peak memory of both decoding paths."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "metadata.json")
+        n_use_cases = int(size_mb * 1e6 / _BYTES_PER_USE_CASE)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(generate_service_dict(n_use_cases), file)
+        print(f"{os.path.getsize(path) / 1e6:.1f} MB, {n_use_cases} use cases")
+        print(f"{'path':>10} {'wall (s)':>10} {'peak (MB)':>10}")
+        for name, func in (("two-pass", _two_pass), ("streaming", _streaming)):
+            elapsed, peak = _measure(func, path)
+            print(f"{name:>10} {elapsed:>10.2f} {peak / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,39 @@
+"""Benchmark cold parse against cached load of ``read_service_metadata``.
+
+Usage: python benchmarks/bench_metadata_cache.py [n_use_cases ...]
+"""
+import sys
+import tempfile
+import time
+
+from _corpus import write_service_file
+from bisslog_schema.schema.metadata_cache import MetadataDiskCache
+from bisslog_schema.schema.read_metadata import read_service_metadata
+
+
+def _best_of(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes):
+    """Print cold-parse and cached-load times for each size."""
+    print(f"{'use cases':>10} {'cold (ms)':>12} {'cached (ms)':>12} {'speedup':>9}")
+    for n_use_cases in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_service_file(tmp, n_use_cases)
+            cache = MetadataDiskCache(f"{tmp}/cache")
+            cold = _best_of(lambda: read_service_metadata(path), repeat=3)
+            read_service_metadata(path, cache=cache)
+            cached = _best_of(lambda: read_service_metadata(path, cache=cache))
+            print(f"{n_use_cases:>10} {cold * 1000:>12.1f} {cached * 1000:>12.1f}"
+                  f" {cold / cached:>8.1f}x")
+            print(f"{'':>10} cache stats: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100, 1000, 3000])
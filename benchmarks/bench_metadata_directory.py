@@ -0,0 +1,57 @@
+"""Benchmark a single metadata file against a ``metadata.d/`` directory per worker count.
+
+The directory is read with both executors: threads, the default, are limited by the
+GIL, while processes scale with the cores.
+
+Usage: python benchmarks/bench_metadata_directory.py [n_use_cases] [n_files]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import yaml
+
+from _corpus import generate_service_dict, write_service_file
+from bisslog_schema.schema.read_metadata import read_service_metadata
+
+
+def _write_directory(directory: str, n_use_cases: int, n_files: int) -> str:
+    data = generate_service_dict(n_use_cases)
+    use_cases = list(data.pop("use_cases").items())
+    path = os.path.join(directory, "metadata.d")
+    os.makedirs(path)
+    with open(os.path.join(path, "service.yml"), "w", encoding="utf-8") as file:
+        yaml.safe_dump(data, file)
+    chunk = max(1, len(use_cases) // n_files)
+    for i in range(0, len(use_cases), chunk):
+        with open(os.path.join(path, f"group-{i}.yml"), "w", encoding="utf-8") as file:
+            yaml.safe_dump(dict(use_cases[i:i + chunk]), file, sort_keys=False)
+    return path
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(n_use_cases: int, n_files: int):
+    """Print load times of the single file and of the directory per executor and worker count."""
+    with tempfile.TemporaryDirectory() as tmp:
+        single = write_service_file(tmp, n_use_cases)
+        directory = _write_directory(tmp, n_use_cases, n_files)
+        print(f"{n_use_cases} use cases, {n_files} files, {os.cpu_count()} cores")
+        print(f"single file: {_timed(lambda: read_service_metadata(single)):.2f}s")
+        for executor in ("thread", "process"):
+            workers = 1
+            while workers <= (os.cpu_count() or 1):
+                elapsed = _timed(lambda: read_service_metadata(
+                    directory, max_workers=workers, executor=executor))
+                print(f"metadata.d with {workers:>2} {executor} workers: {elapsed:.2f}s")
+                workers *= 2
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [3000, 32][len(args):]))
@@ -0,0 +1,51 @@
+"""Benchmark analyzing a large catalog as one JSON document versus NDJSON lines.
+
+Reports wall time and peak traced memory of ``generate_report`` for both formats.
+
+Usage: python benchmarks/bench_ndjson.py [n_use_cases]
+"""
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from _corpus import generate_service_dict
+from bisslog_schema.commands.analyze_metadata_file.analyze_metadata import generate_report
+from bisslog_schema.schema.ndjson_metadata import write_ndjson_metadata
+
+
+def _measure(path, format_file):
+    gc.collect()
+    start = time.perf_counter()
+    generate_report(path, format_file=format_file)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    generate_report(path, format_file=format_file)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(n_use_cases: int):
+    """Print wall time and peak memory of the analysis of both formats."""
+    data = generate_service_dict(n_use_cases)
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "metadata.json")
+        ndjson_path = os.path.join(tmp, "metadata.ndjson")
+        with open(json_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        write_ndjson_metadata(data, ndjson_path)
+        del data
+        print(f"{n_use_cases} use cases, {os.path.getsize(json_path) / 1e6:.1f} MB")
+        print(f"{'format':>8} {'wall (s)':>10} {'peak (MB)':>10}")
+        for name, path in (("json", json_path), ("ndjson", ndjson_path)):
+            elapsed, peak = _measure(path, name)
+            print(f"{name:>8} {elapsed:>10.2f} {peak / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,62 @@
+"""Benchmark loading several environments as overlays against loading full copies.
+
+Each environment overrides the HTTP options of 1% of the use cases.
+
+Usage: python benchmarks/bench_overlays.py [n_use_cases] [n_environments]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from _corpus import generate_service_dict
+from bisslog_schema import read_service_metadata, read_service_overlays
+from bisslog_schema.schema.metadata_overlay import merge_patch
+
+
+def _measure(load):
+    """Return the seconds and the peak traced memory (MB) of a call, and its result."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6, result
+
+
+def main(n_use_cases: int, n_environments: int):
+    """Print the time and memory of loading full copies and overlays."""
+    data = generate_service_dict(n_use_cases)
+    with tempfile.TemporaryDirectory() as tmp:
+        base_path = os.path.join(tmp, "metadata.json")
+        with open(base_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        full_paths, overlay_paths = [], []
+        for env in range(n_environments):
+            overlay = {"use_cases": {
+                f"useCase{i}": {"triggers": {0: {"options": {"apigw": f"env-{env}",
+                                                             "timeout": 100 + env}}}}
+                for i in range(env, n_use_cases, 100)}}
+            overlay_paths.append(os.path.join(tmp, f"env{env}.json"))
+            full_paths.append(os.path.join(tmp, f"full-env{env}.json"))
+            with open(overlay_paths[-1], "w", encoding="utf-8") as file:
+                json.dump(overlay, file)
+            with open(full_paths[-1], "w", encoding="utf-8") as file:
+                json.dump(merge_patch(data, overlay), file)
+
+        full_time, full_memory, _ = _measure(
+            lambda: [read_service_metadata(path) for path in full_paths])
+        overlay_time, overlay_memory, _ = _measure(
+            lambda: read_service_overlays(base_path, overlay_paths))
+
+    print(f"{n_use_cases} use cases, {n_environments} environments")
+    print(f"full copies: {full_time * 1e3:8.1f} ms, peak {full_memory:7.1f} MB")
+    print(f"overlays:    {overlay_time * 1e3:8.1f} ms, peak {overlay_memory:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 3)
@@ -0,0 +1,58 @@
+"""Benchmark the cold start of importing a compiled Python module against parsing metadata.
+
+Every measurement runs in a fresh interpreter, timing only the load itself (the
+``bisslog_schema`` import is done before starting the clock). The compiled module is
+imported once beforehand so its bytecode is cached, as it would be in a deployed package.
+
+Usage: python benchmarks/bench_python_artifact.py [n_use_cases ...]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+from _corpus import write_service_file
+from bisslog_schema import read_service_metadata
+from bisslog_schema.schema.python_artifact import write_python_module
+
+_SNIPPET = """
+import sys, time
+from bisslog_schema import read_service_metadata
+from bisslog_schema.schema.python_artifact import load_python_module
+sys.path.insert(0, {directory!r})
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def _run(directory: str, statement: str) -> float:
+    """Return the seconds a statement takes in a fresh interpreter."""
+    code = _SNIPPET.format(directory=directory, statement=statement)
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True,
+                            text=True, env={**os.environ, "PYTHONDONTWRITEBYTECODE": ""})
+    return float(output.stdout.strip())
+
+
+def main(sizes):
+    """Print the load time of each metadata format for each service size."""
+    print(f"{'use cases':>10} {'yaml ms':>10} {'json ms':>10} {'module ms':>10} "
+          f"{'checked ms':>10}")
+    for n_use_cases in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            yaml_path = write_service_file(tmp, n_use_cases, "yaml")
+            json_path = write_service_file(tmp, n_use_cases, "json")
+            write_python_module(read_service_metadata(json_path), json_path,
+                                os.path.join(tmp, "service_metadata.py"))
+            _run(tmp, "import service_metadata")  # writes the cached bytecode
+            times = [
+                _run(tmp, f"read_service_metadata({yaml_path!r})"),
+                _run(tmp, f"read_service_metadata({json_path!r})"),
+                _run(tmp, "load_python_module('service_metadata')"),
+                _run(tmp, f"load_python_module('service_metadata', {json_path!r})"),
+            ]
+        print(f"{n_use_cases:>10} " + " ".join(f"{seconds * 1e3:>10.1f}" for seconds in times))
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100, 1_000, 10_000])
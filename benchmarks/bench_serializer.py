@@ -0,0 +1,45 @@
+"""Benchmark the generated serializers against ``dataclasses.asdict``.
+
+``asdict`` keeps the enums and the ``None`` fields, so its output does not have the
+metadata shape; it is the baseline cost of walking the objects.
+
+Usage: python benchmarks/bench_serializer.py [n_use_cases]
+"""
+import io
+import json
+import sys
+import time
+from dataclasses import asdict
+
+from _corpus import generate_service_dict
+from bisslog_schema.schema.serializer import write_json
+from bisslog_schema.schema.service_info import ServiceInfo
+
+
+def _timed(label: str, function, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<32}{best * 1e3:10.1f} ms")
+    return result
+
+
+def main(n_use_cases: int):
+    """Print the serialization timings."""
+    service_info = ServiceInfo.from_dict(generate_service_dict(n_use_cases))
+    print(f"{n_use_cases} use cases")
+
+    _timed("dataclasses.asdict", lambda: asdict(service_info))
+    data = _timed("to_dict", service_info.to_dict)
+    assert ServiceInfo.from_dict(data) == service_info
+
+    _timed("json.dumps(asdict, default=str)",
+           lambda: json.dumps(asdict(service_info), default=str))
+    _timed("to_json", service_info.to_json)
+    _timed("write_json (streaming)", lambda: write_json(service_info, io.StringIO()))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
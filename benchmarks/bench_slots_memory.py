@@ -0,0 +1,63 @@
+"""Benchmark the memory per use case of the slotted schema objects.
+
+The same service is copied twice, once into the slotted schema classes and once into
+equivalent dataclasses with a per-instance ``__dict__`` (the previous layout). Strings
+and other leaf values are shared by both copies, so only the objects are measured.
+
+Usage: python benchmarks/bench_slots_memory.py [n_use_cases]
+"""
+import gc
+import sys
+import tracemalloc
+from dataclasses import fields, is_dataclass, make_dataclass
+
+from _corpus import generate_service_dict
+from bisslog_schema.schema.service_info import ServiceInfo
+
+_DICT_CLASSES = {}
+
+
+def _dict_class(cls: type) -> type:
+    """Return a dataclass with the fields of ``cls`` and a per-instance ``__dict__``."""
+    if cls not in _DICT_CLASSES:
+        _DICT_CLASSES[cls] = make_dataclass(cls.__name__, [f.name for f in fields(cls)])
+    return _DICT_CLASSES[cls]
+
+
+def _copy(value, slotted: bool):
+    """Copy a tree of schema objects into the slotted or the dict-based classes."""
+    if is_dataclass(value):
+        cls = type(value) if slotted else _dict_class(type(value))
+        return cls(**{f.name: _copy(getattr(value, f.name), slotted) for f in fields(value)})
+    if isinstance(value, dict):
+        return {key: _copy(item, slotted) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy(item, slotted) for item in value]
+    return value
+
+
+def _measure(service_info: ServiceInfo, slotted: bool) -> int:
+    """Return the bytes allocated by a copy of the service."""
+    gc.collect()
+    tracemalloc.start()
+    copied = _copy(service_info, slotted)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del copied
+    return size
+
+
+def main(n_use_cases: int):
+    """Print the bytes per use case of both layouts."""
+    service_info = ServiceInfo.from_dict(generate_service_dict(n_use_cases))
+    _copy(service_info, slotted=False)  # create the dict-based classes outside the trace
+    with_dict = _measure(service_info, slotted=False)
+    with_slots = _measure(service_info, slotted=True)
+    print(f"{n_use_cases} use cases, Python {sys.version.split()[0]}")
+    print(f"__dict__ layout: {with_dict / n_use_cases:8.0f} bytes per use case")
+    print(f"__slots__:       {with_slots / n_use_cases:8.0f} bytes per use case "
+          f"({1 - with_slots / with_dict:.0%} less)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
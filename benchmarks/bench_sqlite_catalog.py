@@ -0,0 +1,69 @@
+"""Benchmark the SQLite catalog on a fleet of services.
+
+Measures the first sync, a sync without changes, a sync after editing 1% of the
+services, and a queue query against re-reading every metadata file.
+
+Usage: python benchmarks/bench_sqlite_catalog.py [n_services] [n_use_cases]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from _corpus import generate_service_dict
+from bisslog_schema import SQLiteCatalog, read_service_metadata
+from bisslog_schema.fleet_metadata_reader import discover_metadata_files
+from bisslog_schema.schema.triggers.trigger_consumer import TriggerConsumer
+
+
+def _write_fleet(root: str, n_services: int, n_use_cases: int, edit: str = "") -> None:
+    """Write one metadata.json per service."""
+    for i in range(n_services):
+        data = generate_service_dict(n_use_cases, name=f"service-{i}")
+        data["team"] = f"team-{i % 25}{edit if i % 100 == 0 else ''}"
+        directory = os.path.join(root, f"service-{i}")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "metadata.json"), "w", encoding="utf-8") as file:
+            json.dump(data, file)
+
+
+def _timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:<28}{(time.perf_counter() - start) * 1e3:10.1f} ms")
+    return result
+
+
+def _scan_queue(root: str, queue: str):
+    """Answer a queue query by re-reading every metadata file."""
+    found = []
+    for path in discover_metadata_files(root):
+        service_info = read_service_metadata(path)
+        for keyname, use_case in service_info.use_cases.items():
+            if any(isinstance(t.options, TriggerConsumer) and t.options.queue == queue
+                   for t in use_case.triggers):
+                found.append((service_info.name, keyname))
+    return found
+
+
+def main(n_services: int, n_use_cases: int):
+    """Print the sync and query timings."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, "fleet")
+        _write_fleet(root, n_services, n_use_cases)
+        print(f"{n_services} services x {n_use_cases} use cases")
+        with SQLiteCatalog(os.path.join(tmp, "catalog.db")) as catalog:
+            _timed("first sync", lambda: catalog.sync(root))
+            _timed("sync without changes", lambda: catalog.sync(root))
+            _write_fleet(root, n_services, n_use_cases, edit="-renamed")
+            result = _timed("sync after 1% edits", lambda: catalog.sync(root))
+            print(f"{'':<28}{len(result.updated)} updated, {len(result.unchanged)} unchanged")
+            found = _timed("query queue (sqlite)", lambda: catalog.find_by_queue("queue-7"))
+        scanned = _timed("query queue (re-read all)", lambda: _scan_queue(root, "queue-7"))
+        assert len(found) == len(scanned)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 20)
@@ -0,0 +1,66 @@
+"""Benchmark use case lookups on the cached indexes against a linear scan.
+
+Usage: python benchmarks/bench_use_case_indexes.py [n_use_cases] [n_lookups]
+"""
+import random
+import sys
+import time
+
+from _corpus import generate_service_dict
+from bisslog_schema.schema.service_info import ServiceInfo
+from bisslog_schema.schema.triggers.trigger_http import TriggerHttp
+
+
+def _scan_route(service_info: ServiceInfo, method: str, path: str):
+    """Find the use case of a route scanning every use case and trigger."""
+    for use_case in service_info.use_cases.values():
+        for trigger in use_case.triggers:
+            options = trigger.options
+            if isinstance(options, TriggerHttp) and options.method == method \
+                    and options.path == path:
+                return use_case
+    return None
+
+
+def _scan_tag(service_info: ServiceInfo, key: str, value: str):
+    """Find the keynames of the use cases with a tag scanning every use case."""
+    return [keyname for keyname, use_case in service_info.use_cases.items()
+            if (use_case.tags or {}).get(key) == value]
+
+
+def _timed(label: str, function, n_lookups: int = 0):
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    per_lookup = f"{elapsed / n_lookups * 1e6:12.2f} us/lookup" if n_lookups else ""
+    print(f"{label:<28}{elapsed * 1e3:10.1f} ms{per_lookup}")
+
+
+def main(n_use_cases: int, n_lookups: int):
+    """Print the lookup timings of both strategies."""
+    service_info = ServiceInfo.from_dict(generate_service_dict(n_use_cases))
+    rng = random.Random(0)
+    routes = []
+    for i in (rng.randrange(n_use_cases) for _ in range(n_lookups)):
+        routes.append((("GET", "POST", "PUT", "DELETE")[i % 4], f"/resource-{i}/{{uid}}"))
+    print(f"{n_use_cases} use cases, {n_lookups} lookups")
+
+    _timed("route, linear scan",
+           lambda: [_scan_route(service_info, *route) for route in routes], n_lookups)
+    _timed("build indexes", lambda: service_info.indexes)
+    indexes = service_info.indexes
+    _timed("route, indexed",
+           lambda: [indexes.find_by_route(*route) for route in routes], n_lookups)
+    assert all(_scan_route(service_info, *route) is indexes.find_by_route(*route)
+               for route in routes[:100])
+
+    n_tag_lookups = max(1, n_lookups // 100)
+    _timed("tag, linear scan", lambda: [_scan_tag(service_info, "domain", "domain-3")
+                                        for _ in range(n_tag_lookups)], n_tag_lookups)
+    _timed("tag, indexed", lambda: [indexes.find_by_tag("domain", "domain-3")
+                                    for _ in range(n_tag_lookups)], n_tag_lookups)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 2_000)
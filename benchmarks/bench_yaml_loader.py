@@ -0,0 +1,35 @@
+"""Benchmark the YAML parse throughput (MB/s) of each available loader.
+
+Usage: python benchmarks/bench_yaml_loader.py [n_use_cases ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from _corpus import write_service_file
+from bisslog_schema.schema.read_metadata import read_metadata_file, yaml_loader_name
+
+
+def main(sizes):
+    """Print the throughput of every loader for each size."""
+    loaders = ["python"]
+    if yaml_loader_name("auto") == "c":
+        loaders.append("c")
+    print(f"{'use cases':>10} {'size (MB)':>10} " + " ".join(f"{name + ' MB/s':>10}"
+                                                          for name in loaders))
+    for n_use_cases in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_service_file(tmp, n_use_cases)
+            size_mb = os.path.getsize(path) / 1e6
+            throughput = []
+            for loader in loaders:
+                start = time.perf_counter()
+                read_metadata_file(path, yaml_loader=loader)
+                throughput.append(size_mb / (time.perf_counter() - start))
+            print(f"{n_use_cases:>10} {size_mb:>10.2f} "
+                  + " ".join(f"{value:>10.2f}" for value in throughput))
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100, 1000, 3000])
@@ -2,12 +2,23 @@
 of a distributed system, focusing on its use cases and service design.
 It structures the metadata without exposing any underlying technical
 or implementation-specific details."""
-from .schema.read_metadata import read_service_metadata
+from .schema.read_metadata import read_service_metadata, iter_service_metadata
+from .schema.metadata_overlay import read_service_overlays
 from .use_case_code_inspector import extract_use_case_code_metadata, extract_use_case_obj_from_code
 from .service_full_metadata_reader import read_full_service_metadata, read_service_info_with_code
+from .async_metadata_reader import (aread_service_metadata, aread_full_service_metadata,
+                                    aread_many_service_metadata)
+from .fleet_metadata_reader import read_fleet_metadata, iter_fleet_metadata
+from .metadata_watcher import MetadataWatcher
+from .sqlite_catalog import SQLiteCatalog
+from .columnar_catalog import ColumnarCatalog
 
 __all__ = [
-    "read_service_metadata", "extract_use_case_code_metadata",
+    "read_service_metadata", "iter_service_metadata", "read_service_overlays",
+    "extract_use_case_code_metadata",
     "extract_use_case_obj_from_code",
-    "read_full_service_metadata", "read_service_info_with_code"
+    "read_full_service_metadata", "read_service_info_with_code",
+    "aread_service_metadata", "aread_full_service_metadata", "aread_many_service_metadata",
+    "read_fleet_metadata", "iter_fleet_metadata", "MetadataWatcher",
+    "SQLiteCatalog", "ColumnarCatalog"
 ]
@@ -0,0 +1,173 @@
+"""
+Module providing asyncio entry points for loading service metadata.
+
+File I/O, parsing, validation and code inspection are blocking, so these coroutines
+offload them to an executor and keep the event loop responsive. Many loads can run
+concurrently under a configurable concurrency limit, and awaiting coroutines can be
+cancelled: the caller stops waiting right away, while a load that already started in
+a worker thread runs to completion and its result is discarded. Such a load keeps its
+slot of the concurrency limit until it finishes, so the limit bounds the real work.
+"""
+import asyncio
+import threading
+from concurrent.futures import Executor
+from functools import partial
+from typing import Optional, Iterable, List, Callable, TypeVar
+
+from .schema.read_metadata import read_service_metadata
+from .schema.service_info import ServiceInfo
+from .service_full_metadata_reader import (read_full_service_metadata,
+                                           ServiceFullMetadataReader)
+from .service_metadata_with_code import ServiceInfoWithCode
+
+T = TypeVar("T")
+
+
+async def _run_blocking(func: Callable[[], T], loop_executor: Optional[Executor],
+                        limiter: Optional[asyncio.Semaphore]) -> T:
+    """Run a blocking callable in an executor, optionally under a concurrency limiter.
+
+    The limiter is released when the callable finishes in the executor, or when the
+    awaiting task is cancelled before the callable started, never earlier.
+    """
+    loop = asyncio.get_running_loop()
+    if limiter is None:
+        return await loop.run_in_executor(loop_executor, func)
+
+    lock = threading.Lock()
+    state = {"started": False, "abandoned": False}
+
+    def release() -> None:
+        try:
+            loop.call_soon_threadsafe(limiter.release)
+        except RuntimeError:  # the loop is already closed
+            pass
+
+    def run() -> T:
+        with lock:
+            if state["abandoned"]:
+                raise asyncio.CancelledError()
+            state["started"] = True
+        try:
+            return func()
+        finally:
+            release()
+
+    def on_done(future: "asyncio.Future[T]") -> None:
+        if not future.cancelled():
+            return
+        with lock:
+            if state["started"]:
+                return
+            state["abandoned"] = True
+        limiter.release()
+
+    await limiter.acquire()
+    try:
+        future = loop.run_in_executor(loop_executor, run)
+    except BaseException:
+        limiter.release()
+        raise
+    future.add_done_callback(on_done)
+    return await future
+
+
+async def aread_service_metadata(path: Optional[str] = None, encoding: str = "utf-8", *,
+                                 loop_executor: Optional[Executor] = None,
+                                 limiter: Optional[asyncio.Semaphore] = None,
+                                 **options) -> ServiceInfo:
+    """Asynchronously read service metadata into a ServiceInfo object.
+
+    Parameters
+    ----------
+    path : Optional[str], default=None
+        The specific file path to read. If None, searches default paths.
+    encoding : str, default="utf-8"
+        The file encoding to use when reading the file.
+    loop_executor : Optional[Executor], default=None
+        Executor running the blocking load. Defaults to the loop default executor.
+    limiter : Optional[asyncio.Semaphore], default=None
+        Semaphore shared between loads to cap how many run at the same time.
+    **options
+        Extra keyword options forwarded unchanged to ``read_service_metadata`` (cache,
+        lazy, executor, ...).
+
+    Returns
+    -------
+    ServiceInfo
+        The parsed service metadata.
+    """
+    return await _run_blocking(partial(read_service_metadata, path, encoding, **options),
+                               loop_executor, limiter)
+
+
+async def aread_full_service_metadata(
+        metadata_file: Optional[str] = None, use_cases_folder_path: Optional[str] = None, *,
+        encoding: str = "utf-8", loop_executor: Optional[Executor] = None,
+        limiter: Optional[asyncio.Semaphore] = None,
+        reader: ServiceFullMetadataReader = read_full_service_metadata) -> ServiceInfoWithCode:
+    """Asynchronously read service metadata and merge it with the use cases found in code.
+
+    Parameters
+    ----------
+    metadata_file : Optional[str], default=None
+        Path to the YAML or JSON file that contains the declared service metadata.
+    use_cases_folder_path : Optional[str], default=None
+        Directory containing the source files where use cases are implemented.
+    encoding : str, default="utf-8"
+        Encoding used to read the metadata file.
+    loop_executor : Optional[Executor], default=None
+        Executor running the blocking load. Defaults to the loop default executor.
+    limiter : Optional[asyncio.Semaphore], default=None
+        Semaphore shared between loads to cap how many run at the same time.
+    reader : ServiceFullMetadataReader, default=read_full_service_metadata
+        Reader used to merge metadata and code, e.g. ``read_service_info_with_code``.
+
+    Returns
+    -------
+    ServiceInfoWithCode
+        The declared service metadata combined with the implemented use cases.
+    """
+    return await _run_blocking(
+        partial(reader, metadata_file, use_cases_folder_path, encoding=encoding),
+        loop_executor, limiter)
+
+
+async def aread_many_service_metadata(paths: Iterable[str], *, max_concurrency: int = 8,
+                                      encoding: str = "utf-8",
+                                      loop_executor: Optional[Executor] = None,
+                                      **options) -> List[ServiceInfo]:
+    """Asynchronously read several metadata files with a concurrency limit.
+
+    If any load fails or the coroutine is cancelled, the pending loads are cancelled.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        Paths of the metadata files to read.
+    max_concurrency : int, default=8
+        Maximum number of loads running at the same time.
+    encoding : str, default="utf-8"
+        The file encoding to use when reading the files.
+    loop_executor : Optional[Executor], default=None
+        Executor running the blocking loads. Defaults to the loop default executor.
+    **options
+        Extra keyword options forwarded unchanged to ``read_service_metadata``.
+
+    Returns
+    -------
+    List[ServiceInfo]
+        The parsed services, in the same order as ``paths``.
+    """
+    if max_concurrency < 1:
+        raise ValueError("The 'max_concurrency' must be greater or equal than 1")
+    limiter = asyncio.Semaphore(max_concurrency)
+    tasks = [asyncio.ensure_future(aread_service_metadata(
+        path, encoding, loop_executor=loop_executor, limiter=limiter, **options))
+        for path in paths]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
@@ -7,11 +7,14 @@ to analyze metadata files in various formats (e.g., YAML, JSON) and perform othe
 Commands
 --------
 - `analyze_metadata`: Analyze a metadata file and generate a report.
+- `compile`: Compile a metadata file into a memory-mapped catalog or a Python module.
 """
 import argparse
 import sys
 
 from .commands.analyze_metadata_file.analyze_metadata import analyze_command
+from .commands.compile_metadata.compile_metadata import COMPILE_TARGETS, compile_command
+from .schema.read_metadata import YAML_LOADERS
 
 
 def main():
@@ -24,13 +27,23 @@ def main():
     analyze_metadata : str
         Command to analyze a metadata file with the following parameters:
         - path: Path to the metadata file (required)
-        - format_file: File format (yaml|json|xml, default: yaml)
+        - format_file: File format (yaml|json|ndjson|xml, default: yaml)
         - encoding: File encoding (default: utf-8)
         - min_warnings: Minimum warning percentage allowed (optional)
+        - yaml_loader: YAML loader (auto|c|python, default: auto)
+    compile : str
+        Command to compile a metadata file with the following parameters:
+        - path: Path to the metadata file (required)
+        - output: Path of the output (default: metadata path with .bscat or .py extension)
+        - encoding: File encoding (default: utf-8)
+        - yaml_loader: YAML loader (auto|c|python, default: auto)
+        - target: Artifact to write (catalog|python, default: catalog)
 
     Examples
     --------
     $ bisslog_schema analyze_metadata /path/to/file.yaml --min-warnings 0.5
+    $ bisslog_schema compile /path/to/file.yaml -o /path/to/catalog.bscat
+    $ bisslog_schema compile /path/to/file.yaml --target python -o service_metadata.py
 
     Raises
     ------
@@ -45,7 +58,7 @@ def main():
     analyze_parser.add_argument("path", help="Path to metadata file")
     analyze_parser.add_argument(
         "--format-file", help="Format to read the file (default: yaml)",
-        default="yaml", choices=['yaml', 'json', 'xml'])
+        default="yaml", choices=['yaml', 'json', 'ndjson', 'xml'])
     analyze_parser.add_argument(
         "--encoding", help="Encoding to read the file (default: utf-8)",
         default="utf-8",
@@ -54,6 +67,25 @@ def main():
     analyze_parser.add_argument(
         "--min-warnings", help="Minimum percentage of warnings allowed",
         type=float, default=None)
+    analyze_parser.add_argument(
+        "--yaml-loader", help="YAML loader to use: libyaml C loader, pure-Python "
+                              "loader or auto-detect (default: auto)",
+        default="auto", choices=YAML_LOADERS)
+
+    compile_parser = subparsers.add_parser(
+        "compile", help="Compile metadata file into a memory-mapped catalog or Python module")
+    compile_parser.add_argument("path", help="Path to metadata file")
+    compile_parser.add_argument(
+        "-o", "--output", help="Path of the compiled file (default: <path>.bscat or <path>.py)",
+        default=None)
+    compile_parser.add_argument(
+        "--encoding", help="Encoding to read the file (default: utf-8)", default="utf-8")
+    compile_parser.add_argument(
+        "--yaml-loader", help="YAML loader to use (default: auto)",
+        default="auto", choices=YAML_LOADERS)
+    compile_parser.add_argument(
+        "--target", help="Artifact to write (default: catalog)",
+        default="catalog", choices=COMPILE_TARGETS)
 
     args = parser.parse_args()
 
@@ -62,7 +94,11 @@ def main():
             analyze_command(args.path,
                            format_file=args.format_file,
                            encoding=args.encoding,
-                           min_warnings=args.min_warnings)
+                           min_warnings=args.min_warnings,
+                           yaml_loader=args.yaml_loader)
+        elif args.command == "compile":
+            compile_command(args.path, args.output, encoding=args.encoding,
+                            yaml_loader=args.yaml_loader, target=args.target)
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
         sys.exit(2)
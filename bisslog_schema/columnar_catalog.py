@@ -0,0 +1,592 @@
+"""
+Module providing a columnar view of the metadata of a fleet of services.
+
+Reporting over a fleet (counts by criticality, trigger types per team, timeout
+distributions, ...) walking the nested ``ServiceInfo`` objects allocates and
+dereferences millions of objects. A ``ColumnarCatalog`` flattens services, use cases,
+triggers and external interactions into tables of columns: numbers are stored in
+``array`` buffers and strings are dictionary-encoded, i.e. stored as integer codes
+into the list of their distinct values. Filters and aggregations work on the codes,
+slicing a table is zero-copy and numeric columns can be exported to NumPy without
+copying.
+
+Filters and aggregations are plain Python loops over the columns (``map``,
+``compress``, ``Counter``), not vectorized array operations: they save the object
+walk and evaluate string conditions once per distinct value, and NumPy is only used
+by ``to_numpy``.
+"""
+import importlib
+import math
+import sys
+from array import array
+from collections import Counter, defaultdict
+from functools import reduce
+from itertools import compress
+from operator import and_
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, \
+    Tuple, Union
+
+from .schema.enums.criticality import CriticalityEnum
+from .schema.enums.trigger_type import TriggerEnum
+from .schema.enums.type_external_interaction import TypeExternalInteraction
+from .schema.service_info import ServiceInfo
+
+AGGREGATES = ("count", "sum", "mean", "min", "max")
+
+_SERVICE_COLUMNS = (("name", None), ("team", None), ("type", None), ("service_type", None),
+                    ("use_cases", "i"))
+_USE_CASE_COLUMNS = (("service", None), ("team", None), ("keyname", None), ("name", None),
+                     ("type", None), ("actor", None), ("criticality", "d"),
+                     ("triggers", "i"), ("external_interactions", "i"))
+_TRIGGER_COLUMNS = (("use_case_row", "q"), ("service", None), ("team", None),
+                    ("use_case", None), ("keyname", None), ("type", None), ("method", None),
+                    ("path", None), ("apigw", None), ("authenticator", None),
+                    ("timeout", "d"), ("queue", None), ("max_retries", "d"),
+                    ("cronjob", None), ("route_key", None))
+_EXTERNAL_INTERACTION_COLUMNS = (("use_case_row", "q"), ("service", None), ("team", None),
+                                 ("use_case", None), ("keyname", None),
+                                 ("type_interaction", None),
+                                 ("type_interaction_standard", None), ("operation", None))
+_TRIGGER_OPTIONS = ("method", "path", "apigw", "authenticator", "timeout", "queue",
+                    "max_retries", "cronjob", "route_key")
+
+
+class DictionaryColumn:
+    """String column stored as integer codes into the list of its distinct values.
+
+    Parameters
+    ----------
+    codes : memoryview
+        Code of each row, an index into ``categories``.
+    categories : List[Optional[str]]
+        Distinct values of the column; None is a category like any other value.
+    """
+
+    __slots__ = ("codes", "categories")
+
+    def __init__(self, codes: memoryview, categories: List[Optional[str]]):
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return DictionaryColumn(self.codes[index], self.categories)
+        return self.categories[self.codes[index]]
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return map(self.categories.__getitem__, self.codes)
+
+    def __repr__(self) -> str:
+        return f"DictionaryColumn({len(self)} rows, {len(self.categories)} categories)"
+
+    def tolist(self) -> List[Optional[str]]:
+        """Return the decoded values."""
+        return list(self)
+
+    def matching_codes(self, condition: Any) -> set:
+        """Return the codes of the categories matching a condition, see ``ColumnTable.filter``.
+
+        The condition is evaluated once per distinct value instead of once per row.
+        """
+        test = _condition_test(condition)
+        return {code for code, value in enumerate(self.categories) if test(value)}
+
+
+Column = Union[memoryview, DictionaryColumn]
+
+
+def _condition_test(condition: Any) -> Callable[[Any], bool]:
+    """Turn a filter condition (value, collection of values or predicate) into a test."""
+    if callable(condition):
+        return condition
+    if isinstance(condition, (set, frozenset, list, tuple)):
+        return frozenset(condition).__contains__
+    return frozenset((condition,)).__contains__
+
+
+def _is_nan(value: Any) -> bool:
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _import_numpy():
+    """Import NumPy, printing installation instructions when it is missing."""
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as e:
+        print("Please install NumPy or bisslog_schema[numpy] to export NumPy arrays.\n"
+              "pip install bisslog_schema[numpy]\n"
+              "or\n"
+              "pip install numpy", file=sys.stderr)
+        raise e
+
+
+class ColumnTable:
+    """Table of equally long columns.
+
+    Numeric columns are memoryviews of ``array`` buffers, with NaN for missing values
+    in float columns, and string columns are ``DictionaryColumn`` objects.
+
+    Parameters
+    ----------
+    columns : Dict[str, Column]
+        Columns keyed by name.
+    """
+
+    def __init__(self, columns: Dict[str, Column]):
+        self.columns = columns
+        self._length = len(next(iter(columns.values()))) if columns else 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def __repr__(self) -> str:
+        return f"ColumnTable({self._length} rows, columns={list(self.columns)})"
+
+    @property
+    def column_names(self) -> List[str]:
+        """Names of the columns."""
+        return list(self.columns)
+
+    def to_pylist(self, name: str) -> List[Any]:
+        """Return the values of a column as a Python list."""
+        return self.columns[name].tolist()
+
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """Yield each row as a dictionary. Meant for small results, e.g. after a filter."""
+        names = list(self.columns)
+        for values in zip(*self.columns.values()):
+            yield dict(zip(names, values))
+
+    def slice(self, start: int, stop: Optional[int] = None) -> "ColumnTable":
+        """Return a view of a range of rows without copying the columns.
+
+        Parameters
+        ----------
+        start : int
+            First row of the view.
+        stop : Optional[int], default=None
+            Row where the view ends, excluded. None means the end of the table.
+
+        Returns
+        -------
+        ColumnTable
+            A table sharing the buffers of this one.
+        """
+        rows = slice(start, stop)
+        return ColumnTable({name: column[rows] for name, column in self.columns.items()})
+
+    def where(self, **conditions: Any) -> array:
+        """Return the indices of the rows matching every condition.
+
+        Parameters
+        ----------
+        **conditions : Any
+            Condition per column name: a value, a set, list or tuple of accepted values,
+            or a predicate. On string columns predicates are evaluated once per distinct
+            value; on numeric columns they are called for every row.
+
+        Returns
+        -------
+        array
+            Row indices, typecode ``q``.
+
+        Raises
+        ------
+        KeyError
+            If a condition names an unknown column.
+        """
+        masks = []
+        for name, condition in conditions.items():
+            column = self.columns[name]
+            if isinstance(column, DictionaryColumn):
+                masks.append(map(column.matching_codes(condition).__contains__, column.codes))
+            else:
+                masks.append(map(_condition_test(condition), column))
+        if not masks:
+            return array("q", range(self._length))
+        return array("q", compress(range(self._length), reduce(
+            lambda left, right: map(and_, left, right), masks)))
+
+    def take(self, indices: Iterable[int]) -> "ColumnTable":
+        """Return a new table with the given rows, copying them.
+
+        Parameters
+        ----------
+        indices : Iterable[int]
+            Row indices, e.g. the result of ``where``.
+
+        Returns
+        -------
+        ColumnTable
+            The selected rows.
+        """
+        indices = indices if isinstance(indices, (array, list, range)) else list(indices)
+        columns = {}
+        for name, column in self.columns.items():
+            if isinstance(column, DictionaryColumn):
+                codes = array("i", map(column.codes.__getitem__, indices))
+                columns[name] = DictionaryColumn(memoryview(codes), column.categories)
+            else:
+                columns[name] = memoryview(array(column.format,
+                                                 map(column.__getitem__, indices)))
+        return ColumnTable(columns)
+
+    def filter(self, **conditions: Any) -> "ColumnTable":
+        """Return the rows matching every condition, see ``where``.
+
+        Returns
+        -------
+        ColumnTable
+            The matching rows.
+        """
+        return self.take(self.where(**conditions))
+
+    def value_counts(self, name: str) -> Dict[Any, int]:
+        """Count the rows of each value of a column.
+
+        Missing values of float columns are counted under None.
+
+        Returns
+        -------
+        Dict[Any, int]
+            Number of rows per value, most common first.
+        """
+        column = self.columns[name]
+        if isinstance(column, DictionaryColumn):
+            counts = Counter(column.codes)
+            return {column.categories[code]: count for code, count in counts.most_common()}
+        values = column if column.format != "d" else (
+            None if _is_nan(value) else value for value in column)
+        return dict(Counter(values).most_common())
+
+    def group_by(self, keys: Union[str, Sequence[str]], value: Optional[str] = None,
+                 aggregate: str = "count") -> Dict[Any, float]:
+        """Aggregate the rows grouped by one or more columns.
+
+        Parameters
+        ----------
+        keys : Union[str, Sequence[str]]
+            Column or columns to group by. With several columns the groups are keyed
+            by tuples.
+        value : Optional[str], default=None
+            Numeric column to aggregate, required unless ``aggregate`` is "count".
+            Missing (NaN) values are skipped.
+        aggregate : str, default="count"
+            One of "count", "sum", "mean", "min" or "max".
+
+        Returns
+        -------
+        Dict[Any, float]
+            The aggregate of each group.
+
+        Raises
+        ------
+        ValueError
+            If the aggregate is unknown or requires a missing value column.
+        """
+        if aggregate not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate '{aggregate}'. Must be one of: {AGGREGATES}.")
+        if aggregate != "count" and value is None:
+            raise ValueError(f"The '{aggregate}' aggregate requires a value column.")
+        single = isinstance(keys, str)
+        key_columns = [self.columns[keys]] if single else [self.columns[k] for k in keys]
+        group_keys = (key_columns[0].codes if isinstance(key_columns[0], DictionaryColumn)
+                      else key_columns[0]) if single else zip(
+            *(c.codes if isinstance(c, DictionaryColumn) else c for c in key_columns))
+
+        if aggregate == "count" and value is None:
+            results = Counter(group_keys)
+        else:
+            groups = defaultdict(list)
+            for key, number in zip(group_keys, self.columns[value]):
+                if not _is_nan(number):
+                    groups[key].append(number)
+            results = {key: _aggregate(aggregate, numbers) for key, numbers in groups.items()}
+
+        def decode(key):
+            if single:
+                return _decode(key_columns[0], key)
+            return tuple(_decode(column, item) for column, item in zip(key_columns, key))
+
+        return {decode(key): result for key, result in results.items()}
+
+    def to_numpy(self, name: str):
+        """Export a column as a NumPy array.
+
+        Numeric columns share their buffer with the array; string columns are decoded
+        into an object array.
+
+        Returns
+        -------
+        numpy.ndarray
+            The column values.
+        """
+        numpy = _import_numpy()
+        column = self.columns[name]
+        if isinstance(column, DictionaryColumn):
+            return numpy.array(column.categories, dtype=object)[numpy.asarray(column.codes)]
+        return numpy.asarray(column)
+
+
+def _decode(column: Column, key: Any) -> Any:
+    """Decode a group key of a column."""
+    return column.categories[key] if isinstance(column, DictionaryColumn) else key
+
+
+def _aggregate(aggregate: str, numbers: List[float]) -> float:
+    """Apply an aggregate to the numbers of a group."""
+    if aggregate == "count":
+        return len(numbers)
+    if aggregate == "sum":
+        return math.fsum(numbers)
+    if aggregate == "mean":
+        return math.fsum(numbers) / len(numbers)
+    return min(numbers) if aggregate == "min" else max(numbers)
+
+
+class _TableBuilder:
+    """Accumulate the rows of a table and encode them column by column when built."""
+
+    def __init__(self, spec: Tuple[Tuple[str, Optional[str]], ...]):
+        self._spec = spec
+        self._rows: List[tuple] = []
+        self.append = self._rows.append
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def build(self) -> ColumnTable:
+        values_by_column = zip(*self._rows) if self._rows else ((),) * len(self._spec)
+        columns = {}
+        for (name, typecode), values in zip(self._spec, values_by_column):
+            if typecode is None:
+                categories = list(dict.fromkeys(values))
+                index = {value: code for code, value in enumerate(categories)}
+                codes = array("i", map(index.__getitem__, values))
+                columns[name] = DictionaryColumn(memoryview(codes), categories)
+            elif typecode == "d":
+                columns[name] = memoryview(array("d", map(_float_or_nan, values)))
+            else:
+                columns[name] = memoryview(array(typecode, values))
+        return ColumnTable(columns)
+
+
+def _float_or_nan(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _enum_identifier(value: Any) -> Any:
+    """Return the identifier of an enum member as written in the metadata."""
+    if isinstance(value, TriggerEnum):
+        return value.val
+    if isinstance(value, TypeExternalInteraction):
+        return value.main_identifier
+    return value
+
+
+def _number(value: Any) -> Optional[float]:
+    """Convert a raw numeric option to float, None when missing or not numeric."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return None
+
+
+def _raw_criticality(value: Any) -> Optional[int]:
+    """Return the criticality level of a raw use case, MEDIUM when missing.
+
+    Numbers that are not a level give None, as in ``UseCaseInfo``.
+    """
+    if value is None:
+        return CriticalityEnum.MEDIUM.value
+    if isinstance(value, CriticalityEnum):
+        return value.value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _level(CriticalityEnum.get_from_int_val(value))
+    member = CriticalityEnum.__members__.get(value.upper()) if isinstance(value, str) else None
+    if member is None:
+        raise ValueError(f"Invalid criticality value: {value}")
+    return member.value
+
+
+def _level(criticality: Optional[CriticalityEnum]) -> Optional[int]:
+    """Return the level of a criticality, None when it is unknown."""
+    return criticality.value if criticality is not None else None
+
+
+def _operation(value: Any) -> Optional[str]:
+    """Flatten an operation, which may be a list of operations."""
+    return ",".join(value) if isinstance(value, list) else value
+
+
+class ColumnarCatalog:
+    """Columnar tables of the services, use cases, triggers and external interactions.
+
+    The tables are denormalized: every use case, trigger and external interaction
+    row repeats the service name and team, which dictionary encoding stores once.
+    Trigger and external interaction rows reference their use case by
+    ``use_case_row``, the row in the ``use_cases`` table.
+
+    Attributes
+    ----------
+    services : ColumnTable
+        Columns name, team, type, service_type and use_cases (count).
+    use_cases : ColumnTable
+        Columns service, team, keyname, name, type, actor, criticality (level, NaN
+        when the metadata gives a number that is not a level) and the number of
+        triggers and external interactions.
+    triggers : ColumnTable
+        Columns use_case_row, service, team, use_case, keyname, type, the HTTP
+        method, path, apigw, authenticator and timeout, the consumer queue and
+        max_retries, the schedule cronjob and the websocket route_key.
+    external_interactions : ColumnTable
+        Columns use_case_row, service, team, use_case, keyname, type_interaction,
+        type_interaction_standard and operation (comma separated when a list).
+    """
+
+    def __init__(self, services: ColumnTable, use_cases: ColumnTable, triggers: ColumnTable,
+                 external_interactions: ColumnTable):
+        self.services = services
+        self.use_cases = use_cases
+        self.triggers = triggers
+        self.external_interactions = external_interactions
+
+    def __repr__(self) -> str:
+        return (f"ColumnarCatalog(services={len(self.services)}, "
+                f"use_cases={len(self.use_cases)}, triggers={len(self.triggers)}, "
+                f"external_interactions={len(self.external_interactions)})")
+
+    @classmethod
+    def from_services(cls, services: Iterable[ServiceInfo]) -> "ColumnarCatalog":
+        """Build the tables from service objects, e.g. ``FleetCatalog.services.values()``.
+
+        Parameters
+        ----------
+        services : Iterable[ServiceInfo]
+            The services. Lazily loaded use cases are built.
+
+        Returns
+        -------
+        ColumnarCatalog
+            The catalog.
+        """
+        builder = _CatalogBuilder()
+        for service_info in services:
+            use_cases = service_info.use_cases
+            builder.add_service(service_info.name, service_info.team, service_info.type,
+                                service_info.service_type, len(use_cases))
+            for keyname, use_case in use_cases.items():
+                builder.add_use_case(
+                    keyname, use_case.name, use_case.type, use_case.actor,
+                    _level(use_case.criticality),
+                    [(trigger.keyname, _enum_identifier(trigger.type), trigger.options)
+                     for trigger in use_case.triggers],
+                    [(ei.keyname, ei.type_interaction,
+                      _enum_identifier(ei.type_interaction_standard), _operation(ei.operation))
+                     for ei in use_case.external_interactions])
+        return builder.build()
+
+    @classmethod
+    def from_dicts(cls, services: Iterable[Mapping[str, Any]]) -> "ColumnarCatalog":
+        """Build the tables straight from raw metadata dictionaries.
+
+        The dictionaries are not validated, so this is meant for metadata already
+        checked, e.g. by the ``analyze_metadata`` command, and skips building the
+        schema objects.
+
+        Parameters
+        ----------
+        services : Iterable[Mapping[str, Any]]
+            Raw service metadata, as read by ``read_metadata_file``.
+
+        Returns
+        -------
+        ColumnarCatalog
+            The catalog.
+
+        Raises
+        ------
+        ValueError
+            If a criticality value is invalid.
+        """
+        builder = _CatalogBuilder()
+        for data in services:
+            use_cases = data.get("use_cases") or {}
+            builder.add_service(data.get("name"), data.get("team"), data.get("type"),
+                                data.get("service_type"), len(use_cases))
+            for keyname, use_case in use_cases.items():
+                triggers = [(t.get("keyname"), t.get("type", "http"), t.get("options") or {})
+                            for t in use_case.get("triggers") or []]
+                interactions = use_case.get("external_interactions") or []
+                if isinstance(interactions, dict):
+                    interactions = [{"keyname": key, **value}
+                                    for key, value in interactions.items()]
+                builder.add_use_case(
+                    keyname, use_case.get("name"), use_case.get("type"), use_case.get("actor"),
+                    _raw_criticality(use_case.get("criticality")), triggers,
+                    [_raw_interaction(ei) for ei in interactions])
+        return builder.build()
+
+
+def _raw_interaction(data: Mapping[str, Any]) -> tuple:
+    """Return the external interaction columns of a raw interaction."""
+    type_interaction = data.get("type_interaction")
+    standard = (TypeExternalInteraction.from_str(type_interaction)
+                if isinstance(type_interaction, str) else None)
+    return (data.get("keyname"), type_interaction,
+            standard.main_identifier if standard is not None else None,
+            _operation(data.get("operation")))
+
+
+class _CatalogBuilder:
+    """Accumulate the rows of the four tables of a ``ColumnarCatalog``."""
+
+    def __init__(self):
+        self.services = _TableBuilder(_SERVICE_COLUMNS)
+        self.use_cases = _TableBuilder(_USE_CASE_COLUMNS)
+        self.triggers = _TableBuilder(_TRIGGER_COLUMNS)
+        self.external_interactions = _TableBuilder(_EXTERNAL_INTERACTION_COLUMNS)
+        self._service = None
+        self._team = None
+
+    def add_service(self, name, team, entity_type, service_type, n_use_cases) -> None:
+        self._service, self._team = name, team
+        self.services.append((name, team, entity_type, service_type, n_use_cases))
+
+    def add_use_case(self, keyname, name, use_case_type, actor, criticality,
+                     triggers, interactions) -> None:
+        row = len(self.use_cases)
+        self.use_cases.append((self._service, self._team, keyname, name, use_case_type, actor,
+                               criticality, len(triggers), len(interactions)))
+        for trigger_keyname, trigger_type, options in triggers:
+            if isinstance(options, dict):
+                values = [options.get(option) for option in _TRIGGER_OPTIONS]
+                if trigger_type == "http":
+                    values[0] = str(values[0] or "GET").upper()
+                elif trigger_type == "websocket":
+                    # written routeKey in the metadata, as read by TriggerWebsocket
+                    values[-1] = options.get("routeKey") or options.get("route_key")
+            else:
+                values = [getattr(options, option, None) for option in _TRIGGER_OPTIONS]
+            method, path, apigw, authenticator, timeout, queue, max_retries, cronjob, \
+                route_key = values
+            self.triggers.append((row, self._service, self._team, keyname, trigger_keyname,
+                                  trigger_type, method, path, apigw, authenticator,
+                                  _number(timeout), queue, _number(max_retries), cronjob,
+                                  route_key))
+        for interaction in interactions:
+            self.external_interactions.append((row, self._service, self._team, keyname,
+                                               *interaction))
+
+    def build(self) -> ColumnarCatalog:
+        return ColumnarCatalog(self.services.build(), self.use_cases.build(),
+                               self.triggers.build(), self.external_interactions.build())
@@ -4,17 +4,20 @@ Module for analyzing metadata files and generating analysis reports.
 This module provides functionality to read metadata files in various formats
 (e.g., YAML, JSON) and analyze their contents to produce a `MetadataAnalysisReport`.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 
 import sys
 
 from .metadata_analysis_report import MetadataAnalysisReport
-from ...schema.read_metadata import read_metadata_file
+from ...schema.load_limits import LoadLimits
+from ...schema.ndjson_metadata import NDJSON_EXTENSIONS, analyze_ndjson_metadata
+from ...schema.read_metadata import read_metadata_file, iter_metadata_documents
 from ...schema.service_info import ServiceInfo
 
 
-def generate_report(path: str, *, format_file: str = "yaml",
-                    encoding: str = "utf-8") -> MetadataAnalysisReport:
+def generate_report(path: str, *, format_file: str = "yaml", encoding: str = "utf-8",
+                    yaml_loader: str = "auto", limits: Optional[LoadLimits] = None,
+                    resolve_refs: bool = False) -> MetadataAnalysisReport:
     """Generate a metadata analysis report from a given file.
 
     Parameters
@@ -22,18 +25,58 @@ def generate_report(path: str, *, format_file: str = "yaml",
     path : str
         Path to the metadata file to analyze.
     format_file : str, optional
-        Format of the metadata file (default is "yaml").
+        Format of the metadata file (default is "yaml"). Files with the ``.ndjson``
+        extension, or with format "ndjson", are analyzed line by line.
     encoding : str, optional
         Encoding to use when reading the file (default is "utf-8").
+    yaml_loader : str, optional
+        YAML loader selection: "auto", "c" or "python" (default is "auto").
+    limits : Optional[LoadLimits], optional
+        Resource limits for untrusted files (default is None, no limits).
+    resolve_refs : bool, optional
+        Whether to resolve ``$ref`` references to other files (default is False).
 
     Returns
     -------
     MetadataAnalysisReport
         The generated analysis report containing validation results.
+
+    Raises
+    ------
+    MetadataLimitExceeded
+        If limits are given and the file exceeds any of them.
     """
-    data = read_metadata_file(path, format_file=format_file, encoding=encoding)
+    if format_file == "ndjson" or path.lower().endswith(NDJSON_EXTENSIONS):
+        return analyze_ndjson_metadata(path, encoding, limits=limits)
+    data = read_metadata_file(path, format_file=format_file, encoding=encoding,
+                              yaml_loader=yaml_loader, limits=limits, resolve_refs=resolve_refs)
     return ServiceInfo.analyze(data)
 
+def generate_reports(path: str, *, encoding: str = "utf-8",
+                     yaml_loader: str = "auto") -> Iterator[MetadataAnalysisReport]:
+    """Generate one metadata analysis report per document of a multi-document YAML file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the metadata file to analyze.
+    encoding : str, optional
+        Encoding to use when reading the file (default is "utf-8").
+    yaml_loader : str, optional
+        YAML loader selection: "auto", "c" or "python" (default is "auto").
+
+    Yields
+    ------
+    MetadataAnalysisReport
+        The analysis report of each document, in file order.
+    """
+    for index, data in enumerate(iter_metadata_documents(path, encoding, yaml_loader)):
+        if not isinstance(data, dict):
+            yield MetadataAnalysisReport(
+                1, 0, [f"Document {index} of the metadata must be a dictionary."], [], {})
+            continue
+        yield ServiceInfo.analyze(data)
+
 def format_number_to_str(number: float) -> str:
     """Format a float number to a string with minimal decimal places.
 
@@ -100,7 +143,7 @@ def print_and_generate_summary(metadata_analysis_report: MetadataAnalysisReport)
 
 def analyze_command(
         path: str, *, format_file: str = "yaml", encoding: str = "utf-8",
-        min_warnings: Optional[int] = None) -> MetadataAnalysisReport:
+        min_warnings: Optional[int] = None, yaml_loader: str = "auto") -> MetadataAnalysisReport:
     """Analyze a metadata file and print its contents.
 
     Parameters
@@ -113,8 +156,11 @@ def analyze_command(
         The encoding of the metadata file.
     min_warnings : Optional[int], default=None
         The minimum index of warnings to trigger a warning message.
+    yaml_loader : str, default="auto"
+        YAML loader selection ("auto", "c" or "python").
     """
-    metadata_analysis_report = generate_report(path, format_file=format_file, encoding=encoding)
+    metadata_analysis_report = generate_report(path, format_file=format_file, encoding=encoding,
+                                               yaml_loader=yaml_loader)
     summary = print_and_generate_summary(metadata_analysis_report)
     if summary["n_errors"] > 0:
         sys.exit(1)
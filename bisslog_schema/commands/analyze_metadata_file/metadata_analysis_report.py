@@ -97,3 +97,21 @@ class MetadataAnalysisReport:
             for sub_report in sub_reports:
                 n += sub_report.warning_errors_count()
         return n
+
+    def fold(self, report: "MetadataAnalysisReport") -> None:
+        """Fold the counts and messages of a report, and of its sub-reports, into this one.
+
+        Unlike adding it to ``sub_reports``, the folded report is not kept, which bounds
+        memory when aggregating a stream of reports.
+
+        Parameters
+        ----------
+        report : MetadataAnalysisReport
+            The report to fold."""
+        self.critical_validation_count += report.critical_validation_count
+        self.warning_validation_count += report.warning_validation_count
+        self.errors.extend(report.errors)
+        self.warnings.extend(report.warnings)
+        for sub_reports in report.sub_reports.values():
+            for sub_report in sub_reports:
+                self.fold(sub_report)
@@ -0,0 +1,71 @@
+"""
+Module for compiling metadata files into memory-mapped catalogs or Python modules.
+
+This module provides the implementation of the ``compile`` CLI command, which reads and
+validates a metadata file and writes it as a ``CompiledCatalog`` file or as an
+importable Python module.
+"""
+import os
+import re
+from typing import Optional
+
+from ...schema.compiled_catalog import compile_catalog
+from ...schema.python_artifact import write_python_module
+from ...schema.read_metadata import read_service_metadata
+
+CATALOG_EXTENSION = ".bscat"
+COMPILE_TARGETS = ("catalog", "python")
+
+
+def _default_output(path: str, target: str) -> str:
+    """Return the default output path of a compiled metadata path."""
+    base = os.path.splitext(path.rstrip(os.sep))[0]
+    if target == "catalog":
+        return base + CATALOG_EXTENSION
+    directory, name = os.path.split(base)
+    name = re.sub(r"\W", "_", name)
+    return os.path.join(directory, ("_" if name[:1].isdigit() else "") + name + ".py")
+
+
+def compile_command(path: str, output: Optional[str] = None, *, encoding: str = "utf-8",
+                    yaml_loader: str = "auto", target: str = "catalog") -> str:
+    """Compile a metadata file into a catalog file or a Python module.
+
+    Parameters
+    ----------
+    path : str
+        Path of the metadata file or ``metadata.d/`` directory.
+    output : Optional[str], default=None
+        Path of the file to write. Defaults to the metadata path with the ``.bscat``
+        extension, or with the ``.py`` extension and a valid module name.
+    encoding : str, default="utf-8"
+        The encoding of the metadata file.
+    yaml_loader : str, default="auto"
+        YAML loader selection ("auto", "c" or "python").
+    target : str, default="catalog"
+        Artifact to write: "catalog" for a ``CompiledCatalog`` file or "python" for a
+        module building the ``ServiceInfo``.
+
+    Returns
+    -------
+    str
+        Path of the written file.
+
+    Raises
+    ------
+    ValueError
+        If the target is not supported.
+    """
+    if target not in COMPILE_TARGETS:
+        raise ValueError(f"Unsupported compile target '{target}', "
+                         f"expected one of {COMPILE_TARGETS}")
+    service_info = read_service_metadata(path, encoding, yaml_loader=yaml_loader)
+    if output is None:
+        output = _default_output(path, target)
+    if target == "catalog":
+        compile_catalog(service_info, output)
+    else:
+        write_python_module(service_info, path, output)
+    print(f"Compiled {len(service_info.use_cases)} use cases of '{service_info.name}' "
+          f"into {output}")
+    return output
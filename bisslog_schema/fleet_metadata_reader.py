@@ -0,0 +1,230 @@
+"""
+Module for loading the metadata of a whole fleet of services.
+
+It discovers the metadata files of many services (e.g. one per service in a
+monorepo), parses and validates them in a process pool and streams the results back
+as they finish. Per-file failures are collected instead of aborting the run, and the
+loaded services are gathered in a catalog keyed by service name.
+"""
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from .schema.intern_table import InternTable
+from .schema.read_metadata import read_service_metadata
+from .schema.service_info import ServiceInfo
+
+METADATA_FILE_NAMES = ("metadata.yml", "metadata.yaml", "metadata.json")
+METADATA_DIR_NAME = "metadata.d"
+
+
+@dataclass
+class FleetLoadResult:
+    """Result of loading a single metadata file of the fleet.
+
+    Attributes
+    ----------
+    path : str
+        Path of the metadata file or directory.
+    service_info : Optional[ServiceInfo]
+        The loaded service, or None if the load failed.
+    error : Optional[str]
+        Description of the failure, if any.
+    elapsed : float
+        Seconds spent parsing and validating the file.
+    """
+    path: str
+    service_info: Optional[ServiceInfo] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+
+@dataclass
+class FleetCatalog:
+    """Catalog of the services of a fleet keyed by service name.
+
+    Attributes
+    ----------
+    services : Dict[str, ServiceInfo]
+        Loaded services keyed by service name.
+    paths : Dict[str, str]
+        Path of the metadata of each service, keyed by service name.
+    failures : Dict[str, str]
+        Error description of each file that could not be loaded, keyed by path.
+    timings : Dict[str, float]
+        Seconds spent on each file, keyed by path.
+    """
+    services: Dict[str, ServiceInfo] = field(default_factory=dict)
+    paths: Dict[str, str] = field(default_factory=dict)
+    failures: Dict[str, str] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    def __getitem__(self, service_name: str) -> ServiceInfo:
+        return self.services[service_name]
+
+    def __contains__(self, service_name: object) -> bool:
+        return service_name in self.services
+
+    def __len__(self) -> int:
+        return len(self.services)
+
+    def add(self, result: FleetLoadResult) -> None:
+        """Add a load result, recording a failure for duplicated service names.
+
+        When two files declare the same service name, the one with the smallest path
+        is kept and the other is recorded as a failure, whatever the order in which
+        the results are added.
+
+        Parameters
+        ----------
+        result : FleetLoadResult
+            The result of loading one metadata file.
+        """
+        self.timings[result.path] = result.elapsed
+        if result.service_info is None:
+            self.failures[result.path] = result.error
+            return
+        name = result.service_info.name
+        kept_path = self.paths.get(name)
+        if kept_path is not None:
+            kept_path, duplicate_path = sorted((kept_path, result.path))
+            self.failures[duplicate_path] = (f"ValueError: Service name '{name}' is already "
+                                             f"defined in {kept_path}")
+            if kept_path != result.path:
+                return
+        self.services[name] = result.service_info
+        self.paths[name] = result.path
+
+    def stats(self) -> Dict[str, float]:
+        """Return aggregated timing statistics of the load.
+
+        Returns
+        -------
+        Dict[str, float]
+            Number of files, loaded services and failures, plus total, mean and
+            max seconds per file.
+        """
+        timings = list(self.timings.values())
+        return {
+            "files": len(timings),
+            "services": len(self.services),
+            "failures": len(self.failures),
+            "total_seconds": sum(timings),
+            "mean_seconds": sum(timings) / len(timings) if timings else 0.0,
+            "max_seconds": max(timings, default=0.0),
+        }
+
+
+def discover_metadata_files(root_or_glob: str) -> List[str]:
+    """Discover metadata files from a root directory or a glob pattern.
+
+    When given a directory, it is walked recursively looking for ``metadata.yml``,
+    ``metadata.yaml``, ``metadata.json`` files and ``metadata.d/`` directories,
+    skipping hidden directories. Otherwise the argument is expanded as a recursive glob.
+
+    Parameters
+    ----------
+    root_or_glob : str
+        Root directory of the fleet or glob pattern (e.g. ``services/*/metadata.yml``).
+
+    Returns
+    -------
+    List[str]
+        Sorted paths of the metadata files and directories found.
+    """
+    if not os.path.isdir(root_or_glob):
+        return sorted(glob.glob(root_or_glob, recursive=True))
+
+    found = []
+    for root, dirs, files in os.walk(root_or_glob):
+        if METADATA_DIR_NAME in dirs:
+            found.append(os.path.join(root, METADATA_DIR_NAME))
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d != METADATA_DIR_NAME]
+        found.extend(os.path.join(root, name) for name in files if name in METADATA_FILE_NAMES)
+    return sorted(found)
+
+
+def _load_metadata(path: str, encoding: str) -> FleetLoadResult:
+    """Load one metadata file, capturing the failure instead of raising it."""
+    start = time.perf_counter()
+    try:
+        service_info = read_service_metadata(path, encoding, executor="thread")
+    except Exception as e:  # pylint: disable=broad-except
+        return FleetLoadResult(path, error=f"{type(e).__name__}: {e}",
+                               elapsed=time.perf_counter() - start)
+    return FleetLoadResult(path, service_info, elapsed=time.perf_counter() - start)
+
+
+def iter_fleet_metadata(root_or_glob: str, workers: Optional[int] = None, *,
+                        encoding: str = "utf-8", executor: str = "process",
+                        intern: Optional[InternTable] = None) -> Iterator[FleetLoadResult]:
+    """Load the metadata of a fleet, yielding each result as soon as it finishes.
+
+    Parameters
+    ----------
+    root_or_glob : str
+        Root directory of the fleet or glob pattern of the metadata files.
+    workers : Optional[int], default=None
+        Number of workers; defaults to the number of cores.
+    encoding : str, default="utf-8"
+        The file encoding to use when reading the files.
+    executor : str, default="process"
+        "process" to use a process pool or "thread" for a thread pool.
+    intern : Optional[InternTable], default=None
+        Table used to deduplicate the values repeated across the services. The
+        services are interned as they arrive, in the calling thread.
+
+    Yields
+    ------
+    FleetLoadResult
+        The result of each file, in completion order.
+    """
+    if executor not in ("process", "thread"):
+        raise ValueError(f"Unknown executor '{executor}'. Must be one of: ('process', 'thread').")
+    paths = discover_metadata_files(root_or_glob)
+    if not paths:
+        return
+    pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    with pool_cls(max_workers=workers) as pool:
+        futures = [pool.submit(_load_metadata, path, encoding) for path in paths]
+        for future in as_completed(futures):
+            result = future.result()
+            if intern is not None and result.service_info is not None:
+                intern.intern_service(result.service_info)
+            yield result
+
+
+def read_fleet_metadata(root_or_glob: str, workers: Optional[int] = None, *,
+                        encoding: str = "utf-8", executor: str = "process",
+                        intern: Optional[InternTable] = None) -> FleetCatalog:
+    """Load the metadata of a fleet into a catalog keyed by service name.
+
+    Parameters
+    ----------
+    root_or_glob : str
+        Root directory of the fleet or glob pattern of the metadata files.
+    workers : Optional[int], default=None
+        Number of workers; defaults to the number of cores.
+    encoding : str, default="utf-8"
+        The file encoding to use when reading the files.
+    executor : str, default="process"
+        "process" to use a process pool or "thread" for a thread pool.
+    intern : Optional[InternTable], default=None
+        Table used to deduplicate the values repeated across the services.
+
+    Returns
+    -------
+    FleetCatalog
+        The loaded services, the failures and per-file timings, added in path order so
+        the catalog does not depend on which file finished first.
+    """
+    results = sorted(iter_fleet_metadata(root_or_glob, workers, encoding=encoding,
+                                         executor=executor, intern=intern),
+                     key=lambda result: result.path)
+    catalog = FleetCatalog()
+    for result in results:
+        catalog.add(result)
+    return catalog
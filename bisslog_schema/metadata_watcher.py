@@ -0,0 +1,191 @@
+"""
+Module providing a hot-reload watcher for service metadata.
+
+The watcher polls the modification time and size of the metadata file (or of every
+file of a ``metadata.d/`` directory) without external dependencies. On change, it
+re-reads the raw metadata, diffs it against the previous version per use case keyname
+and only rebuilds the use cases that changed. Unchanged ``UseCaseInfo`` objects keep
+their identity, so caches keyed on them stay warm. The new ``ServiceInfo`` is swapped
+atomically and published to the subscribers.
+"""
+import copy
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from .schema.metadata_directory import stat_signature
+from .schema.read_metadata import _find_path, read_metadata_file
+from .schema.service_info import ServiceInfo
+from .schema.use_case_info import UseCaseInfo
+
+Subscriber = Callable[[ServiceInfo], None]
+
+
+class MetadataWatcher:
+    """Watch a metadata file and publish a new ServiceInfo whenever it changes.
+
+    Parameters
+    ----------
+    path : Optional[str], default=None
+        The metadata file or ``metadata.d/`` directory. If None, searches default paths.
+    encoding : str, default="utf-8"
+        The file encoding to use when reading the file.
+    interval : float, default=1.0
+        Seconds between polls when running in the background with ``start``.
+    on_error : Optional[Callable[[Exception], None]], default=None
+        Called with the exception when a reload fails in the background thread.
+        The previous ServiceInfo is kept published.
+    **read_options
+        Extra keyword options for ``read_metadata_file`` (yaml_loader, executor, ...).
+
+    Attributes
+    ----------
+    last_changes : Dict[str, List[str]]
+        Keynames of the use cases ``added``, ``removed`` and ``changed`` by the last reload.
+    """
+
+    def __init__(self, path: Optional[str] = None, encoding: str = "utf-8", *,
+                 interval: float = 1.0,
+                 on_error: Optional[Callable[[Exception], None]] = None, **read_options):
+        self._path = _find_path(path)
+        self._encoding = encoding
+        self._interval = interval
+        self._on_error = on_error
+        self._read_options = read_options
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._subscribers: List[Subscriber] = []
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._raw_use_cases: Dict[str, Any] = {}
+        self._raw_header: Dict[str, Any] = {}
+        self._service_info: Optional[ServiceInfo] = None
+        self.last_changes: Dict[str, List[str]] = {"added": [], "removed": [], "changed": []}
+        self._signature = stat_signature(self._path)
+        self._service_info = self._reload()
+
+    @property
+    def path(self) -> str:
+        """Path of the watched metadata."""
+        return self._path
+
+    @property
+    def service_info(self) -> ServiceInfo:
+        """The currently published ServiceInfo."""
+        with self._lock:
+            return self._service_info
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """Register a callback receiving every newly published ServiceInfo.
+
+        Parameters
+        ----------
+        callback : Callable[[ServiceInfo], None]
+            Function called after each successful reload.
+
+        Returns
+        -------
+        Callable[[], None]
+            Function that removes the subscription.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+
+    def poll(self) -> bool:
+        """Check the watched files once and reload them if they changed.
+
+        Returns
+        -------
+        bool
+            True if a new ServiceInfo was published.
+
+        Raises
+        ------
+        ValueError
+            If the changed metadata is invalid. The previous ServiceInfo stays published
+            and the same version of the files is not retried.
+        """
+        with self._reload_lock:
+            signature = stat_signature(self._path)
+            if signature == self._signature:
+                return False
+            self._signature = signature
+            service_info = self._reload()
+            with self._lock:
+                self._service_info = service_info
+                subscribers = list(self._subscribers)
+        for callback in subscribers:
+            callback(service_info)
+        return True
+
+    def _reload(self) -> ServiceInfo:
+        """Read the metadata and rebuild only the use cases that changed."""
+        data = read_metadata_file(self._path, self._encoding, **self._read_options)
+        if not isinstance(data, dict):
+            raise ValueError("The metadata must be a dictionary.")
+        raw_use_cases = ServiceInfo._validate_use_cases_field(data.get("use_cases", {})) or {}
+        header = {key: value for key, value in data.items() if key != "use_cases"}
+        previous = self._service_info
+        if previous is not None and header == self._raw_header:
+            service_info = copy.copy(previous)
+        else:
+            service_info = ServiceInfo.from_dict(header)
+
+        changes = {"added": [], "removed": [], "changed": []}
+        use_cases: Dict[str, UseCaseInfo] = {}
+        for keyname, raw in raw_use_cases.items():
+            if keyname in self._raw_use_cases and self._raw_use_cases[keyname] == raw:
+                use_cases[keyname] = previous.use_cases[keyname]
+                continue
+            changes["changed" if keyname in self._raw_use_cases else "added"].append(keyname)
+            use_cases[keyname] = ServiceInfo._build_use_case(keyname, raw)
+        changes["removed"] = [keyname for keyname in self._raw_use_cases
+                              if keyname not in raw_use_cases]
+
+        service_info.use_cases = use_cases
+        self._raw_header = header
+        self._raw_use_cases = raw_use_cases
+        self.last_changes = changes
+        return service_info
+
+    def _run(self) -> None:
+        """Poll the watched files until stopped."""
+        while not self._stop_event.wait(self._interval):
+            try:
+                self.poll()
+            except Exception as e:  # pylint: disable=broad-except
+                if self._on_error is not None:
+                    self._on_error(e)
+
+    def start(self) -> "MetadataWatcher":
+        """Start polling in a background daemon thread.
+
+        Returns
+        -------
+        MetadataWatcher
+            The same watcher.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="metadata-watcher",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the background thread and wait for it to finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "MetadataWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -1,6 +1,12 @@
 """Schema validator module"""
 
-from .read_metadata import read_service_metadata
+from .read_metadata import read_service_metadata, iter_service_metadata
+from .metadata_overlay import read_service_overlays, apply_overlay
+from .metadata_cache import MetadataDiskCache
+from .service_metadata_cache import ServiceMetadataCache, shared_metadata_cache
+from .load_limits import LoadLimits, MetadataLimitExceeded
+from .intern_table import InternTable, interning, shared_intern_table
+from .frozen import FrozenDict, freeze
 from .triggers.trigger_http import TriggerHttp
 from .triggers.trigger_consumer import TriggerConsumer
 from .triggers.trigger_websocket import TriggerWebsocket
@@ -9,8 +15,14 @@ from .triggers.trigger_info import TriggerInfo
 from .enums.trigger_type import TriggerEnum
 from .service_info import ServiceInfo
 from .use_case_info import UseCaseInfo
+from .lazy_use_cases import LazyUseCases
 from .external_interaction import ExternalInteraction
 
-__all__ = ["read_service_metadata", "TriggerHttp", "TriggerConsumer", "TriggerWebsocket",
+__all__ = ["read_service_metadata", "iter_service_metadata", "read_service_overlays",
+           "apply_overlay",
+           "TriggerHttp", "TriggerConsumer", "TriggerWebsocket",
            "TriggerSchedule", "TriggerInfo", "TriggerEnum", "ServiceInfo", "UseCaseInfo",
-           "ExternalInteraction"]
+           "ExternalInteraction", "MetadataDiskCache", "LazyUseCases",
+           "LoadLimits", "MetadataLimitExceeded", "ServiceMetadataCache",
+           "shared_metadata_cache", "InternTable", "interning", "shared_intern_table",
+           "FrozenDict", "freeze"]
@@ -6,13 +6,70 @@ for validating various types of fields, such as strings, booleans, and integers.
 These methods ensure that the fields meet the required constraints and provide
 consistent error handling across schema classes.
 """
+import json
 from abc import ABCMeta
-from typing import Optional
+from collections.abc import Mapping
+from typing import Any, Dict, Optional
+
+from .frozen import freeze
+from .serializer import to_dict
+
+# Raw metadata may be any read-only mapping; ``dict`` comes first because the exact type
+# check is much cheaper than the ``Mapping`` ABC one
+MAPPING_TYPES = (dict, Mapping)
 
 
 class BaseObjSchema(metaclass=ABCMeta):
     """Base class for all schema classes."""
 
+    __slots__ = ("__weakref__",)
+
+    def freeze(self) -> "BaseObjSchema":
+        """
+        Return a deeply immutable snapshot of the object.
+
+        The snapshot is an instance of a frozen subclass of the object's class. Nested
+        objects are frozen, lists become tuples and mappings become ``FrozenDict``. It is
+        hashable, with the hash computed once and cached, and can be shared across threads
+        without copies. Lazy use cases are built.
+
+        Returns
+        -------
+        BaseObjSchema
+            The frozen snapshot, or the object itself if it is already frozen.
+        """
+        return freeze(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the object into its canonical metadata dictionary.
+
+        Enums are written as their string values and ``None`` fields are omitted, so
+        ``from_dict`` of the same class rebuilds an equal object.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A new dictionary with the metadata of the object.
+        """
+        return to_dict(self)
+
+    def to_json(self, **dumps_kwargs: Any) -> str:
+        """
+        Encode the object as a JSON document with the shape of ``to_dict``.
+
+        Parameters
+        ----------
+        **dumps_kwargs
+            Options for ``json.dumps``, such as ``indent``.
+
+        Returns
+        -------
+        str
+            The JSON document.
+        """
+        return json.dumps(to_dict(self), **dumps_kwargs)
+
     @staticmethod
     def _validate_optional_str_field(field_name: str, value: Optional[str]) -> Optional[str]:
         """
@@ -0,0 +1,318 @@
+"""
+Module providing a compact binary codec for the schema objects.
+
+Every distinct string is written once in a string table and referenced by index, enum
+members are written as two small integers, and schema objects as a class number followed
+by their field values, without field names. It is a size codec: payloads are about 40%
+smaller than with pickle protocol 5, which pays off when metadata is stored or sent over
+a slow link, but ``decode`` is pure Python and loads more slowly than ``pickle.loads``.
+To pass metadata between local worker processes, plain pickle is faster. The positional
+layout only exists in this format; pickling the schema objects is unchanged.
+
+Layout::
+
+    magic "BSBC", format version (1 byte)
+    string table   count, then the length and UTF-8 bytes of each string
+    body           one tagged value
+
+Integers (lengths, counts, indexes and int values, zigzag encoded) are unsigned LEB128
+varints. Containers are written as a tag, their length and their items.
+
+Notes
+-----
+Class and enum numbers follow the order of the registries below, so both ends must run
+the same version of the library. Values of unknown types are embedded with ``pickle``,
+so payloads must only be decoded from trusted sources.
+"""
+import pickle
+import struct
+from collections.abc import Mapping
+from dataclasses import fields
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
+
+from .frozen import FrozenDict, FrozenSchema, frozen_class
+
+CODEC_MAGIC = b"BSBC"
+CODEC_VERSION = 1
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _TUPLE, _DICT, _FROZEN_DICT, _FROZENSET, \
+    _ENUM, _OBJECT, _FROZEN_OBJECT, _PICKLE = range(15)
+
+_DOUBLE = struct.Struct("<d")
+
+
+@lru_cache(maxsize=None)
+def _registry() -> Tuple[Tuple[type, ...], Tuple[Tuple[Enum, ...], ...],
+                         Dict[type, Tuple[int, Tuple[str, ...]]], Dict[Enum, Tuple[int, int]]]:
+    """Number the schema classes and enum members, on first use.
+
+    Returns the classes, the members of each enum, the number and field names of each
+    class and the enum number and index of each member.
+    """
+    # pylint: disable=import-outside-toplevel
+    from .entity_info import EntityInfo
+    from .enums.criticality import CriticalityEnum
+    from .enums.event_delivery_semantic import EventDeliverySemantic
+    from .enums.trigger_type import TriggerEnum
+    from .enums.type_external_interaction import TypeExternalInteraction
+    from .external_interaction import ExternalInteraction
+    from .service_info import ServiceInfo
+    from .triggers.trigger_consumer import TriggerConsumer
+    from .triggers.trigger_http import TriggerHttp
+    from .triggers.trigger_info import TriggerInfo
+    from .triggers.trigger_schedule import TriggerSchedule
+    from .triggers.trigger_websocket import TriggerWebsocket
+    from .use_case_info import UseCaseInfo
+
+    classes = (ServiceInfo, UseCaseInfo, TriggerInfo, TriggerHttp, TriggerConsumer,
+               TriggerSchedule, TriggerWebsocket, ExternalInteraction, EntityInfo)
+    enums = tuple(tuple(enum) for enum in (CriticalityEnum, TriggerEnum, EventDeliverySemantic,
+                                           TypeExternalInteraction))
+    class_numbers = {cls: (number, tuple(f.name for f in fields(cls)))
+                     for number, cls in enumerate(classes)}
+    member_numbers = {member: (number, index) for number, members in enumerate(enums)
+                      for index, member in enumerate(members)}
+    return classes, enums, class_numbers, member_numbers
+
+
+def is_encodable(obj: Any) -> bool:
+    """Check whether the codec writes an object natively rather than with pickle.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to check.
+
+    Returns
+    -------
+    bool
+        True for the schema classes and their frozen variants.
+    """
+    cls = obj.__class__
+    if isinstance(obj, FrozenSchema):
+        cls = cls._thawed_class  # pylint: disable=protected-access
+    return cls in _registry()[2]
+
+
+def _append_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _make_encoder(out: bytearray, strings: Dict[str, int]) -> Callable[[Any], None]:
+    """Return the function writing one value, and its nested values, to ``out``."""
+    _, _, class_numbers, member_numbers = _registry()
+    append = out.append
+
+    def write_varint(value: int) -> None:
+        while value > 0x7F:
+            append((value & 0x7F) | 0x80)
+            value >>= 7
+        append(value)
+
+    def write(value: Any) -> None:
+        cls = value.__class__
+        if cls is str:
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            append(_STR)
+            write_varint(index)
+        elif value is None:
+            append(_NONE)
+        elif cls is bool:
+            append(_TRUE if value else _FALSE)
+        elif cls is int:
+            append(_INT)
+            write_varint(value << 1 if value >= 0 else ((-value) << 1) - 1)
+        elif cls in class_numbers:
+            number, names = class_numbers[cls]
+            append(_OBJECT)
+            append(number)
+            for name in names:
+                write(getattr(value, name))
+        elif isinstance(value, Enum) and value in member_numbers:
+            number, index = member_numbers[value]
+            append(_ENUM)
+            append(number)
+            write_varint(index)
+        elif cls is list or cls is tuple:
+            append(_LIST if cls is list else _TUPLE)
+            write_varint(len(value))
+            for item in value:
+                write(item)
+        elif isinstance(value, (dict, Mapping)):
+            append(_FROZEN_DICT if cls is FrozenDict else _DICT)
+            write_varint(len(value))
+            for key, item in value.items():
+                write(key)
+                write(item)
+        elif cls is float:
+            append(_FLOAT)
+            out.extend(_DOUBLE.pack(value))
+        elif cls is frozenset:
+            append(_FROZENSET)
+            write_varint(len(value))
+            for item in value:
+                write(item)
+        elif isinstance(value, FrozenSchema) and value._thawed_class in class_numbers:
+            # pylint: disable=protected-access
+            number, names = class_numbers[value._thawed_class]
+            append(_FROZEN_OBJECT)
+            append(number)
+            for name in names:
+                write(getattr(value, name))
+        else:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            append(_PICKLE)
+            write_varint(len(data))
+            out.extend(data)
+
+    return write
+
+
+def encode(obj: Any) -> bytes:
+    """Encode a schema object, or any nesting of them, into the compact binary format.
+
+    Parameters
+    ----------
+    obj : Any
+        The value to encode. Lazy use cases are built and written as a dictionary.
+
+    Returns
+    -------
+    bytes
+        The encoded payload.
+    """
+    body = bytearray()
+    strings: Dict[str, int] = {}
+    _make_encoder(body, strings)(obj)
+
+    out = bytearray(CODEC_MAGIC)
+    out.append(CODEC_VERSION)
+    _append_varint(out, len(strings))
+    for string in strings:
+        encoded = string.encode("utf-8", "surrogatepass")
+        _append_varint(out, len(encoded))
+        out.extend(encoded)
+    out.extend(body)
+    return bytes(out)
+
+
+def decode(data: bytes) -> Any:
+    """Decode a payload written by ``encode``.
+
+    Parameters
+    ----------
+    data : bytes
+        The encoded payload.
+
+    Returns
+    -------
+    Any
+        The decoded value. Frozen snapshots are decoded as frozen snapshots.
+
+    Raises
+    ------
+    ValueError
+        If the payload is not in this format, has another version or is truncated.
+    """
+    data = bytes(data)
+    if data[:len(CODEC_MAGIC)] != CODEC_MAGIC:
+        raise ValueError("Not a bisslog-schema binary payload")
+    if len(data) <= len(CODEC_MAGIC) or data[len(CODEC_MAGIC)] != CODEC_VERSION:
+        raise ValueError(f"Unsupported binary payload version, expected {CODEC_VERSION}")
+    classes, enums, class_numbers, _ = _registry()
+    # every field of the schema classes is an __init__ parameter, in declaration order
+    layouts = [(cls, range(len(class_numbers[cls][1]))) for cls in classes]
+    set_field = object.__setattr__
+    pos = len(CODEC_MAGIC) + 1
+
+    def read_varint() -> int:
+        nonlocal pos
+        byte = data[pos]
+        pos += 1
+        if byte < 0x80:
+            return byte
+        result, shift = byte & 0x7F, 7
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read_frozen_object() -> Any:
+        nonlocal pos
+        cls = frozen_class(classes[data[pos]])
+        pos += 1
+        obj = cls.__new__(cls)
+        for name in cls._field_names:  # pylint: disable=protected-access
+            set_field(obj, name, read())
+        set_field(obj, "_hash", None)
+        return obj
+
+    def read() -> Any:
+        nonlocal pos
+        tag = data[pos]
+        pos += 1
+        if tag == _STR:
+            index = data[pos]
+            if index < 0x80:
+                pos += 1
+                return strings[index]
+            return strings[read_varint()]
+        if tag == _OBJECT:
+            cls, field_range = layouts[data[pos]]
+            pos += 1
+            return cls(*[read() for _ in field_range])
+        if tag == _NONE:
+            return None
+        if tag == _ENUM:
+            members = enums[data[pos]]
+            pos += 1
+            return members[read_varint()]
+        if tag == _LIST:
+            return [read() for _ in range(read_varint())]
+        if tag == _DICT:
+            return {read(): read() for _ in range(read_varint())}
+        if tag == _TRUE or tag == _FALSE:
+            return tag == _TRUE
+        if tag == _INT:
+            value = read_varint()
+            return value >> 1 if not value & 1 else -((value + 1) >> 1)
+        if tag == _TUPLE:
+            return tuple([read() for _ in range(read_varint())])
+        if tag == _FROZEN_OBJECT:
+            return read_frozen_object()
+        if tag == _FROZEN_DICT:
+            return FrozenDict({read(): read() for _ in range(read_varint())})
+        if tag == _FLOAT:
+            pos += _DOUBLE.size
+            return _DOUBLE.unpack_from(data, pos - _DOUBLE.size)[0]
+        if tag == _FROZENSET:
+            return frozenset([read() for _ in range(read_varint())])
+        if tag == _PICKLE:
+            size = read_varint()
+            pos += size
+            return pickle.loads(data[pos - size:pos])
+        raise ValueError(f"Corrupted binary payload, unknown tag {tag} at {pos - 1}")
+
+    try:
+        strings: List[str] = []
+        for _ in range(read_varint()):
+            size = read_varint()
+            strings.append(data[pos:pos + size].decode("utf-8", "surrogatepass"))
+            pos += size
+        value = read()
+    except (IndexError, struct.error) as e:
+        raise ValueError("Truncated binary payload") from e
+    if pos != len(data):
+        raise ValueError("Unexpected data after the binary payload")
+    return value
+
@@ -0,0 +1,303 @@
+"""
+Module providing a compiled, memory-mapped catalog format for service metadata.
+
+A catalog file is written once from a ``ServiceInfo`` and opened with ``mmap``, so a
+single ``UseCaseInfo`` can be decoded on demand without reading the rest of the file.
+
+Layout (little endian)::
+
+    header   magic "BSCAT", format version, service record and the three index tables,
+             followed by the CRC32 of the header itself
+    records  the service header (without use cases) and one record per use case,
+             each one a pickled object
+    tables   keyname, HTTP route and queue indexes: records of
+             (64-bit key hash, offset, length, CRC32) sorted by hash
+
+Lookups binary search the index tables inside the mapping. Every record is checked
+against its CRC32 before it is decoded.
+
+Notes
+-----
+Records are serialized with ``pickle``, so catalogs must only be opened from trusted
+locations.
+"""
+import mmap
+import os
+import pickle
+import struct
+import zlib
+from dataclasses import replace
+from hashlib import blake2b
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .service_info import ServiceInfo
+from .triggers.trigger_consumer import TriggerConsumer
+from .triggers.trigger_http import TriggerHttp
+from .use_case_info import UseCaseInfo
+
+CATALOG_MAGIC = b"BSCAT"
+CATALOG_VERSION = 2
+
+_HEADER = struct.Struct("<5sH" + "QII" + "QI" * 3)
+_HEADER_CRC = struct.Struct("<I")
+_INDEX_RECORD = struct.Struct("<QQII")
+_DATA_OFFSET = _HEADER.size + _HEADER_CRC.size
+_INDEX_NAMES = ("keyname", "route", "queue")
+
+
+def _key_hash(key: str) -> int:
+    """Return the 64-bit hash of an index key."""
+    return int.from_bytes(blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def route_key(method: Optional[str], path: str) -> str:
+    """Return the index key of an HTTP route, e.g. ``"GET /users/{uid}"``.
+
+    Parameters
+    ----------
+    method : Optional[str]
+        HTTP method, GET when not given.
+    path : str
+        Route path.
+
+    Returns
+    -------
+    str
+        The route key.
+    """
+    return f"{(method or 'GET').upper()} {path}"
+
+
+def _use_case_keys(use_case: UseCaseInfo) -> Dict[str, List[str]]:
+    """Return the index keys of a use case."""
+    keys = {"keyname": [use_case.keyname], "route": [], "queue": []}
+    for trigger in use_case.triggers:
+        options = trigger.options
+        if isinstance(options, TriggerHttp) and options.path is not None:
+            keys["route"].append(route_key(options.method, options.path))
+        elif isinstance(options, TriggerConsumer) and options.queue is not None:
+            keys["queue"].append(options.queue)
+    return keys
+
+
+def compile_catalog(service_info: ServiceInfo, path: str) -> None:
+    """Write a service as a compiled catalog file.
+
+    The file is written to a temporary path and atomically moved into place.
+
+    Parameters
+    ----------
+    service_info : ServiceInfo
+        The service to compile.
+    path : str
+        Path of the catalog file to write.
+    """
+    chunks = []
+    offset = _DATA_OFFSET
+
+    def add_record(obj) -> Tuple[int, int, int]:
+        nonlocal offset
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        chunks.append(data)
+        record = (offset, len(data), zlib.crc32(data))
+        offset += len(data)
+        return record
+
+    service_record = add_record(replace(service_info, use_cases={}))
+    indexes = {name: [] for name in _INDEX_NAMES}
+    for use_case in service_info.use_cases.values():
+        record = add_record(use_case)
+        for name, keys in _use_case_keys(use_case).items():
+            indexes[name].extend((_key_hash(key),) + record for key in set(keys))
+
+    tables = []
+    for name in _INDEX_NAMES:
+        entries = sorted(indexes[name])
+        tables.extend((offset, len(entries)))
+        table = b"".join(_INDEX_RECORD.pack(*entry) for entry in entries)
+        chunks.append(table)
+        offset += len(table)
+
+    header = _HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, *service_record, *tables)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(header)
+        file.write(_HEADER_CRC.pack(zlib.crc32(header)))
+        for chunk in chunks:
+            file.write(chunk)
+    os.replace(tmp_path, path)
+
+
+class CompiledCatalog:
+    """Read-only, memory-mapped view of a compiled catalog file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the catalog file, written by ``compile_catalog``.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a catalog, has an unsupported version or a corrupted header.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < _DATA_OFFSET:
+                raise ValueError(f"{path} is not a compiled metadata catalog")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header()
+        except ValueError:
+            self.close()
+            raise
+
+    def _read_header(self) -> None:
+        """Parse and check the header."""
+        magic, version, *fields = _HEADER.unpack_from(self._mmap, 0)
+        if magic != CATALOG_MAGIC:
+            raise ValueError(f"{self.path} is not a compiled metadata catalog")
+        if version != CATALOG_VERSION:
+            raise ValueError(f"Unsupported catalog version {version} in {self.path}, "
+                             f"expected {CATALOG_VERSION}")
+        crc, = _HEADER_CRC.unpack_from(self._mmap, _HEADER.size)
+        if crc != zlib.crc32(self._mmap[:_HEADER.size]):
+            raise ValueError(f"Corrupted header in catalog {self.path}")
+        self._service_record = tuple(fields[:3])
+        self._tables = {name: (fields[3 + 2 * i], fields[4 + 2 * i])
+                        for i, name in enumerate(_INDEX_NAMES)}
+        for offset, count in self._tables.values():
+            if offset + count * _INDEX_RECORD.size > len(self._mmap):
+                raise ValueError(f"Truncated catalog {self.path}")
+
+    def _decode(self, offset: int, length: int, crc: int):
+        """Check and unpickle one record."""
+        data = self._mmap[offset:offset + length]
+        if len(data) != length or zlib.crc32(data) != crc:
+            raise ValueError(f"Corrupted record at offset {offset} in catalog {self.path}")
+        return pickle.loads(data)
+
+    def _find(self, index: str, key: str) -> Iterator[UseCaseInfo]:
+        """Yield the use cases whose index key hash matches, by binary search."""
+        table_offset, count = self._tables[index]
+        key_hash = _key_hash(key)
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if _INDEX_RECORD.unpack_from(
+                    self._mmap, table_offset + middle * _INDEX_RECORD.size)[0] < key_hash:
+                low = middle + 1
+            else:
+                high = middle
+        while low < count:
+            entry_hash, *record = _INDEX_RECORD.unpack_from(
+                self._mmap, table_offset + low * _INDEX_RECORD.size)
+            if entry_hash != key_hash:
+                break
+            use_case = self._decode(*record)
+            if key in _use_case_keys(use_case)[index]:
+                yield use_case
+            low += 1
+
+    def __len__(self) -> int:
+        return self._tables["keyname"][1]
+
+    def __contains__(self, keyname: object) -> bool:
+        return isinstance(keyname, str) and self.get(keyname) is not None
+
+    def __getitem__(self, keyname: str) -> UseCaseInfo:
+        use_case = self.get(keyname)
+        if use_case is None:
+            raise KeyError(keyname)
+        return use_case
+
+    def get(self, keyname: str) -> Optional[UseCaseInfo]:
+        """Decode the use case of a keyname.
+
+        Parameters
+        ----------
+        keyname : str
+            Keyname of the use case.
+
+        Returns
+        -------
+        Optional[UseCaseInfo]
+            The use case, or None if the catalog does not have it.
+        """
+        return next(self._find("keyname", keyname), None)
+
+    def find_by_route(self, method: Optional[str], path: str) -> List[UseCaseInfo]:
+        """Decode the use cases triggered by an HTTP route.
+
+        Parameters
+        ----------
+        method : Optional[str]
+            HTTP method, GET when not given.
+        path : str
+            Route path as declared in the metadata, e.g. ``/users/{uid}``.
+
+        Returns
+        -------
+        List[UseCaseInfo]
+            The matching use cases.
+        """
+        return list(self._find("route", route_key(method, path)))
+
+    def find_by_queue(self, queue: str) -> List[UseCaseInfo]:
+        """Decode the use cases consuming from a queue.
+
+        Parameters
+        ----------
+        queue : str
+            Name of the queue.
+
+        Returns
+        -------
+        List[UseCaseInfo]
+            The matching use cases.
+        """
+        return list(self._find("queue", queue))
+
+    @property
+    def service_info(self) -> ServiceInfo:
+        """The service header, without its use cases."""
+        return self._decode(*self._service_record)
+
+    def iter_use_cases(self) -> Iterator[UseCaseInfo]:
+        """Decode every use case, in the order of the compiled service.
+
+        Yields
+        ------
+        UseCaseInfo
+            Each use case of the catalog.
+        """
+        table_offset, count = self._tables["keyname"]
+        records = sorted(_INDEX_RECORD.unpack_from(
+            self._mmap, table_offset + i * _INDEX_RECORD.size)[1:] for i in range(count))
+        for record in records:
+            yield self._decode(*record)
+
+    def load_service_info(self) -> ServiceInfo:
+        """Decode the whole catalog into a ServiceInfo object.
+
+        Returns
+        -------
+        ServiceInfo
+            The service with all its use cases.
+        """
+        service_info = self.service_info
+        service_info.use_cases = {use_case.keyname: use_case
+                                  for use_case in self.iter_use_cases()}
+        return service_info
+
+    def close(self) -> None:
+        """Release the memory mapping."""
+        self._mmap.close()
+
+    def __enter__(self) -> "CompiledCatalog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -2,10 +2,12 @@
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 
-from .base_obj_schema import BaseObjSchema
+from .base_obj_schema import BaseObjSchema, MAPPING_TYPES
+from .slots import add_slots
 from ..commands.analyze_metadata_file.metadata_analysis_report import MetadataAnalysisReport
 
 
+@add_slots
 @dataclass
 class EntityInfo(BaseObjSchema):
     """Base class representing basic information about an entity.
@@ -105,7 +107,7 @@ class EntityInfo(BaseObjSchema):
         ValueError
             If the tags are not a dictionary.
         """
-        if tags is not None and not isinstance(tags, dict):
+        if tags is not None and not isinstance(tags, MAPPING_TYPES):
             raise ValueError("The 'tags' field must be a dictionary if provided.")
         return tags or {}
 
@@ -2,14 +2,17 @@
 This module defines a data structure for representing external interactions
 in a system, such as database access or external service calls.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, Union, Tuple, List
 
 from .base_obj_schema import BaseObjSchema
 from ..commands.analyze_metadata_file.metadata_analysis_report import MetadataAnalysisReport
 from .enums.type_external_interaction import TypeExternalInteraction
+from .intern_table import intern_object
+from .slots import add_slots
 
 
+@add_slots
 @dataclass
 class ExternalInteraction(BaseObjSchema):
     """Represents a single external interaction, including its type, operation,
@@ -29,7 +32,8 @@ class ExternalInteraction(BaseObjSchema):
     type_interaction: Optional[str] = None
     operation: Optional[Union[str, List[str]]] = None
     description: Optional[str] = None
-    type_interaction_standard: Optional[TypeExternalInteraction] = None
+    type_interaction_standard: Optional[TypeExternalInteraction] = field(
+        default=None, metadata={"serialize": False})  # derived from type_interaction
 
     @classmethod
     def analyze(cls, data: Dict[str, Any], keyname: Optional[str] = None) -> MetadataAnalysisReport:
@@ -110,15 +114,16 @@ class ExternalInteraction(BaseObjSchema):
         description = cls._validate_optional_str_field(
             "description", data.get("description") or data.get("desc"))
 
-        return cls(keyname=keyname, type_interaction=type_int, operation=operation,
-                   description=description, type_interaction_standard=type_int_standard)
+        return intern_object(cls(
+            keyname=keyname, type_interaction=type_int, operation=operation,
+            description=description, type_interaction_standard=type_int_standard), share=True)
 
     @staticmethod
     def _validate_operation(operation: Any) -> Optional[Union[str, List[str]]]:
         """Validates the operation field."""
         if operation and not (
             isinstance(operation, str) or
-            (isinstance(operation, list) and all(isinstance(op, str) for op in operation))
+            (isinstance(operation, (list, tuple)) and all(isinstance(op, str) for op in operation))
         ):
             raise TypeError("The 'operation' must be a string or a list of strings.")
         return operation
@@ -0,0 +1,216 @@
+"""
+Module providing deeply immutable snapshots of the schema objects.
+
+``freeze`` turns a schema object into an instance of the frozen variant of its class, a
+subclass created on first use, so ``isinstance`` checks against the original classes keep
+working. Nested objects are frozen too, lists and tuples become tuples and mappings become
+``FrozenDict``. The snapshots are hashable, their hash is computed once and cached, and
+they can be shared across threads or used as dictionary keys without copying.
+"""
+from collections.abc import Mapping
+from dataclasses import FrozenInstanceError, fields, is_dataclass
+from enum import Enum
+from threading import Lock
+from typing import Any, Dict, Iterator, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class FrozenDict(Mapping):
+    """Read-only, hashable mapping whose hash is computed once and cached.
+
+    Parameters
+    ----------
+    *args, **kwargs
+        The items, as accepted by ``dict``.
+    """
+
+    __slots__ = ("_data", "_hash")
+
+    def __init__(self, *args, **kwargs):
+        self._data = dict(*args, **kwargs)
+        self._hash = None
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenDict):
+            return other is self or (hash(self) == hash(other) and self._data == other._data)
+        if isinstance(other, Mapping):
+            return self._data == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._data!r})"
+
+    def __reduce__(self):
+        # the cached hash is not pickled, string hashes differ between processes
+        return self.__class__, (self._data,)
+
+
+class FrozenSchema:
+    """Mixin of the frozen variants created by ``frozen_class``.
+
+    Assigning a field raises ``dataclasses.FrozenInstanceError``. Other slots, such as
+    the caches of the original class, can still be set. Equality compares the cached
+    hashes before the fields.
+    """
+
+    __slots__ = ()
+
+    _thawed_class: type
+    _field_names: Tuple[str, ...]
+    _compare_names: Tuple[str, ...]
+
+    def __init__(self, *args, **kwargs):
+        _fill(self, self._thawed_class(*args, **kwargs))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._field_names:
+            raise FrozenInstanceError(f"cannot assign to field '{name}'")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if name in self._field_names:
+            raise FrozenInstanceError(f"cannot delete field '{name}'")
+        object.__delattr__(self, name)
+
+    def _compare_values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self._compare_names)
+
+    def __hash__(self) -> int:
+        value = self._hash
+        if value is None:
+            value = self._hash = hash((self._thawed_class, self._compare_values()))
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return hash(self) == hash(other) and self._compare_values() == other._compare_values()
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __reduce__(self):
+        return _restore, (self._thawed_class,
+                          tuple(getattr(self, name) for name in self._field_names))
+
+
+_IMMUTABLE_TYPES = frozenset((str, int, float, bool, bytes, type(None), FrozenDict))
+
+_frozen_classes: Dict[type, type] = {}
+_frozen_classes_lock = Lock()
+
+
+def _make_frozen_class(cls: type) -> type:
+    """Create the frozen variant of a dataclass."""
+    all_fields = fields(cls)
+    namespace = {
+        "__slots__": ("_hash",),
+        "__module__": cls.__module__,
+        "__qualname__": f"Frozen{cls.__qualname__}",
+        "__doc__": f"Frozen snapshot of ``{cls.__name__}``, see ``freeze``.",
+        "_thawed_class": cls,
+        "_field_names": tuple(f.name for f in all_fields),
+        "_compare_names": tuple(f.name for f in all_fields if f.compare),
+    }
+    return type(cls)(f"Frozen{cls.__name__}", (FrozenSchema, cls), namespace)
+
+
+def frozen_class(cls: type) -> type:
+    """Return the frozen variant of a dataclass, creating it on first use.
+
+    Parameters
+    ----------
+    cls : type
+        A dataclass, usually a schema class.
+
+    Returns
+    -------
+    type
+        A subclass of ``cls`` whose instances are immutable and hashable.
+    """
+    if issubclass(cls, FrozenSchema):
+        return cls
+    try:
+        return _frozen_classes[cls]
+    except KeyError:
+        pass
+    with _frozen_classes_lock:
+        if cls not in _frozen_classes:
+            _frozen_classes[cls] = _make_frozen_class(cls)
+        return _frozen_classes[cls]
+
+
+def _fill(frozen: FrozenSchema, source: Any) -> None:
+    """Set the fields of a frozen instance from the frozen fields of ``source``."""
+    for name in frozen._field_names:  # pylint: disable=protected-access
+        object.__setattr__(frozen, name, freeze(getattr(source, name)))
+    object.__setattr__(frozen, "_hash", None)
+
+
+def _restore(cls: type, values: Tuple[Any, ...]) -> FrozenSchema:
+    """Rebuild a frozen instance from its class and field values, used by pickle."""
+    frozen_cls = frozen_class(cls)
+    frozen = frozen_cls.__new__(frozen_cls)
+    for name, value in zip(frozen_cls._field_names, values):  # pylint: disable=protected-access
+        object.__setattr__(frozen, name, freeze(value))
+    object.__setattr__(frozen, "_hash", None)
+    return frozen
+
+
+def freeze(value: T) -> T:
+    """Return a deeply immutable snapshot of a value.
+
+    Schema objects and other mutable dataclasses become instances of their frozen
+    variant, lists and tuples become tuples, sets become frozensets and mappings,
+    lazy use cases included, become ``FrozenDict``. Frozen dataclasses, strings,
+    numbers, enums and already frozen values are returned as they are.
+
+    Parameters
+    ----------
+    value : Any
+        The value to freeze. It is not modified.
+
+    Returns
+    -------
+    Any
+        The frozen snapshot.
+    """
+    cls = value.__class__
+    if cls in _IMMUTABLE_TYPES or isinstance(value, (FrozenSchema, Enum)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (dict, Mapping)):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    if is_dataclass(cls) and not cls.__dataclass_params__.frozen:
+        frozen_cls = frozen_class(cls)
+        frozen = frozen_cls.__new__(frozen_cls)
+        _fill(frozen, value)
+        return frozen
+    return value
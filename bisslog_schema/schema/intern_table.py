@@ -0,0 +1,325 @@
+"""
+Module providing an intern table that deduplicates repeated metadata values.
+
+Across a fleet the same strings (gateways, authenticators, teams, tag keys and values,
+interaction types, ...) and identical external interactions, trigger options, mappers
+and tags repeat thousands of times. While an ``InternTable`` is active, see
+``interning``, the ``from_dict`` methods of the schema classes intern every string
+and replace identical trigger options, external interactions and plain dictionaries
+by a single canonical instance.
+
+Canonical objects are held through weak references, so the table never keeps alive
+objects that are no longer used. Shared objects must be treated as read-only.
+"""
+import sys
+import threading
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_active_table: ContextVar[Optional["InternTable"]] = ContextVar("bisslog_intern_table",
+                                                                 default=None)
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+class SharedDict(dict):
+    """Dictionary shared by every object built from an identical mapping.
+
+    It only differs from ``dict`` in that it can be weakly referenced by the table."""
+
+    __slots__ = ("__weakref__",)
+
+
+class InternTable:
+    """Thread-safe table of interned strings and canonical metadata objects.
+
+    Attributes
+    ----------
+    strings : int
+        Number of strings looked up.
+    shared_strings : int
+        Number of strings replaced by an equal string already interned.
+    objects : int
+        Number of dictionaries and schema objects looked up.
+    shared_objects : int
+        Number of dictionaries and schema objects replaced by a canonical instance.
+    bytes_saved : int
+        Shallow size of the duplicates replaced, i.e. the memory released once the
+        raw data they were built from is dropped.
+    """
+
+    def __init__(self):
+        self.strings = 0
+        self.shared_strings = 0
+        self.objects = 0
+        self.shared_objects = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+        self._canonical: "weakref.WeakValueDictionary[Hashable, Any]" = \
+            weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+    def intern_str(self, value: str) -> str:
+        """Return the interned version of a string.
+
+        Parameters
+        ----------
+        value : str
+            The string to intern.
+
+        Returns
+        -------
+        str
+            An equal string shared with every other interned copy.
+        """
+        interned = sys.intern(value)
+        with self._lock:
+            self.strings += 1
+            if interned is not value:
+                self.shared_strings += 1
+                self.bytes_saved += sys.getsizeof(value)
+        return interned
+
+    def intern_value(self, value: Any) -> Any:
+        """Intern a plain value: strings, and dictionaries and lists of plain values.
+
+        Dictionaries are replaced by a canonical ``SharedDict``; lists are copied with
+        their items interned. Containers holding anything else, e.g. schema objects,
+        are returned unchanged.
+
+        Parameters
+        ----------
+        value : Any
+            The value to intern.
+
+        Returns
+        -------
+        Any
+            The interned value.
+        """
+        value_type = type(value)
+        if value_type is str:
+            return self.intern_str(value)
+        if value_type is dict:
+            key = _freeze(value)
+            if key is None:
+                return value
+            return self._share(key, value, lambda: SharedDict(
+                (self.intern_value(k), self.intern_value(v)) for k, v in value.items()))
+        if value_type is list and _freeze(value) is not None:
+            return [self.intern_value(item) for item in value]
+        return value
+
+    def intern(self, obj: T, share: bool = False) -> T:
+        """Intern the fields of a schema object and optionally canonicalize it.
+
+        Parameters
+        ----------
+        obj : T
+            A schema dataclass instance, whose plain fields are interned in place.
+        share : bool, default=False
+            If True, the object is replaced by the canonical instance of the equal
+            objects. Only objects without identity, such as trigger options and
+            external interactions, should be shared.
+
+        Returns
+        -------
+        T
+            The same object, or its canonical instance when shared.
+        """
+        values = []
+        for name in _field_names(type(obj)):
+            value = getattr(obj, name)
+            value_type = type(value)
+            if value_type is str:
+                interned = self.intern_str(value)
+            elif value_type is dict or value_type is list:
+                interned = self.intern_value(value)
+            else:
+                values.append(value)
+                continue
+            if interned is not value:
+                setattr(obj, name, interned)
+            values.append(interned)
+        if not share:
+            return obj
+        key = _freeze(tuple(values))
+        return obj if key is None else self._share((type(obj), key), obj, lambda: obj)
+
+    def intern_service(self, service_info: Any) -> Any:
+        """Intern an already built service, e.g. one loaded in another process.
+
+        Use cases of a lazily loaded service that are not built yet are skipped.
+
+        Parameters
+        ----------
+        service_info : ServiceInfo
+            The service to intern in place.
+
+        Returns
+        -------
+        ServiceInfo
+            The same service.
+        """
+        self.intern(service_info)
+        use_cases = service_info.use_cases
+        is_materialized = getattr(use_cases, "is_materialized", lambda _: True)
+        for keyname in use_cases:
+            if not is_materialized(keyname):
+                continue
+            use_case = use_cases[keyname]
+            self.intern(use_case)
+            for trigger in use_case.triggers:
+                self.intern(trigger)
+                if is_dataclass(trigger.options):
+                    trigger.options = self.intern(trigger.options, share=True)
+            use_case.external_interactions[:] = [
+                self.intern(interaction, share=True)
+                for interaction in use_case.external_interactions]
+        return service_info
+
+    def bind(self, function: Callable[..., T]) -> Callable[..., T]:
+        """Wrap a function so it always runs with this table active.
+
+        Parameters
+        ----------
+        function : Callable
+            The function to wrap, e.g. a deferred builder.
+
+        Returns
+        -------
+        Callable
+            The wrapped function.
+        """
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with interning(self):
+                return function(*args, **kwargs)
+        return wrapper
+
+    def stats(self) -> Dict[str, int]:
+        """Return the interning statistics.
+
+        Returns
+        -------
+        Dict[str, int]
+            Strings and objects looked up and shared, live canonical objects and
+            bytes saved.
+        """
+        with self._lock:
+            return {"strings": self.strings, "shared_strings": self.shared_strings,
+                    "objects": self.objects, "shared_objects": self.shared_objects,
+                    "canonical_objects": len(self._canonical),
+                    "bytes_saved": self.bytes_saved}
+
+    def _share(self, key: Hashable, value: Any, build: Callable[[], Any]) -> Any:
+        """Return the canonical object of a key, registering a new one on a miss."""
+        with self._lock:
+            self.objects += 1
+            canonical = self._canonical.get(key)
+            if canonical is not None:
+                if canonical is not value:
+                    self.shared_objects += 1
+                    self.bytes_saved += sys.getsizeof(value)
+                return canonical
+        canonical = build()
+        with self._lock:
+            return self._canonical.setdefault(key, canonical)
+
+
+def _freeze(value: Any) -> Optional[Hashable]:
+    """Build a hashable key identifying a plain value by content.
+
+    Scalars keep their type in the key so ``1``, ``1.0`` and ``True`` are not merged,
+    and shared dictionaries are identified by identity. Returns None for values that
+    can not be frozen, such as schema objects.
+    """
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value is None or value_type in (bool, int, float):
+        return value_type, value
+    if value_type is SharedDict:
+        return SharedDict, id(value)
+    if value_type is dict:
+        items = []
+        for key, item in value.items():
+            frozen_key, frozen_item = _freeze(key), _freeze(item)
+            if frozen_key is None or frozen_item is None:
+                return None
+            items.append((frozen_key, frozen_item))
+        return dict, frozenset(items)
+    if value_type in (list, tuple):
+        items = tuple(_freeze(item) for item in value)
+        return None if None in items else (value_type, items)
+    if isinstance(value, Enum):
+        return value_type, value
+    return None
+
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Return the field names of a dataclass, cached per class."""
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+    return names
+
+
+def current_intern_table() -> Optional[InternTable]:
+    """Return the intern table active in the current context, if any."""
+    return _active_table.get()
+
+
+@contextmanager
+def interning(table: Optional[InternTable] = None) -> Iterator[InternTable]:
+    """Activate an intern table for the ``from_dict`` calls made inside the block.
+
+    The table is bound to the current context, so other threads and tasks are not
+    affected. Pass ``shared_intern_table`` to deduplicate across every loader.
+
+    Parameters
+    ----------
+    table : Optional[InternTable], default=None
+        The table to activate. A new one is created if not given.
+
+    Yields
+    ------
+    InternTable
+        The active table.
+    """
+    table = InternTable() if table is None else table
+    token = _active_table.set(table)
+    try:
+        yield table
+    finally:
+        _active_table.reset(token)
+
+
+def intern_object(obj: T, share: bool = False) -> T:
+    """Intern a freshly built schema object with the active table, if any.
+
+    Parameters
+    ----------
+    obj : T
+        The schema object.
+    share : bool, default=False
+        If True, the object may be replaced by an equal canonical instance.
+
+    Returns
+    -------
+    T
+        The object, interned when a table is active.
+    """
+    table = _active_table.get()
+    return obj if table is None else table.intern(obj, share)
+
+
+shared_intern_table = InternTable()
@@ -0,0 +1,140 @@
+"""
+Module providing a schema-directed JSON decoder for service metadata.
+
+Instead of decoding the whole JSON document into a dictionary tree and then walking
+it again with ``ServiceInfo.from_dict``, the decoder tracks where it is in the
+document while scanning and builds each ``UseCaseInfo`` (with its triggers and
+external interactions) as soon as the JSON object of the use case is complete. The
+raw dictionary of a use case is discarded right away, so the full raw tree and the
+dataclasses never coexist in memory. Validation errors are the same raised by
+``ServiceInfo.from_dict``.
+
+Only the service object and the ``use_cases`` object are walked in Python; every
+other value, including each use case body, is decoded by the C scanner of the
+standard ``json`` module.
+
+Notes
+-----
+The decoder builds on internals of ``json.decoder`` and ``json.scanner`` that are not
+part of the public API of the standard library. It lowers the peak memory of large
+documents but is not faster than ``json.load``, so ``read_service_metadata`` only uses
+it when ``stream_json=True``. If those internals are missing, the functions of this
+module fall back to ``json.loads`` followed by ``ServiceInfo.from_dict``.
+"""
+import json
+from typing import Any, IO, List, Optional, Tuple
+
+from .service_info import ServiceInfo
+from .use_case_info import UseCaseInfo
+
+try:
+    from json.decoder import JSONObject
+    from json.scanner import make_scanner
+except ImportError:  # pragma: no cover - internals of another Python implementation
+    JSONObject = make_scanner = None
+
+
+class _KeyRecorder(dict):
+    """Key memo that remembers the last object key scanned by ``JSONObject``."""
+
+    last_key: Optional[str] = None
+
+    def setdefault(self, key, default=None):
+        self.last_key = key
+        return super().setdefault(key, default)
+
+
+class ServiceInfoJSONDecoder(json.JSONDecoder):
+    """JSON decoder that builds a ``ServiceInfo`` while the document is decoded.
+
+    A decoder instance keeps scanning state, so it must not be shared between threads.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._memo = _KeyRecorder()
+        self._scan_value = make_scanner(json.JSONDecoder())
+        self.scan_once = self._scan_service
+
+    def _scan_service(self, string: str, idx: int):
+        """Scan the root value, building the ServiceInfo if it is an object."""
+        if string[idx:idx + 1] != "{":
+            return self._scan_value(string, idx)
+        return JSONObject((string, idx + 1), self.strict, self._scan_service_field, None,
+                          _build_service_info, self._memo)
+
+    def _scan_service_field(self, string: str, idx: int):
+        """Scan a field of the service object."""
+        if self._memo.last_key == "use_cases" and string[idx:idx + 1] == "{":
+            return JSONObject((string, idx + 1), self.strict, self._scan_use_case, None,
+                              dict, self._memo)
+        return self._scan_value(string, idx)
+
+    def _scan_use_case(self, string: str, idx: int):
+        """Scan the body of a use case and build its UseCaseInfo right away."""
+        keyname = self._memo.last_key
+        value, end = self._scan_value(string, idx)
+        if isinstance(value, dict):
+            # pylint: disable=protected-access
+            value = ServiceInfo._build_use_case(keyname, value)
+        return value, end
+
+
+def _build_service_info(pairs: List[Tuple[str, Any]]) -> ServiceInfo:
+    """Build the ServiceInfo from the root object whose use cases are already built."""
+    data = dict(pairs)
+    # pylint: disable=protected-access
+    use_cases = ServiceInfo._validate_use_cases_field(data.pop("use_cases", {}))
+    built_use_cases = {}
+    for key, value in use_cases.items():
+        if not isinstance(value, UseCaseInfo):
+            value = ServiceInfo._build_use_case(key, value)
+        built_use_cases[key] = value
+    service_info = ServiceInfo.from_dict(data)
+    service_info.use_cases = built_use_cases
+    return service_info
+
+
+def loads_service_info(document: str) -> ServiceInfo:
+    """Decode a JSON service metadata document straight into a ``ServiceInfo``.
+
+    Parameters
+    ----------
+    document : str
+        The JSON document.
+
+    Returns
+    -------
+    ServiceInfo
+        The service information.
+
+    Raises
+    ------
+    ValueError
+        If the document is not valid JSON or the metadata is invalid.
+    """
+    if JSONObject is None or make_scanner is None:
+        data = json.loads(document)
+        if not isinstance(data, dict):
+            raise ValueError("The JSON metadata document must be an object.")
+        return ServiceInfo.from_dict(data)
+    service_info = ServiceInfoJSONDecoder().decode(document)
+    if not isinstance(service_info, ServiceInfo):
+        raise ValueError("The JSON metadata document must be an object.")
+    return service_info
+
+
+def load_service_info(file: IO[str]) -> ServiceInfo:
+    """Decode a JSON service metadata file straight into a ``ServiceInfo``.
+
+    Parameters
+    ----------
+    file : IO[str]
+        Readable text file with the JSON document.
+
+    Returns
+    -------
+    ServiceInfo
+        The service information.
+    """
+    return loads_service_info(file.read())
@@ -0,0 +1,83 @@
+"""
+Module providing a lazy mapping of use cases.
+
+The mapping keeps the raw use case dictionaries and only validates and builds
+each ``UseCaseInfo`` the first time it is accessed, memoizing the result.
+"""
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator
+
+from .use_case_info import UseCaseInfo
+
+
+class LazyUseCases(Mapping):
+    """Read-only mapping of use case keyname to ``UseCaseInfo`` built on first access.
+
+    Iteration, ``len``, ``keys()`` and membership tests only use the raw
+    dictionaries, so they never force the construction of any use case.
+
+    Parameters
+    ----------
+    raw_use_cases : Dict[str, Any]
+        Raw use case dictionaries keyed by keyname.
+    factory : Callable[[str, Any], UseCaseInfo]
+        Function that validates and builds a use case from its keyname and raw data.
+    """
+
+    def __init__(self, raw_use_cases: Dict[str, Any],
+                 factory: Callable[[str, Any], UseCaseInfo]):
+        self._raw = raw_use_cases
+        self._factory = factory
+        self._built: Dict[str, UseCaseInfo] = {}
+
+    def __getitem__(self, keyname: str) -> UseCaseInfo:
+        try:
+            return self._built[keyname]
+        except KeyError:
+            pass
+        use_case = self._factory(keyname, self._raw[keyname])
+        self._built[keyname] = use_case
+        return use_case
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __contains__(self, keyname: object) -> bool:
+        return keyname in self._raw
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(keys={list(self._raw)!r}, "
+                f"materialized={len(self._built)})")
+
+    def is_materialized(self, keyname: str) -> bool:
+        """Check whether the use case has already been built.
+
+        Parameters
+        ----------
+        keyname : str
+            The keyname of the use case.
+
+        Returns
+        -------
+        bool
+            True if the ``UseCaseInfo`` has been built, False otherwise.
+        """
+        return keyname in self._built
+
+    def materialize_all(self) -> Dict[str, UseCaseInfo]:
+        """Build every pending use case, surfacing validation errors up front.
+
+        Returns
+        -------
+        Dict[str, UseCaseInfo]
+            Dictionary with all the built use cases.
+
+        Raises
+        ------
+        ValueError
+            If any of the use cases is invalid.
+        """
+        return {keyname: self[keyname] for keyname in self._raw}
@@ -0,0 +1,230 @@
+"""
+Module providing resource limits for loading untrusted metadata files.
+
+A ``LoadLimits`` instance caps the file size, the number of nodes, the number of
+aliases, the alias expanded size, the nesting depth and the parsing time of a metadata
+file. YAML documents are checked on the event stream before they are constructed, so
+alias bombs are detected by adding up the sizes of the anchored nodes without expanding
+them, and deeply nested documents are rejected before the recursive composition.
+"""
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Optional, TextIO
+
+
+class MetadataLimitExceeded(ValueError):
+    """Raised when a metadata file exceeds one of the configured ``LoadLimits``."""
+
+
+@dataclass(frozen=True)
+class LoadLimits:
+    """Resource limits for loading a metadata file. ``None`` disables a limit.
+
+    Attributes
+    ----------
+    max_file_size : Optional[int]
+        Maximum size of the file in bytes.
+    max_nodes : Optional[int]
+        Maximum number of scalars, sequences, mappings and aliases.
+    max_aliases : Optional[int]
+        Maximum number of YAML aliases.
+    max_expanded_nodes : Optional[int]
+        Maximum number of nodes once every alias is expanded.
+    max_depth : Optional[int]
+        Maximum nesting depth of sequences and mappings.
+    max_seconds : Optional[float]
+        Maximum time spent parsing the file. The YAML event stream and NDJSON lines
+        are checked as they are read, but ``json.load`` and the final YAML
+        composition can not be interrupted, so for them it is a check made once they
+        return: a slow document is rejected, not cut short.
+    """
+    max_file_size: Optional[int] = 16 * 1024 * 1024
+    max_nodes: Optional[int] = 1_000_000
+    max_aliases: Optional[int] = 10_000
+    max_expanded_nodes: Optional[int] = 2_000_000
+    max_depth: Optional[int] = 64
+    max_seconds: Optional[float] = 10.0
+
+    @staticmethod
+    def _check(name: str, value: float, limit: Optional[float]) -> None:
+        """Raise if the value is above the limit."""
+        if limit is not None and value > limit:
+            raise MetadataLimitExceeded(f"The metadata exceeds the limit of {name} ({limit}).")
+
+    def check_file_size(self, path: str) -> None:
+        """Check the size of a file before reading it.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file.
+
+        Raises
+        ------
+        MetadataLimitExceeded
+            If the file is too big.
+        """
+        self._check("max_file_size", os.path.getsize(path), self.max_file_size)
+
+    def _check_time(self, start: float) -> None:
+        """Raise if parsing started more than ``max_seconds`` ago."""
+        self._check("max_seconds", time.perf_counter() - start, self.max_seconds)
+
+    def load_yaml(self, file: TextIO, loader_cls: type) -> Any:
+        """Load a YAML document after checking its event stream against the limits.
+
+        Parameters
+        ----------
+        file : TextIO
+            The open file.
+        loader_cls : type
+            The PyYAML loader class (``CSafeLoader`` or ``SafeLoader``).
+
+        Returns
+        -------
+        Any
+            The loaded data.
+
+        Raises
+        ------
+        MetadataLimitExceeded
+            If the document exceeds any of the limits.
+        """
+        start = time.perf_counter()
+        content = file.read()
+        self._check_yaml_events(content, loader_cls, start)
+        loader = loader_cls(content)
+        try:
+            data = loader.get_single_data()
+        finally:
+            loader.dispose()
+        self._check_time(start)
+        return data
+
+    def _check_yaml_events(self, content: str, loader_cls: type, start: float) -> None:
+        """Walk the YAML events counting nodes, aliases, expanded size and depth."""
+        # pylint: disable=import-outside-toplevel
+        from yaml.events import (AliasEvent, CollectionEndEvent, CollectionStartEvent,
+                                 ScalarEvent)
+        nodes = aliases = expanded = 0
+        anchors = {}
+        stack = []  # [expanded size, anchor] of each open collection
+        loader = loader_cls(content)
+        try:
+            while loader.check_event():
+                event = loader.get_event()
+                if isinstance(event, (ScalarEvent, AliasEvent, CollectionStartEvent)):
+                    nodes += 1
+                    self._check("max_nodes", nodes, self.max_nodes)
+                    if nodes & 1023 == 0:
+                        self._check_time(start)
+                if isinstance(event, CollectionStartEvent):
+                    stack.append([1, event.anchor])
+                    self._check("max_depth", len(stack), self.max_depth)
+                    expanded += 1
+                    continue
+                if isinstance(event, ScalarEvent):
+                    size = 1
+                    if event.anchor is not None:
+                        anchors[event.anchor] = 1
+                elif isinstance(event, AliasEvent):
+                    aliases += 1
+                    self._check("max_aliases", aliases, self.max_aliases)
+                    size = anchors.get(event.anchor, 1)
+                elif isinstance(event, CollectionEndEvent):
+                    size, anchor = stack.pop()
+                    if anchor is not None:
+                        anchors[anchor] = size
+                    if stack:
+                        stack[-1][0] += size
+                    continue
+                else:
+                    continue
+                expanded += size
+                self._check("max_expanded_nodes", expanded, self.max_expanded_nodes)
+                if stack:
+                    stack[-1][0] += size
+        finally:
+            loader.dispose()
+
+    def check_elapsed(self, start: float) -> None:
+        """Check the time elapsed since a parse started.
+
+        Parameters
+        ----------
+        start : float
+            The ``time.perf_counter()`` value taken when the parse started.
+
+        Raises
+        ------
+        MetadataLimitExceeded
+            If more than ``max_seconds`` elapsed.
+        """
+        self._check_time(start)
+
+    def load_json(self, file: TextIO) -> Any:
+        """Load a JSON document and check its nodes and depth against the limits.
+
+        Parameters
+        ----------
+        file : TextIO
+            The open file.
+
+        Returns
+        -------
+        Any
+            The loaded data.
+
+        Raises
+        ------
+        MetadataLimitExceeded
+            If the document exceeds any of the limits.
+        """
+        return self.loads_json(file.read())
+
+    def loads_json(self, document: str, start: Optional[float] = None) -> Any:
+        """Decode a JSON document and check its nodes, depth and time against the limits.
+
+        Parameters
+        ----------
+        document : str
+            The JSON document, e.g. a line of an NDJSON file.
+        start : Optional[float], default=None
+            The ``time.perf_counter()`` value taken when the parse of the file started,
+            so several documents of a file share ``max_seconds``. Defaults to now.
+
+        Returns
+        -------
+        Any
+            The decoded data.
+
+        Raises
+        ------
+        MetadataLimitExceeded
+            If the document exceeds any of the limits.
+        ValueError
+            If the document is not valid JSON.
+        """
+        if start is None:
+            start = time.perf_counter()
+        try:
+            data = json.loads(document)
+        except RecursionError as e:
+            raise MetadataLimitExceeded(
+                f"The metadata exceeds the limit of max_depth ({self.max_depth}).") from e
+        self._check_time(start)
+        nodes = 0
+        pending = [(data, 0)]
+        while pending:
+            value, depth = pending.pop()
+            nodes += 1
+            if isinstance(value, dict):
+                value = value.values()
+            elif not isinstance(value, list):
+                continue
+            self._check("max_depth", depth + 1, self.max_depth)
+            pending.extend((child, depth + 1) for child in value)
+        self._check("max_nodes", nodes, self.max_nodes)
+        return data
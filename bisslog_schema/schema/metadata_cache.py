@@ -0,0 +1,255 @@
+"""
+Module providing an opt-in persistent cache for parsed service metadata.
+
+The cache stores the validated ``ServiceInfo`` built from a metadata file in a
+compact binary form under a cache directory, so later processes can skip the
+YAML/JSON parse and the schema validation entirely. Entries are keyed by the
+file fingerprint (resolved path, size, modification time and content hash) and the
+reader options that change the result, and old entries are evicted following an LRU
+policy.
+"""
+import hashlib
+import os
+import pickle
+import zlib
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .metadata_directory import list_metadata_directory
+from .service_info import ServiceInfo
+
+_MAGIC = b"BSMC1"
+_DIGEST_SIZE = 32
+
+
+class MetadataDiskCache:
+    """Persistent on-disk cache of validated ``ServiceInfo`` objects.
+
+    Any mismatch or corruption of an entry is treated as a miss: the entry is
+    discarded and the metadata file is parsed normally.
+
+    Notes
+    -----
+    Entries are serialized with ``pickle``, so the cache directory must only be
+    writable by trusted processes.
+
+    Attributes
+    ----------
+    cache_dir : str
+        Directory where the cache entries are stored.
+    max_entries : int
+        Maximum number of entries kept before evicting the least recently used.
+    hits : int
+        Number of lookups served from the cache.
+    misses : int
+        Number of lookups that required a normal parse.
+    """
+
+    def __init__(self, cache_dir: str, max_entries: int = 64):
+        if max_entries < 1:
+            raise ValueError("The 'max_entries' must be greater or equal than 1")
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(path: str) -> bytes:
+        """Compute the fingerprint of a metadata file.
+
+        For a ``metadata.d/`` directory the fingerprints of all its metadata files
+        are combined.
+
+        Parameters
+        ----------
+        path : str
+            Path of the metadata file or directory.
+
+        Returns
+        -------
+        bytes
+            Digest combining resolved path, size, modification time and content hash.
+        """
+        if os.path.isdir(path):
+            digest = hashlib.sha256(os.path.realpath(path).encode("utf-8"))
+            for file_path in list_metadata_directory(path):
+                digest.update(MetadataDiskCache.fingerprint(file_path))
+            return digest.digest()
+        stat = os.stat(path)
+        with open(path, "rb") as file:
+            content_hash = hashlib.sha256(file.read()).hexdigest()
+        key = f"{os.path.realpath(path)}|{stat.st_size}|{stat.st_mtime_ns}|{content_hash}"
+        return hashlib.sha256(key.encode("utf-8")).digest()
+
+    @classmethod
+    def _digest(cls, path: str, options: Tuple[Any, ...]) -> bytes:
+        """Return the key of an entry: the file fingerprint combined with the options."""
+        if not options:
+            return cls.fingerprint(path)
+        return hashlib.sha256(cls.fingerprint(path) + repr(options).encode("utf-8")).digest()
+
+    def _entry_path(self, digest: bytes) -> str:
+        """Return the entry path of the given fingerprint."""
+        return os.path.join(self.cache_dir, digest.hex() + ".bin")
+
+    def load(self, path: str, options: Tuple[Any, ...] = ()) -> Optional[ServiceInfo]:
+        """Load the cached ``ServiceInfo`` of a metadata file, if still valid.
+
+        Parameters
+        ----------
+        path : str
+            Path of the metadata file.
+        options : Tuple[Any, ...], default=()
+            Reader options the entry was stored with, see ``get_or_parse``.
+
+        Returns
+        -------
+        Optional[ServiceInfo]
+            The cached object, or None on a miss.
+        """
+        digest = self._digest(path, options)
+        service_info = self._read_entry(digest)
+        if service_info is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return service_info
+
+    def _read_entry(self, digest: bytes) -> Optional[ServiceInfo]:
+        """Read and decode an entry, discarding it when it is corrupted."""
+        entry_path = self._entry_path(digest)
+        try:
+            with open(entry_path, "rb") as file:
+                raw = file.read()
+        except OSError:
+            return None
+        header_size = len(_MAGIC) + _DIGEST_SIZE
+        try:
+            if raw[:len(_MAGIC)] != _MAGIC or raw[len(_MAGIC):header_size] != digest:
+                raise ValueError("Cache entry does not match the metadata file")
+            service_info = pickle.loads(zlib.decompress(raw[header_size:]))
+            if not isinstance(service_info, ServiceInfo):
+                raise TypeError("Cache entry does not contain a ServiceInfo")
+        except Exception:  # pylint: disable=broad-except
+            self._remove(entry_path)
+            return None
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return service_info
+
+    def store(self, path: str, service_info: ServiceInfo,
+              options: Tuple[Any, ...] = ()) -> None:
+        """Store the ``ServiceInfo`` built from a metadata file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the metadata file.
+        service_info : ServiceInfo
+            The validated service information to cache.
+        options : Tuple[Any, ...], default=()
+            Reader options the service was parsed with, see ``get_or_parse``.
+
+        Raises
+        ------
+        OSError
+            If the entry can not be written.
+        """
+        self._write_entry(self._digest(path, options), service_info)
+
+    def _write_entry(self, digest: bytes, service_info: ServiceInfo) -> None:
+        """Write an entry atomically and evict the least recently used ones."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        payload = zlib.compress(pickle.dumps(service_info, protocol=pickle.HIGHEST_PROTOCOL))
+        entry_path = self._entry_path(digest)
+        tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as file:
+                file.write(_MAGIC + digest + payload)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            self._remove(tmp_path)
+            raise
+        self._evict()
+
+    def get_or_parse(self, path: str, parse: Callable[[], ServiceInfo],
+                     options: Tuple[Any, ...] = ()) -> ServiceInfo:
+        """Return the cached ``ServiceInfo`` or parse and store it on a miss.
+
+        The fingerprint is taken once, before parsing, so a file edited during the
+        parse is not cached under its new fingerprint. A cache directory that can not
+        be written does not fail the read, the parsed service is returned uncached.
+
+        Parameters
+        ----------
+        path : str
+            Path of the metadata file.
+        parse : Callable[[], ServiceInfo]
+            Function performing the normal parse of the file.
+        options : Tuple[Any, ...], default=()
+            Hashable reader options that change the result, such as the ``LoadLimits``,
+            so services parsed with other options are cached separately.
+
+        Returns
+        -------
+        ServiceInfo
+            The service information, from cache or freshly parsed.
+        """
+        digest = self._digest(path, options)
+        service_info = self._read_entry(digest)
+        if service_info is not None:
+            self.hits += 1
+            return service_info
+        self.misses += 1
+        service_info = parse()
+        try:
+            self._write_entry(digest, service_info)
+        except OSError:
+            pass
+        return service_info
+
+    def _entries(self):
+        """List the entry files of the cache directory."""
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return []
+        return [os.path.join(self.cache_dir, name) for name in names if name.endswith(".bin")]
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries exceeding ``max_entries``."""
+        entries = []
+        for entry_path in self._entries():
+            try:
+                entries.append((os.stat(entry_path).st_mtime_ns, entry_path))
+            except OSError:
+                continue
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, entry_path in entries[:len(entries) - self.max_entries]:
+            self._remove(entry_path)
+
+    @staticmethod
+    def _remove(entry_path: str) -> None:
+        """Remove an entry ignoring concurrent deletions."""
+        try:
+            os.remove(entry_path)
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Remove every entry of the cache."""
+        for entry_path in self._entries():
+            self._remove(entry_path)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit/miss counters and the current number of entries.
+
+        Returns
+        -------
+        Dict[str, int]
+            Dictionary with ``hits``, ``misses`` and ``entries``.
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries())}
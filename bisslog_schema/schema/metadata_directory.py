@@ -0,0 +1,207 @@
+"""
+Module for reading service metadata split across a ``metadata.d/`` directory.
+
+The directory holds one service header file (``service.yml``, ``service.yaml`` or
+``service.json``) plus any number of files with use cases, one per use case or per
+group, optionally nested in subdirectories. Each use case file contains a mapping
+of keyname to use case data, either at the top level or under a ``use_cases`` key.
+A use case file with a ``use_cases`` key may also set service fields, which must not
+conflict with the header or other files. The files are parsed concurrently and merged
+into a single metadata dictionary.
+"""
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .service_info import ServiceInfo
+
+HEADER_FILE_NAMES = ("service.yml", "service.yaml", "service.json")
+METADATA_EXTENSIONS = (".yml", ".yaml", ".json")
+EXECUTORS = ("process", "thread", "none")
+
+
+def list_metadata_directory(path: str) -> List[str]:
+    """List the metadata files of a directory layout in a deterministic order.
+
+    The header file comes first, followed by the use case files sorted by path.
+
+    Parameters
+    ----------
+    path : str
+        Path of the metadata directory.
+
+    Returns
+    -------
+    List[str]
+        Paths of the metadata files.
+
+    Raises
+    ------
+    ValueError
+        If the directory has no service header file.
+    """
+    header = None
+    for name in HEADER_FILE_NAMES:
+        if os.path.isfile(os.path.join(path, name)):
+            header = os.path.join(path, name)
+            break
+    if header is None:
+        raise ValueError(f"Metadata directory {path} must contain one of {HEADER_FILE_NAMES}")
+
+    use_case_files = []
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in files:
+            file_path = os.path.join(root, name)
+            if (name.lower().endswith(METADATA_EXTENSIONS) and not name.startswith(".")
+                    and file_path != header):
+                use_case_files.append(file_path)
+    return [header] + sorted(use_case_files)
+
+
+def stat_signature(path: str) -> Tuple:
+    """Return the modification time and size of a metadata file or of a directory's files.
+
+    It is cheap to compute and changes whenever any of the files is edited, so it is
+    used to detect changes without reading the files.
+
+    Parameters
+    ----------
+    path : str
+        Path of the metadata file or directory.
+
+    Returns
+    -------
+    Tuple
+        ``(path, mtime_ns, size)`` of each file. Files removed meanwhile are skipped.
+    """
+    paths = list_metadata_directory(path) if os.path.isdir(path) else [path]
+    signature = []
+    for file_path in paths:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            continue
+        signature.append((file_path, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _make_executor(executor: str, max_workers: Optional[int]) -> Optional[Executor]:
+    """Create the executor used to parse the files concurrently."""
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=max_workers)
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    return None
+
+
+def _extract_use_cases(file_path: str, data: Any) -> Dict[str, Any]:
+    """Extract the use cases mapping from the content of a use case file."""
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise ValueError(f"Metadata file {file_path} must contain a dictionary of use cases.")
+    use_cases = (data["use_cases"] or {}) if "use_cases" in data else data
+    if not isinstance(use_cases, dict):
+        raise ValueError(f"The 'use_cases' field of {file_path} must be a dictionary.")
+    return use_cases
+
+
+def merge_metadata_files(parsed_files: List[tuple]) -> Dict[str, Any]:
+    """Merge the parsed content of a metadata directory into one metadata dictionary.
+
+    Duplicate keynames across files are reported with the same rules and messages
+    used by ``ServiceInfo`` for repeated use case fields. Service fields set by use
+    case files next to their ``use_cases`` are added to the header, and a field set
+    to different values by two files is reported as a conflict.
+
+    Parameters
+    ----------
+    parsed_files : List[tuple]
+        Pairs of (file path, parsed content). The first one is the service header.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The merged metadata dictionary.
+
+    Raises
+    ------
+    ValueError
+        If the header is not a dictionary, a keyname is defined more than once or a
+        service field has conflicting values.
+    """
+    (header_path, header), *use_case_files = parsed_files
+    if not isinstance(header, dict):
+        raise ValueError(f"Service header file {header_path} must contain a dictionary.")
+    header_use_cases = header.get("use_cases") or {}
+    if not isinstance(header_use_cases, dict):
+        raise ValueError(f"The 'use_cases' field of {header_path} must be a dictionary.")
+
+    merged = dict(header)
+    field_sources = {field_name: header_path for field_name in header}
+    merged_use_cases: Dict[str, Any] = {}
+    check_repetition = {"keyname": set()}
+    errors = []
+    sources = [(header_path, header_use_cases)]
+    for file_path, data in use_case_files:
+        if isinstance(data, dict) and "use_cases" in data:
+            for field_name, value in data.items():
+                if field_name == "use_cases":
+                    continue
+                if field_name not in field_sources:
+                    merged[field_name] = value
+                    field_sources[field_name] = file_path
+                elif merged[field_name] != value:
+                    errors.append(f"Service field '{field_name}' of {file_path} conflicts "
+                                  f"with {field_sources[field_name]}.")
+        sources.append((file_path, _extract_use_cases(file_path, data)))
+    for _, use_cases in sources:
+        for keyname, use_case_data in use_cases.items():
+            new_errors = ServiceInfo._validate_not_repetition(  # pylint: disable=protected-access
+                "keyname", keyname, keyname, check_repetition)
+            if new_errors:
+                errors.extend(new_errors)
+                continue
+            merged_use_cases[keyname] = use_case_data
+    if errors:
+        raise ValueError("\n".join(errors))
+
+    merged["use_cases"] = merged_use_cases
+    return merged
+
+
+def read_metadata_directory(path: str, parse_file: Callable[[str], Any], *,
+                            max_workers: Optional[int] = None,
+                            executor: str = "thread") -> Dict[str, Any]:
+    """Parse every file of a metadata directory concurrently and merge them.
+
+    Parameters
+    ----------
+    path : str
+        Path of the metadata directory.
+    parse_file : Callable[[str], Any]
+        Function parsing a single file. It must be picklable for the process executor.
+    max_workers : Optional[int], default=None
+        Maximum number of workers; defaults to the executor default (number of cores).
+    executor : str, default="thread"
+        "thread" to parse in a thread pool, "none" to parse sequentially or "process"
+        for a process pool. The process pool is opt-in: under the spawn start method
+        (macOS, Windows) its workers import the caller's ``__main__`` module, so it
+        must only be used from code guarded by ``if __name__ == "__main__":``.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The merged metadata dictionary.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor '{executor}'. Must be one of: {EXECUTORS}.")
+    files = list_metadata_directory(path)
+    pool = _make_executor(executor, max_workers) if len(files) > 1 else None
+    if pool is None:
+        contents = [parse_file(file_path) for file_path in files]
+    else:
+        with pool:
+            contents = list(pool.map(parse_file, files))
+    return merge_metadata_files(list(zip(files, contents)))
@@ -0,0 +1,208 @@
+"""
+Module for applying environment overlays to a base service metadata.
+
+An overlay is a small metadata file holding only the values that differ from the base,
+merged following JSON Merge Patch (RFC 7386): mappings are merged recursively and a
+``null`` removes a key. Lists are replaced as a whole, unless the overlay gives a
+mapping for them, whose keys select the items to patch by ``keyname`` or index::
+
+    use_cases:
+      getUser:
+        triggers:
+          0:
+            options:
+              apigw: public
+              timeout: 500
+      debugDump: null
+
+The base is parsed once. Each overlaid ``ServiceInfo`` only builds the use cases its
+overlay touches, and those reuse the triggers and external interactions that did not
+change, so every other object is shared with the base.
+"""
+import copy
+import os
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .load_limits import LoadLimits
+from .read_metadata import read_metadata_file
+from .service_info import ServiceInfo
+from .use_case_info import UseCaseInfo
+
+
+def _list_index(items: List[Any], selector: Any) -> int:
+    """Return the index of the list item selected by a keyname or a position."""
+    for i, item in enumerate(items):
+        if isinstance(item, dict) and item.get("keyname") == selector:
+            return i
+    try:
+        index = int(selector)
+    except (TypeError, ValueError):
+        index = None
+    if index is None or not -len(items) <= index < len(items):
+        raise ValueError(f"The overlay item '{selector}' does not match any keyname or index")
+    return index % len(items)
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """Merge a patch over a value, without modifying it.
+
+    Parts of the target that the patch does not touch are shared with the result
+    instead of being copied.
+
+    Parameters
+    ----------
+    target : Any
+        The base value.
+    patch : Any
+        The patch. Mappings are merged key by key and ``None`` removes a key. A
+        mapping over a list patches the items selected by keyname or index.
+
+    Returns
+    -------
+    Any
+        The merged value.
+
+    Raises
+    ------
+    ValueError
+        If a list item selected by the patch does not exist.
+    """
+    if not isinstance(patch, dict):
+        return patch
+    if isinstance(target, list):
+        items = list(target)
+        removed = set()
+        for selector, item_patch in patch.items():
+            index = _list_index(target, selector)
+            if item_patch is None:
+                removed.add(index)
+            else:
+                items[index] = merge_patch(target[index], item_patch)
+        return [item for i, item in enumerate(items) if i not in removed]
+    merged = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            merged.pop(key, None)
+        else:
+            merged[key] = merge_patch(merged.get(key), value)
+    return merged
+
+
+def _share_unchanged(use_case: UseCaseInfo, base: UseCaseInfo) -> UseCaseInfo:
+    """Replace the triggers and external interactions equal to the base ones by them."""
+    if use_case == base:
+        return base
+    for name in ("triggers", "external_interactions"):
+        items, base_items = getattr(use_case, name), getattr(base, name)
+        for i, item in enumerate(items):
+            if i < len(base_items) and base_items[i] == item:
+                items[i] = base_items[i]
+                continue
+            items[i] = next((base_item for base_item in base_items if base_item == item), item)
+    return use_case
+
+
+def apply_overlay(base: ServiceInfo, base_data: Dict[str, Any],
+                  overlay: Optional[Dict[str, Any]]) -> Tuple[ServiceInfo, Dict[str, Any]]:
+    """Apply an overlay to a service, sharing everything it does not change.
+
+    Parameters
+    ----------
+    base : ServiceInfo
+        The base service, fully built (not lazy).
+    base_data : Dict[str, Any]
+        The raw metadata ``base`` was built from. It is not modified.
+    overlay : Optional[Dict[str, Any]]
+        The overlay, see ``merge_patch``. None or empty returns an equal service.
+
+    Returns
+    -------
+    Tuple[ServiceInfo, Dict[str, Any]]
+        The overlaid service and its raw metadata, which can be the base of another
+        overlay.
+
+    Raises
+    ------
+    ValueError
+        If the overlay is not a dictionary or the overlaid metadata is invalid.
+    """
+    overlay = overlay or {}
+    if not isinstance(overlay, dict):
+        raise ValueError("The overlay must be a dictionary.")
+    use_cases_patch = overlay.get("use_cases") or {}
+    if not isinstance(use_cases_patch, dict):
+        raise ValueError("The overlay 'use_cases' field must be a dictionary.")
+
+    data = merge_patch(base_data, overlay)
+    if any(key != "use_cases" for key in overlay):
+        service_info = ServiceInfo.from_dict({**data, "use_cases": {}})
+    else:
+        service_info = copy.copy(base)
+
+    use_cases = dict(base.use_cases)
+    for keyname, use_case_patch in use_cases_patch.items():
+        if use_case_patch is None:
+            use_cases.pop(keyname, None)
+            continue
+        use_case = ServiceInfo._build_use_case(keyname, data["use_cases"][keyname])
+        if keyname in base.use_cases:
+            use_case = _share_unchanged(use_case, base.use_cases[keyname])
+        use_cases[keyname] = use_case
+    service_info.use_cases = use_cases
+    return service_info, data
+
+
+def _overlay_name(path: str) -> str:
+    """Return the environment name of an overlay path, its file name without extension."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def read_service_overlays(base_path: Optional[str],
+                          overlays: Union[Sequence[str], Mapping[str, str]],
+                          encoding: str = "utf-8", *, yaml_loader: str = "auto",
+                          limits: Optional[LoadLimits] = None) -> Dict[str, ServiceInfo]:
+    """Read a base metadata file once and apply each overlay file to it.
+
+    Parameters
+    ----------
+    base_path : Optional[str]
+        Path of the base metadata file or directory. If None, searches default paths.
+    overlays : Union[Sequence[str], Mapping[str, str]]
+        Paths of the overlay files, named after their file name without extension, or
+        a mapping of environment name to path.
+    encoding : str, default="utf-8"
+        The file encoding to use when reading the files.
+    yaml_loader : str, default="auto"
+        YAML loader selection ("auto", "c" or "python").
+    limits : Optional[LoadLimits], default=None
+        Resource limits applied to the base and each overlay file.
+
+    Returns
+    -------
+    Dict[str, ServiceInfo]
+        The overlaid service of each environment.
+
+    Raises
+    ------
+    ValueError
+        If an environment name is repeated, or any overlay is invalid.
+    """
+    if not isinstance(overlays, Mapping):
+        named = {}
+        for path in overlays:
+            name = _overlay_name(path)
+            if name in named:
+                raise ValueError(f"Overlay name '{name}' is used by {named[name]} and {path}")
+            named[name] = path
+        overlays = named
+
+    base_data = read_metadata_file(base_path, encoding, yaml_loader=yaml_loader, limits=limits)
+    base = ServiceInfo.from_dict(base_data)
+    result = {}
+    for name, path in overlays.items():
+        overlay = read_metadata_file(path, encoding, yaml_loader=yaml_loader, limits=limits)
+        try:
+            result[name], _ = apply_overlay(base, base_data, overlay)
+        except ValueError as e:
+            raise ValueError(f"Overlay '{name}' ({path}) error: {e}") from e
+    return result
@@ -0,0 +1,301 @@
+"""
+Module for reading service metadata in the line-delimited JSON (NDJSON) format.
+
+The first line holds the ``ServiceInfo`` fields and every following line holds one use
+case, identified by its ``keyname`` field::
+
+    {"name": "catalog", "team": "platform"}
+    {"keyname": "getUser", "name": "get user", "triggers": [...]}
+    {"keyname": "addUser", "name": "add user", "triggers": [...]}
+
+Lines are parsed and validated one at a time, so very large catalogs never need the
+whole JSON tree in memory. The cross use case uniqueness checks keep fixed-size digests
+in ``DigestSet`` instances with a bounded number of entries. With ``LoadLimits`` every
+line is checked on its own for depth and nodes, and the parse time of the whole file is
+checked after each line.
+"""
+import json
+import time
+from hashlib import blake2b
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from ..commands.analyze_metadata_file.metadata_analysis_report import MetadataAnalysisReport
+from .load_limits import LoadLimits, MetadataLimitExceeded
+from .service_info import ServiceInfo
+from .use_case_info import UseCaseInfo
+
+NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
+
+
+class DigestSet:
+    """Set storing 64-bit digests of its values, with a bounded number of entries.
+
+    Once ``max_entries`` is reached new values are no longer recorded and the set is
+    marked as saturated, so membership checks become partial instead of growing memory.
+
+    Parameters
+    ----------
+    max_entries : int, default=1_000_000
+        Maximum number of digests kept.
+    """
+
+    __slots__ = ("_digests", "max_entries", "saturated")
+
+    def __init__(self, max_entries: int = 1_000_000):
+        self._digests = set()
+        self.max_entries = max_entries
+        self.saturated = False
+
+    @staticmethod
+    def _digest(value: Any) -> int:
+        return int.from_bytes(
+            blake2b(str(value).encode("utf-8", "surrogatepass"), digest_size=8).digest(),
+            "little")
+
+    def __contains__(self, value: Any) -> bool:
+        return self._digest(value) in self._digests
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def add(self, value: Any) -> None:
+        """Record a value, unless the set is full."""
+        if len(self._digests) >= self.max_entries:
+            self.saturated = True
+            return
+        self._digests.add(self._digest(value))
+
+
+def _iter_lines(path: str, encoding: str,
+                limits: Optional[LoadLimits] = None) -> Iterator[Tuple[int, str]]:
+    """Yield the line number and content of every non-blank line."""
+    if limits is not None:
+        limits.check_file_size(path)
+    with open(path, "r", encoding=encoding) as file:
+        for line_number, line in enumerate(file, 1):
+            if line.strip():
+                yield line_number, line
+
+
+def _parse_header(lines: Iterator[Tuple[int, str]], limits: Optional[LoadLimits] = None,
+                  start: float = 0.0) -> Dict[str, Any]:
+    """Parse and check the header line."""
+    line_number, line = next(lines, (1, None))
+    if line is None:
+        raise ValueError("The NDJSON metadata is empty: a ServiceInfo header line is required.")
+    header = _parse_line(line_number, line, limits, start)
+    if "use_cases" in header:
+        raise ValueError(f"Line {line_number}: the header must not contain 'use_cases', "
+                         "each use case goes on its own line.")
+    return header
+
+
+def _parse_line(line_number: int, line: str, limits: Optional[LoadLimits] = None,
+                start: float = 0.0) -> Dict[str, Any]:
+    """Parse one line, which must hold a JSON object, checking it against the limits."""
+    try:
+        data = json.loads(line) if limits is None else limits.loads_json(line, start)
+    except MetadataLimitExceeded as e:
+        raise MetadataLimitExceeded(f"Line {line_number}: {e}") from e
+    except ValueError as e:
+        raise ValueError(f"Line {line_number}: invalid JSON: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError(f"Line {line_number}: the data must be a dictionary.")
+    return data
+
+
+def _parse_keyname(line_number: int, data: Dict[str, Any], keynames: DigestSet) -> str:
+    """Extract the keyname of a use case line and check it is not repeated."""
+    keyname = data.get("keyname")
+    if not isinstance(keyname, str) or not keyname:
+        raise ValueError(f"Line {line_number}: the use case 'keyname' must be a non-empty string.")
+    if keyname in keynames:
+        raise ValueError(f"UseCaseInfo '{keyname}' error: Keyname '{keyname}' is already used.")
+    keynames.add(keyname)
+    return keyname
+
+
+def write_ndjson_metadata(data: Dict[str, Any], path: str, encoding: str = "utf-8") -> None:
+    """Write raw service metadata (as read from YAML or JSON) in the NDJSON format.
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+        The service metadata, with its use cases keyed by keyname under ``use_cases``.
+    path : str
+        Path of the NDJSON file to write.
+    encoding : str, default="utf-8"
+        The file encoding to use when writing the file.
+    """
+    header = {key: value for key, value in data.items() if key != "use_cases"}
+    with open(path, "w", encoding=encoding) as file:
+        file.write(json.dumps(header) + "\n")
+        for keyname, use_case in (data.get("use_cases") or {}).items():
+            file.write(json.dumps({**use_case, "keyname": keyname}) + "\n")
+
+
+def read_ndjson_header(path: str, encoding: str = "utf-8", *,
+                       limits: Optional[LoadLimits] = None) -> ServiceInfo:
+    """Read the header line of an NDJSON metadata file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the NDJSON metadata file.
+    encoding : str, default="utf-8"
+        The file encoding to use when reading the file.
+    limits : Optional[LoadLimits], default=None
+        Resource limits for untrusted files, see ``LoadLimits``.
+
+    Returns
+    -------
+    ServiceInfo
+        The service metadata, without use cases.
+
+    Raises
+    ------
+    ValueError
+        If the header line is missing or invalid.
+    MetadataLimitExceeded
+        If limits are given and the file or its header exceed any of them.
+    """
+    start = time.perf_counter()
+    return ServiceInfo.from_dict(_parse_header(_iter_lines(path, encoding, limits),
+                                               limits, start))
+
+
+def iter_ndjson_use_cases(path: str, encoding: str = "utf-8", *,
+                          max_unique_values: int = 1_000_000,
+                          limits: Optional[LoadLimits] = None) -> Iterator[UseCaseInfo]:
+    """Iterate over the use cases of an NDJSON metadata file, one line at a time.
+
+    Parameters
+    ----------
+    path : str
+        Path of the NDJSON metadata file.
+    encoding : str, default="utf-8"
+        The file encoding to use when reading the file.
+    max_unique_values : int, default=1_000_000
+        Maximum number of keynames remembered to detect repetitions.
+    limits : Optional[LoadLimits], default=None
+        Resource limits for untrusted files, see ``LoadLimits``.
+
+    Yields
+    ------
+    UseCaseInfo
+        The validated use case of each line.
+
+    Raises
+    ------
+    ValueError
+        If a line is not valid JSON, or its use case is invalid or repeated.
+    MetadataLimitExceeded
+        If limits are given and the file or one of its lines exceed any of them.
+    """
+    start = time.perf_counter()
+    lines = _iter_lines(path, encoding, limits)
+    _parse_header(lines, limits, start)
+    keynames = DigestSet(max_unique_values)
+    for line_number, line in lines:
+        data = _parse_line(line_number, line, limits, start)
+        keyname = _parse_keyname(line_number, data, keynames)
+        try:
+            yield ServiceInfo._build_use_case(keyname, data)
+        except ValueError as e:
+            raise ValueError(f"Line {line_number}: {e}") from e
+
+
+def read_ndjson_service_metadata(path: str, encoding: str = "utf-8", *,
+                                 max_unique_values: int = 1_000_000,
+                                 limits: Optional[LoadLimits] = None) -> ServiceInfo:
+    """Read an NDJSON metadata file into a ServiceInfo object.
+
+    Parameters
+    ----------
+    path : str
+        Path of the NDJSON metadata file.
+    encoding : str, default="utf-8"
+        The file encoding to use when reading the file.
+    max_unique_values : int, default=1_000_000
+        Maximum number of keynames remembered to detect repetitions.
+    limits : Optional[LoadLimits], default=None
+        Resource limits for untrusted files, see ``LoadLimits``.
+
+    Returns
+    -------
+    ServiceInfo
+        The service metadata with all its use cases.
+    """
+    service_info = read_ndjson_header(path, encoding, limits=limits)
+    service_info.use_cases = {
+        use_case.keyname: use_case
+        for use_case in iter_ndjson_use_cases(path, encoding, limits=limits,
+                                              max_unique_values=max_unique_values)}
+    return service_info
+
+
+def analyze_ndjson_metadata(path: str, encoding: str = "utf-8", *,
+                            max_unique_values: int = 1_000_000,
+                            limits: Optional[LoadLimits] = None) -> MetadataAnalysisReport:
+    """Analyze an NDJSON metadata file, folding each use case into a single report.
+
+    The use case reports are folded incrementally with ``MetadataAnalysisReport.fold``
+    instead of being kept as sub-reports, so memory does not grow with the number of
+    valid use cases.
+
+    Parameters
+    ----------
+    path : str
+        Path of the NDJSON metadata file.
+    encoding : str, default="utf-8"
+        The file encoding to use when reading the file.
+    max_unique_values : int, default=1_000_000
+        Maximum number of values remembered per uniqueness check (keyname, name,
+        description and http path). Past that, the checks are partial and a warning
+        is reported.
+    limits : Optional[LoadLimits], default=None
+        Resource limits for untrusted files, see ``LoadLimits``. Exceeding them aborts
+        the analysis instead of being reported.
+
+    Returns
+    -------
+    MetadataAnalysisReport
+        The summary of the analysis.
+
+    Raises
+    ------
+    ValueError
+        If the header line is missing or invalid.
+    MetadataLimitExceeded
+        If limits are given and the file or one of its lines exceed any of them.
+    """
+    start = time.perf_counter()
+    lines = _iter_lines(path, encoding, limits)
+    report = ServiceInfo.analyze(_parse_header(lines, limits, start))
+    keynames = DigestSet(max_unique_values)
+    check_repetition = {field_name: DigestSet(max_unique_values)
+                        for field_name in ("name", "description", "path_http")}
+
+    for line_number, line in lines:
+        report.critical_validation_count += 1
+        try:
+            data = _parse_line(line_number, line, limits, start)
+            keyname = _parse_keyname(line_number, data, keynames)
+        except MetadataLimitExceeded:
+            raise
+        except ValueError as e:
+            report.errors.append(e.args[0])
+            continue
+        report.critical_validation_count += 2 + len(data.get("triggers") or [])
+        report.errors.extend(ServiceInfo._validate_not_repetition_fields(
+            keyname, data, check_repetition))
+        report.fold(UseCaseInfo.analyze(data))
+
+    saturated = [name for name, values in (("keyname", keynames), *check_repetition.items())
+                 if values.saturated]
+    if saturated:
+        report.warning_validation_count += 1
+        report.warnings.append(
+            f"Uniqueness of {', '.join(saturated)} was only checked for the first "
+            f"{max_unique_values} values.")
+    return report
@@ -0,0 +1,286 @@
+"""
+Module for compiling service metadata into an importable Python module.
+
+The generated module builds the already validated ``ServiceInfo`` from literals, so
+importing it (from its cached bytecode) skips reading, parsing and validating the
+metadata file, which shortens the cold start of short-lived workers::
+
+    ARTIFACT_VERSION = 1
+    SOURCE_HASH = "3f2a..."
+
+    USE_CASES = {}
+    USE_CASES['getUser'] = UseCaseInfo(name='get user', keyname='getUser', ...)
+    SERVICE_INFO = ServiceInfo(name='users', use_cases=USE_CASES)
+
+``SOURCE_HASH`` is the SHA-256 of the metadata the module was compiled from, so a stale
+artifact is detected by ``check_python_module``. Objects shared between use cases (for
+example triggers resolved from the same ``$ref``) are built once and reused.
+"""
+import datetime
+import hashlib
+import importlib
+import importlib.util
+import math
+import os
+from dataclasses import MISSING, fields, is_dataclass
+from enum import Enum
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Union
+
+from .metadata_directory import list_metadata_directory
+from .service_info import ServiceInfo
+
+ARTIFACT_VERSION = 1
+
+
+class StaleArtifactError(ValueError):
+    """Raised when a compiled module does not match the metadata it was compiled from."""
+
+
+def source_hash(path: str) -> str:
+    """Return the SHA-256 of a metadata file, or of every file of a ``metadata.d/``.
+
+    Only the contents (and the relative paths inside a directory) are hashed, so the
+    hash does not change when the metadata is copied or checked out elsewhere.
+
+    Parameters
+    ----------
+    path : str
+        Path of the metadata file or directory.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    if os.path.isdir(path):
+        for file_path in list_metadata_directory(path):
+            relative = os.path.relpath(file_path, path).replace(os.sep, "/")
+            digest.update(relative.encode("utf-8") + b"\0")
+            with open(file_path, "rb") as file:
+                digest.update(hashlib.sha256(file.read()).digest())
+    else:
+        with open(path, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+class _ModuleWriter:
+    """Render objects as Python expressions, collecting imports and shared objects."""
+
+    def __init__(self, root: Any):
+        self.imports: Dict[type, None] = {}
+        self.modules: Dict[str, None] = {}
+        self.lines: List[str] = []
+        self._names: Dict[int, str] = {}
+        self._shared = self._find_shared(root)
+
+    @staticmethod
+    def _find_shared(root: Any) -> set:
+        """Return the ids of the schema objects referenced more than once."""
+        seen, shared = set(), set()
+        pending = [root]
+        while pending:
+            value = pending.pop()
+            if is_dataclass(value) and not isinstance(value, type):
+                if id(value) in seen:
+                    shared.add(id(value))
+                    continue
+                seen.add(id(value))
+                pending.extend(getattr(value, f.name) for f in fields(value))
+            elif isinstance(value, dict):
+                pending.extend(value.values())
+            elif isinstance(value, (list, tuple)):
+                pending.extend(value)
+        return shared
+
+    def expression(self, value: Any) -> str:
+        """Return the Python expression building a value."""
+        if isinstance(value, Enum):
+            self.imports[type(value)] = None
+            return f"{type(value).__name__}.{value.name}"
+        if is_dataclass(value) and not isinstance(value, type):
+            return self._dataclass_expression(value)
+        if value is None or isinstance(value, (str, bool, int)):
+            return repr(value)
+        if isinstance(value, float):
+            return repr(value) if math.isfinite(value) else f"float('{value}')"
+        if isinstance(value, dict):
+            return "{" + ", ".join(f"{self.expression(k)}: {self.expression(v)}"
+                                   for k, v in value.items()) + "}"
+        if isinstance(value, list):
+            return "[" + ", ".join(self.expression(item) for item in value) + "]"
+        if isinstance(value, tuple):
+            return "(" + "".join(f"{self.expression(item)}, " for item in value) + ")"
+        if isinstance(value, (datetime.date, datetime.time, datetime.timedelta)) and \
+                type(getattr(value, "tzinfo", None)) in (type(None), datetime.timezone):
+            # YAML timestamps, whose repr only refers to the datetime module
+            self.modules["datetime"] = None
+            return repr(value)
+        raise TypeError(f"Value {value!r} of type {type(value).__name__} can not be "
+                        "compiled into a Python module")
+
+    def _dataclass_expression(self, value: Any) -> str:
+        """Return the constructor call of a schema object, hoisting shared ones."""
+        if id(value) in self._names:
+            return self._names[id(value)]
+        call = self.constructor_call(value)
+        if id(value) not in self._shared:
+            return call
+        name = f"_shared_{len(self._names)}"
+        self._names[id(value)] = name
+        self.lines.append(f"{name} = {call}")
+        return name
+
+    def constructor_call(self, value: Any, **overrides: str) -> str:
+        """Return the constructor call of a schema object, omitting default fields.
+
+        ``overrides`` maps field names to expressions used instead of their values.
+        """
+        cls = type(value)
+        self.imports[cls] = None
+        arguments = []
+        for field in fields(value):
+            if not field.init:
+                continue
+            if field.name in overrides:
+                arguments.append(f"{field.name}={overrides[field.name]}")
+                continue
+            item = getattr(value, field.name)
+            if field.default is not MISSING and type(item) is type(field.default) \
+                    and item == field.default:
+                continue
+            if field.default_factory is not MISSING and item == field.default_factory():
+                continue
+            try:
+                expression = self.expression(item)
+            except TypeError as e:
+                raise TypeError(f"{cls.__name__}.{field.name}: {e}") from None
+            arguments.append(f"{field.name}={expression}")
+        return f"{cls.__name__}({', '.join(arguments)})"
+
+
+def generate_python_module(service_info: ServiceInfo, source_digest: str) -> str:
+    """Render the source code of a module building a service.
+
+    Parameters
+    ----------
+    service_info : ServiceInfo
+        The validated service.
+    source_digest : str
+        Hash of the metadata the service was read from, see ``source_hash``.
+
+    Returns
+    -------
+    str
+        The module source code.
+
+    Raises
+    ------
+    TypeError
+        If a value of the service can not be written as a Python literal. The message
+        names the field holding it.
+    """
+    writer = _ModuleWriter(service_info)
+    writer.lines.append("USE_CASES = {}")
+    for keyname, use_case in service_info.use_cases.items():
+        expression = writer.expression(use_case)
+        writer.lines.append(f"USE_CASES[{keyname!r}] = {expression}")
+    writer.lines.append(
+        f"SERVICE_INFO = {writer.constructor_call(service_info, use_cases='USE_CASES')}")
+
+    imports = [f"import {module}" for module in sorted(writer.modules)]
+    imports += sorted(f"from {cls.__module__} import {cls.__name__}" for cls in writer.imports)
+    return "\n".join([
+        '"""Service metadata compiled by bisslog_schema. Do not edit."""',
+        "# pylint: skip-file",
+        *imports,
+        "",
+        f"ARTIFACT_VERSION = {ARTIFACT_VERSION}",
+        f"SOURCE_HASH = {source_digest!r}",
+        "",
+        *writer.lines,
+        "",
+    ])
+
+
+def write_python_module(service_info: ServiceInfo, source_path: str, output: str) -> None:
+    """Write a module building a service, stamped with the hash of its metadata.
+
+    The file is written to a temporary path and atomically moved into place.
+
+    Parameters
+    ----------
+    service_info : ServiceInfo
+        The service, as read from ``source_path``.
+    source_path : str
+        Path of the metadata file or directory the service was read from.
+    output : str
+        Path of the ``.py`` file to write.
+    """
+    code = generate_python_module(service_info, source_hash(source_path))
+    tmp_path = f"{output}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        file.write(code)
+    os.replace(tmp_path, output)
+
+
+def check_python_module(module: ModuleType, source_path: str) -> None:
+    """Check a compiled module against the metadata it should have been compiled from.
+
+    Parameters
+    ----------
+    module : ModuleType
+        The imported module.
+    source_path : str
+        Path of the metadata file or directory.
+
+    Raises
+    ------
+    StaleArtifactError
+        If the module was compiled by another artifact version or from other metadata.
+    """
+    version = getattr(module, "ARTIFACT_VERSION", None)
+    if version != ARTIFACT_VERSION:
+        raise StaleArtifactError(f"Unsupported artifact version {version} in module "
+                                 f"{module.__name__}, expected {ARTIFACT_VERSION}")
+    if getattr(module, "SOURCE_HASH", None) != source_hash(source_path):
+        raise StaleArtifactError(f"Module {module.__name__} is stale, {source_path} "
+                                 "changed since it was compiled")
+
+
+def load_python_module(module: Union[str, ModuleType],
+                       source_path: Optional[str] = None) -> ServiceInfo:
+    """Import a compiled module and return its service.
+
+    Parameters
+    ----------
+    module : Union[str, ModuleType]
+        The module, its dotted name or the path of its ``.py`` file.
+    source_path : Optional[str], default=None
+        Path of the metadata the module was compiled from. When given, the module is
+        checked with ``check_python_module``.
+
+    Returns
+    -------
+    ServiceInfo
+        The compiled service.
+
+    Raises
+    ------
+    StaleArtifactError
+        If ``source_path`` is given and the module does not match it.
+    """
+    if isinstance(module, str):
+        if module.endswith(".py"):
+            name = os.path.splitext(os.path.basename(module))[0]
+            spec = importlib.util.spec_from_file_location(name, module)
+            loaded = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(loaded)
+            module = loaded
+        else:
+            module = importlib.import_module(module)
+    if source_path is not None:
+        check_python_module(module, source_path)
+    return module.SERVICE_INFO
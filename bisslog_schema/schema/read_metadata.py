@@ -6,16 +6,27 @@ import os.path
 import importlib
 import json
 import sys
-from typing import Optional
+from functools import partial
+from typing import Optional, Iterator, Any, Union
 
+from .intern_table import InternTable
+from .json_service_decoder import load_service_info
+from .load_limits import LoadLimits
+from .metadata_cache import MetadataDiskCache
+from .metadata_directory import read_metadata_directory
+from .ndjson_metadata import NDJSON_EXTENSIONS, read_ndjson_service_metadata
+from .ref_resolver import RefResolver
+from .service_metadata_cache import ServiceMetadataCache
 from .service_info import ServiceInfo
 
+YAML_LOADERS = ("auto", "c", "python")
+
 
 def _find_path(path: Optional[str]) -> str:
-    """Find the path of the metadata file.
+    """Find the path of the metadata file or ``metadata.d/`` directory.
 
-    If a path is provided, it checks if the file exists. If not, it searches
-    through a list of default paths.
+    If a path is provided, it checks if the file or directory exists. If not, it
+    searches through a list of default paths.
 
     Parameters
     ----------
@@ -25,7 +36,7 @@ def _find_path(path: Optional[str]) -> str:
     Returns
     -------
     str
-        The found file path.
+        The found file or directory path.
 
     Raises
     ------
@@ -36,7 +47,7 @@ def _find_path(path: Optional[str]) -> str:
         # Check if the environment variable is set and use it if available
         path = os.getenv("SERVICE_METADATA_PATH")
     if path is not None:
-        if not os.path.isfile(path):
+        if not os.path.isfile(path) and not os.path.isdir(path):
             raise ValueError(f"Path {path} of metadata does not exist")
     else:
         default_path_options = (
@@ -46,9 +57,12 @@ def _find_path(path: Optional[str]) -> str:
             "./docs/metadata.json",
             "./metadata.yaml",
             "./docs/metadata.yaml",
+            "./metadata.d",
+            "./docs/metadata.d",
         )
         for path_option in default_path_options:
-            if os.path.isfile(path_option):
+            if os.path.isfile(path_option) or (path_option.endswith(".d")
+                                               and os.path.isdir(path_option)):
                 path = path_option
                 break
         if path is None:
@@ -56,12 +70,78 @@ def _find_path(path: Optional[str]) -> str:
     return path
 
 
+def _import_yaml():
+    """Import PyYAML, printing installation instructions when it is missing."""
+    try:
+        return importlib.import_module("yaml")
+    except ImportError as e:
+        print("Please install PyYAML or bisslog_schema[yaml] to read YAML files.\n"
+              "pip install bisslog_schema[yaml]\n"
+              "or\n"
+              "pip install pyyaml", file=sys.stderr)
+        raise e
+
+
+def resolve_yaml_loader(yaml_loader: str = "auto") -> type:
+    """Resolve the PyYAML safe loader class to use.
+
+    Parameters
+    ----------
+    yaml_loader : str, default="auto"
+        Loader selection: "c" for the libyaml ``CSafeLoader``, "python" for the
+        pure-Python ``SafeLoader`` or "auto" to use the C loader when PyYAML was
+        built with libyaml and fall back to the pure-Python one otherwise.
+
+    Returns
+    -------
+    type
+        The loader class.
+
+    Raises
+    ------
+    ValueError
+        If the selection is unknown or the C loader was requested but is not available.
+    """
+    if yaml_loader not in YAML_LOADERS:
+        raise ValueError(f"Unknown YAML loader '{yaml_loader}'. Must be one of: {YAML_LOADERS}.")
+    yaml = _import_yaml()
+    if yaml_loader != "python":
+        c_loader = getattr(yaml, "CSafeLoader", None)
+        if c_loader is not None:
+            return c_loader
+        if yaml_loader == "c":
+            raise ValueError("The libyaml C loader is not available in this PyYAML installation.")
+    return yaml.SafeLoader
+
+
+def yaml_loader_name(yaml_loader: str = "auto") -> str:
+    """Return the name ("c" or "python") of the loader that a selection resolves to.
+
+    Parameters
+    ----------
+    yaml_loader : str, default="auto"
+        Loader selection, see ``resolve_yaml_loader``.
+
+    Returns
+    -------
+    str
+        "c" when the libyaml loader is used, "python" otherwise.
+    """
+    return "c" if resolve_yaml_loader(yaml_loader).__name__ == "CSafeLoader" else "python"
+
+
 def read_metadata_file(path: Optional[str] = None, encoding: str = "utf-8",
-                       format_file: str = None) -> dict:
+                       format_file: str = None, yaml_loader: str = "auto", *,
+                       max_workers: Optional[int] = None, executor: str = "thread",
+                       limits: Optional[LoadLimits] = None, resolve_refs: bool = False,
+                       allow_external_refs: bool = False,
+                       ref_root: Optional[str] = None) -> dict:
     """Read a metadata file from a specified path or default options.
 
     If a path is provided, the function validates and reads the file. If no path is given,
-    it attempts to find a file from a set of default path options.
+    it attempts to find a file from a set of default path options. When the path is a
+    ``metadata.d/`` directory, its files are parsed concurrently and merged, see
+    ``read_metadata_directory``.
 
     Parameters
     ----------
@@ -72,39 +152,149 @@ def read_metadata_file(path: Optional[str] = None, encoding: str = "utf-8",
     format_file: str, default=None
         Format to read the file (yaml or json). If None, it will be inferred
         from the file extension.
+    yaml_loader : str, default="auto"
+        YAML loader selection ("auto", "c" or "python"), see ``resolve_yaml_loader``.
+    max_workers : Optional[int], default=None
+        Maximum number of workers used to parse a metadata directory.
+    executor : str, default="thread"
+        Executor used to parse a metadata directory ("thread", "none" or "process"),
+        see ``read_metadata_directory``.
+    limits : Optional[LoadLimits], default=None
+        Resource limits for untrusted files. Each file of a directory is checked
+        separately.
+    resolve_refs : bool, default=False
+        If True, ``$ref`` references to fragments of this or other files are replaced
+        by the fragments, see ``RefResolver``. Each file of a directory resolves its
+        references separately.
+    allow_external_refs : bool, default=False
+        If True, references may point to files outside of ``ref_root``, including
+        absolute paths. Only enable it for trusted metadata.
+    ref_root : Optional[str], default=None
+        Directory that referenced files must be inside. Defaults to the directory of
+        the file, or to the ``metadata.d/`` directory for the files it holds.
 
     Returns
     -------
     dict
         The parsed metadata as a dictionary.
+
+    Raises
+    ------
+    MetadataLimitExceeded
+        If limits are given and the file exceeds any of them.
     """
     path = _find_path(path)
+    if os.path.isdir(path):
+        parse_file = partial(read_metadata_file, encoding=encoding, yaml_loader=yaml_loader,
+                             limits=limits, resolve_refs=resolve_refs,
+                             allow_external_refs=allow_external_refs,
+                             ref_root=path if ref_root is None else ref_root)
+        return read_metadata_directory(path, parse_file, max_workers=max_workers,
+                                       executor=executor)
+    if resolve_refs:
+        return RefResolver(partial(read_metadata_file, encoding=encoding, yaml_loader=yaml_loader,
+                                   limits=limits), root=ref_root,
+                           allow_outside_root=allow_external_refs).load(path)
 
+    if limits is not None:
+        limits.check_file_size(path)
     with open(path, "r", encoding=encoding) as file:
         if format_file in {"yaml", "yml"} or \
                 (format_file is None and path.lower().endswith((".yml", ".yaml"))):
-            try:
-                yaml = importlib.import_module("yaml")
-                data = yaml.safe_load(file)
-            except ImportError as e:
-                print("Please install PyYAML or bisslog_schema[yaml] to read YAML files.\n"
-                      "pip install bisslog_schema[yaml]\n"
-                      "or\n"
-                      "pip install pyyaml", file=sys.stderr)
-                raise e
+            loader = resolve_yaml_loader(yaml_loader)
+            data = _import_yaml().load(file, Loader=loader) if limits is None \
+                else limits.load_yaml(file, loader)
 
         elif format_file == "json" or (format_file is None and path.endswith(".json")):
-            data = json.load(file)
+            data = json.load(file) if limits is None else limits.load_json(file)
         else:
             raise ValueError("Unsupported file format: only YAML or JSON are allowed.")
 
     return data
 
-def read_service_metadata(path: Optional[str] = None, encoding: str = "utf-8") -> ServiceInfo:
+def iter_metadata_documents(path: Optional[str] = None, encoding: str = "utf-8",
+                            yaml_loader: str = "auto") -> Iterator[Any]:
+    """Iterate over the documents of a multi-document YAML metadata file.
+
+    Documents are separated by ``---`` and parsed one at a time, so memory is bounded
+    by the largest document rather than the whole file. Empty documents are skipped.
+    JSON files and ``metadata.d/`` directories yield a single document.
+
+    Parameters
+    ----------
+    path : Optional[str], default=None
+        The specific file path to read. If None, searches default paths.
+    encoding : str, default="utf-8"
+        The file encoding to use when reading the file.
+    yaml_loader : str, default="auto"
+        YAML loader selection ("auto", "c" or "python"), see ``resolve_yaml_loader``.
+
+    Yields
+    ------
+    Any
+        The parsed data of each document.
+    """
+    path = _find_path(path)
+    if not path.lower().endswith((".yml", ".yaml")):
+        yield read_metadata_file(path, encoding, yaml_loader=yaml_loader)
+        return
+    with open(path, "r", encoding=encoding) as file:
+        for data in _import_yaml().load_all(file, Loader=resolve_yaml_loader(yaml_loader)):
+            if data is not None:
+                yield data
+
+
+def iter_service_metadata(path: Optional[str] = None, encoding: str = "utf-8", *,
+                          yaml_loader: str = "auto", lazy: bool = False) -> Iterator[ServiceInfo]:
+    """Iterate over the services of a multi-document YAML catalog.
+
+    Each document (separated by ``---``) is parsed and validated into a ServiceInfo
+    object only when the iterator reaches it.
+
+    Parameters
+    ----------
+    path : Optional[str], default=None
+        The specific file path to read. If None, searches default paths.
+    encoding : str, default="utf-8"
+        The file encoding to use when reading the file.
+    yaml_loader : str, default="auto"
+        YAML loader selection ("auto", "c" or "python"), see ``resolve_yaml_loader``.
+    lazy : bool, default=False
+        If True, each ``UseCaseInfo`` is validated and built on first access.
+
+    Yields
+    ------
+    ServiceInfo
+        The service metadata of each document.
+
+    Raises
+    ------
+    ValueError
+        If a document is not a valid service, indicating its position in the file.
+    """
+    for index, data in enumerate(iter_metadata_documents(path, encoding, yaml_loader)):
+        if not isinstance(data, dict):
+            raise ValueError(f"Document {index} of the metadata must be a dictionary.")
+        try:
+            yield ServiceInfo.from_dict(data, lazy=lazy)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Document {index} of the metadata is invalid: {e}") from e
+
+
+def read_service_metadata(path: Optional[str] = None, encoding: str = "utf-8", *,
+                          cache: Optional[Union[MetadataDiskCache, ServiceMetadataCache]] = None,
+                          yaml_loader: str = "auto", lazy: bool = False,
+                          max_workers: Optional[int] = None, executor: str = "thread",
+                          limits: Optional[LoadLimits] = None,
+                          resolve_refs: bool = False,
+                          allow_external_refs: bool = False,
+                          intern: Optional[InternTable] = None,
+                          stream_json: bool = False) -> ServiceInfo:
     """Read service metadata from a YAML or JSON file and parse it into a ServiceInfo object.
 
     If a path is provided, the function validates and reads the file. If no path is given,
-    it attempts to find a file from a set of default path options.
+    it attempts to find a file from a set of default path options. ``.ndjson`` files are
+    read one use case per line, see ``ndjson_metadata``.
 
     Parameters
     ----------
@@ -112,6 +302,39 @@ def read_service_metadata(path: Optional[str] = None, encoding: str = "utf-8") -
         The specific file path to read. If None, searches default paths.
     encoding : str, default="utf-8"
         The file encoding to use when reading the file.
+    cache : Optional[Union[MetadataDiskCache, ServiceMetadataCache]], default=None
+        Cache used to skip parsing when the file has not changed: a persistent
+        ``MetadataDiskCache`` or an in-process ``ServiceMetadataCache``, which also
+        coalesces concurrent parses of the same file.
+    yaml_loader : str, default="auto"
+        YAML loader selection ("auto", "c" or "python"), see ``resolve_yaml_loader``.
+    lazy : bool, default=False
+        If True, each ``UseCaseInfo`` is validated and built on first access. It is
+        ignored with a ``MetadataDiskCache``, which stores services fully built.
+    max_workers : Optional[int], default=None
+        Maximum number of workers used to parse a ``metadata.d/`` directory.
+    executor : str, default="thread"
+        Executor used to parse a metadata directory ("thread", "none" or "process"),
+        see ``read_metadata_directory``.
+    limits : Optional[LoadLimits], default=None
+        Resource limits for untrusted files, see ``LoadLimits``.
+    resolve_refs : bool, default=False
+        If True, ``$ref`` references are resolved, each referenced file is parsed once
+        and the objects built from the same fragment are shared, see ``RefResolver``.
+        It can not be combined with a cache, which only tracks the main file.
+    allow_external_refs : bool, default=False
+        If True, references may point to files outside of the directory of the
+        metadata file, see ``read_metadata_file``. Only enable it for trusted metadata.
+    intern : Optional[InternTable], default=None
+        Table used to intern repeated strings and share identical trigger options,
+        external interactions, mappers and tags, see ``InternTable``. Pass the same
+        table to several loads, or ``shared_intern_table``, to deduplicate across
+        services.
+    stream_json : bool, default=False
+        If True, JSON files are decoded straight into the schema objects, building each
+        use case as soon as it is scanned, see ``json_service_decoder``. It lowers the
+        peak memory of large files but is not faster than ``json.load``, and it is not
+        used together with ``lazy``, ``limits`` or ``resolve_refs``.
 
     Returns
     -------
@@ -122,7 +345,72 @@ def read_service_metadata(path: Optional[str] = None, encoding: str = "utf-8") -
     ------
     ValueError
         If the given path does not exist or if no default file is found.
+    MetadataLimitExceeded
+        If limits are given and the file exceeds any of them.
     """
-    data = read_metadata_file(path, encoding)
+    path = _find_path(path)
+    if cache is not None and resolve_refs:
+        raise ValueError("The 'cache' can not be combined with 'resolve_refs'.")
+    read = partial(_parse_service_info, path, encoding, yaml_loader=yaml_loader,
+                   max_workers=max_workers, executor=executor, limits=limits,
+                   resolve_refs=resolve_refs, allow_external_refs=allow_external_refs,
+                   stream_json=stream_json)
+    if cache is None:
+        return read(lazy=lazy) if intern is None else intern.bind(read)(lazy=lazy)
+    options = (encoding, yaml_loader, limits)
+    if isinstance(cache, MetadataDiskCache):
+        # every hit is a new object, so it can be interned without affecting others
+        service_info = cache.get_or_parse(path, read, options)
+        return service_info if intern is None else intern.intern_service(service_info)
+    # in-process entries are shared by every caller, so they are interned before being
+    # cached, never afterwards, and each table gets its own entries
+    read = partial(read, lazy=lazy)
+    return cache.get_or_parse(path, read if intern is None else intern.bind(read),
+                              options + (lazy, intern))
+
 
-    return ServiceInfo.from_dict(data)
+def _parse_service_info(path: str, encoding: str, *, lazy: bool = False,
+                        resolve_refs: bool = False, allow_external_refs: bool = False,
+                        stream_json: bool = False, **read_options) -> ServiceInfo:
+    """Parse an already resolved metadata path into a ServiceInfo object.
+
+    Parameters
+    ----------
+    path : str
+        Resolved path of the metadata file or directory.
+    encoding : str
+        The file encoding to use when reading the file.
+    lazy : bool, default=False
+        If True, each ``UseCaseInfo`` is validated and built on first access. It is
+        ignored for NDJSON files, which are streamed line by line.
+    resolve_refs : bool, default=False
+        If True, ``$ref`` references are resolved and the objects built from the same
+        fragment are shared. Lazily built use cases do not share them.
+    allow_external_refs : bool, default=False
+        If True, references may point to files outside of the metadata directory.
+    stream_json : bool, default=False
+        If True, JSON files are decoded with ``load_service_info``.
+    **read_options
+        Extra options for ``read_metadata_file``.
+
+    Returns
+    -------
+    ServiceInfo
+        The parsed service metadata.
+    """
+    limits = read_options.get("limits")
+    if os.path.isfile(path) and path.lower().endswith(NDJSON_EXTENSIONS):
+        return read_ndjson_service_metadata(path, encoding, limits=limits)
+    if resolve_refs and os.path.isfile(path):
+        resolver = RefResolver(partial(read_metadata_file, encoding=encoding, **read_options),
+                               allow_outside_root=allow_external_refs)
+        data = resolver.load(path)
+        service_info = ServiceInfo.from_dict(data, lazy=lazy)
+        return service_info if lazy else resolver.share_objects(service_info, data)
+    if stream_json and not lazy and limits is None and os.path.isfile(path) \
+            and path.endswith(".json"):
+        with open(path, "r", encoding=encoding) as file:
+            return load_service_info(file)
+    return ServiceInfo.from_dict(read_metadata_file(
+        path, encoding, resolve_refs=resolve_refs, allow_external_refs=allow_external_refs,
+        **read_options), lazy=lazy)
@@ -0,0 +1,210 @@
+"""
+Module for resolving ``$ref`` references between metadata files.
+
+A mapping holding a ``$ref`` key is replaced by the fragment it points to, so services
+can share trigger blocks, trigger options or external interactions::
+
+    triggers:
+      - $ref: common/http-internal.yml#/triggers/0
+    external_interactions:
+      - $ref: "#/definitions/users_db"
+
+The reference is a file path, relative to the file holding it, followed by an optional
+JSON pointer. An empty path refers to the same file. Other keys next to ``$ref`` are
+merged over the referenced mapping. Referenced files must be inside the root directory,
+by default the directory of the loaded file, so untrusted metadata can not read other
+files of the system through ``../`` or absolute paths.
+"""
+import os
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .service_info import ServiceInfo
+
+
+class RefResolver:
+    """Resolve ``$ref`` references of metadata files, loading each file only once.
+
+    Every referenced file is parsed once per resolver and every fragment is resolved
+    once, so all the references to the same fragment get the same object. After the
+    service is built, ``share_objects`` replaces the triggers, trigger options and
+    external interactions built from a shared fragment by a single instance.
+
+    Parameters
+    ----------
+    read_file : Callable[[str], Any]
+        Function parsing a metadata file, e.g. a partial of ``read_metadata_file``.
+    root : Optional[str], default=None
+        Directory that referenced files must be inside. Defaults to the directory of
+        the file given to ``load``.
+    allow_outside_root : bool, default=False
+        If True, references may point to any file, including absolute paths.
+    """
+
+    def __init__(self, read_file: Callable[[str], Any], *, root: Optional[str] = None,
+                 allow_outside_root: bool = False):
+        self._read_file = read_file
+        self._root = os.path.realpath(root) if root is not None else None
+        self._allow_outside_root = allow_outside_root
+        self._documents: Dict[str, Any] = {}
+        self._resolved: Dict[Tuple[str, str], Any] = {}
+        self._fragment_ids: Set[int] = set()
+        self._resolving: List[Tuple[str, str]] = []
+
+    @property
+    def loaded_files(self) -> List[str]:
+        """Paths of the files parsed by this resolver."""
+        return list(self._documents)
+
+    def load(self, path: str) -> Any:
+        """Parse a metadata file and resolve all its references.
+
+        Parameters
+        ----------
+        path : str
+            Path of the metadata file.
+
+        Returns
+        -------
+        Any
+            The parsed data, with every ``$ref`` replaced by its fragment.
+
+        Raises
+        ------
+        ValueError
+            If a reference is invalid, can not be found, is circular or points outside
+            of the root directory.
+        """
+        path = os.path.realpath(path)
+        if self._root is None:
+            self._root = os.path.dirname(path)
+        return self.resolve(self._load_document(path), path)
+
+    def _load_document(self, path: str) -> Any:
+        """Parse a file, memoized by path."""
+        if path not in self._documents:
+            if not os.path.isfile(path):
+                raise ValueError(f"Referenced metadata file {path} does not exist")
+            self._documents[path] = self._read_file(path)
+        return self._documents[path]
+
+    def resolve(self, value: Any, base_path: str) -> Any:
+        """Resolve the references of a value in place.
+
+        Parameters
+        ----------
+        value : Any
+            Parsed metadata.
+        base_path : str
+            Path of the file holding the value, relative references start from it.
+
+        Returns
+        -------
+        Any
+            The value with every ``$ref`` replaced by its fragment.
+        """
+        if isinstance(value, dict):
+            if "$ref" in value:
+                return self._resolve_ref(value, base_path)
+            for key, item in value.items():
+                value[key] = self.resolve(item, base_path)
+        elif isinstance(value, list):
+            for i, item in enumerate(value):
+                value[i] = self.resolve(item, base_path)
+        return value
+
+    def _resolve_ref(self, node: Dict[str, Any], base_path: str) -> Any:
+        """Return the fragment of a ``$ref`` node, merged with its sibling keys."""
+        ref = node["$ref"]
+        if not isinstance(ref, str):
+            raise ValueError(f"The '$ref' value must be a string, got {ref!r}")
+        file_part, _, pointer = ref.partition("#")
+        path = (os.path.realpath(os.path.join(os.path.dirname(base_path), file_part))
+                if file_part else base_path)
+        if file_part and not self._allow_outside_root and self._root is not None \
+                and os.path.commonpath([self._root, path]) != self._root:
+            raise ValueError(f"The $ref {ref} points outside of the metadata directory "
+                             f"{self._root}")
+        key = (path, pointer)
+
+        if key in self._resolved:
+            fragment = self._resolved[key]
+        else:
+            if key in self._resolving:
+                chain = " -> ".join(f"{p}#{f}" for p, f in self._resolving[
+                    self._resolving.index(key):] + [key])
+                raise ValueError(f"Circular $ref: {chain}")
+            self._resolving.append(key)
+            try:
+                fragment = self._follow_pointer(self._load_document(path), pointer, ref)
+                fragment = self.resolve(fragment, path)
+            finally:
+                self._resolving.pop()
+            self._resolved[key] = fragment
+            self._fragment_ids.add(id(fragment))
+
+        siblings = {k: v for k, v in node.items() if k != "$ref"}
+        if not siblings:
+            return fragment
+        if not isinstance(fragment, dict):
+            raise ValueError(f"The '$ref' {ref} with extra keys must point to a mapping")
+        return {**fragment, **self.resolve(siblings, base_path)}
+
+    @staticmethod
+    def _follow_pointer(document: Any, pointer: str, ref: str) -> Any:
+        """Follow a JSON pointer (RFC 6901) inside a document."""
+        if not pointer:
+            return document
+        if not pointer.startswith("/"):
+            raise ValueError(f"Invalid JSON pointer in $ref {ref}")
+        value = document
+        for token in pointer[1:].split("/"):
+            token = token.replace("~1", "/").replace("~0", "~")
+            try:
+                value = value[int(token)] if isinstance(value, list) else value[token]
+            except (KeyError, IndexError, ValueError, TypeError) as e:
+                raise ValueError(f"The $ref {ref} can not be found") from e
+        return value
+
+    def share_objects(self, service_info: ServiceInfo, data: Dict[str, Any]) -> ServiceInfo:
+        """Make the objects built from the same shared fragment a single instance.
+
+        Parameters
+        ----------
+        service_info : ServiceInfo
+            The service built from ``data``.
+        data : Dict[str, Any]
+            The resolved data the service was built from.
+
+        Returns
+        -------
+        ServiceInfo
+            The same service, with shared triggers, trigger options and external
+            interactions.
+        """
+        canonical: Dict[int, list] = {}
+
+        def share(raw: Any, built: Any) -> Any:
+            if id(raw) not in self._fragment_ids:
+                return built
+            candidates = canonical.setdefault(id(raw), [])
+            for candidate in candidates:
+                if candidate == built:
+                    return candidate
+            candidates.append(built)
+            return built
+
+        raw_use_cases = data.get("use_cases") or {}
+        for keyname, use_case in service_info.use_cases.items():
+            raw = raw_use_cases[keyname]
+            for i, (raw_trigger, trigger) in enumerate(zip(raw.get("triggers") or [],
+                                                           use_case.triggers)):
+                if isinstance(raw_trigger.get("options"), dict) and trigger.options is not None:
+                    trigger.options = share(raw_trigger["options"], trigger.options)
+                use_case.triggers[i] = share(raw_trigger, trigger)
+            raw_interactions = raw.get("external_interactions") or []
+            if isinstance(raw_interactions, dict):
+                raw_interactions = list(raw_interactions.values())
+            for i, (raw_interaction, interaction) in enumerate(
+                    zip(raw_interactions, use_case.external_interactions)):
+                use_case.external_interactions[i] = share(raw_interaction, interaction)
+        return service_info
@@ -0,0 +1,223 @@
+"""
+Module providing the serializers of the schema objects back to metadata dictionaries and JSON.
+
+A serializer is generated once per class from its dataclass fields: plain fields are copied
+and the rest go through ``_encode``, which serializes nested objects, enums, mappings and
+sequences. The output has the canonical metadata shape accepted by ``from_dict``: enums are
+written as their string values and ``None`` fields are omitted. The ``serialize`` field
+metadata adjusts a field:
+
+- ``False`` skips a field derived from others.
+- ``"keyed"`` writes a mapping of objects keyed by their keyname without repeating it.
+
+The ``key`` field metadata names the output key when it differs from the field name.
+
+The round trip through ``from_dict`` gives an equal object, with one exception: a use
+case whose criticality is a number that is not a level, such as 60, is loaded with
+criticality None and the number is not kept, so it is written without criticality and
+read back as MEDIUM.
+"""
+import json
+from collections.abc import Mapping
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import lru_cache
+from threading import Lock
+from typing import IO, Any, Callable, Dict, Iterator, Tuple, Union, get_type_hints
+
+_PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+
+_serializers: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+_serializers_lock = Lock()
+
+
+def _is_plain(hint: Any) -> bool:
+    """Check whether a field annotation only admits JSON scalars."""
+    if hint in _PLAIN_TYPES:
+        return True
+    return getattr(hint, "__origin__", None) is Union and all(
+        _is_plain(arg) for arg in hint.__args__)
+
+
+@lru_cache(maxsize=None)
+def _serialized_fields(cls: type) -> Tuple[Tuple[str, str, str], ...]:
+    """Return the attribute, output key and kind of every serialized field of a class."""
+    try:
+        hints = get_type_hints(cls)
+    except (NameError, TypeError):
+        hints = {}
+    plan = []
+    for f in fields(cls):
+        mode = f.metadata.get("serialize", True)
+        if mode is False:
+            continue
+        if mode == "keyed":
+            kind = "keyed"
+        else:
+            kind = "plain" if _is_plain(hints.get(f.name, Any)) else "value"
+        plan.append((f.name, f.metadata.get("key", f.name), kind))
+    return tuple(plan)
+
+
+def _compile(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """Generate the ``to_dict`` function of a dataclass."""
+    lines = ["def to_dict(obj):", "    data = {}"]
+    for name, key, kind in _serialized_fields(cls):
+        lines.append(f"    value = obj.{name}")
+        lines.append("    if value is not None:")
+        if kind == "plain":
+            lines.append(f"        data[{key!r}] = value")
+        elif kind == "keyed":
+            lines.append(f"        data[{key!r}] = _encode_keyed(value)")
+        else:
+            lines.append(f"        data[{key!r}] = _encode(value)")
+    lines.append("    return data")
+    namespace = {"_encode": _encode, "_encode_keyed": _encode_keyed}
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    function = namespace["to_dict"]
+    function.__qualname__ = f"{cls.__qualname__}.to_dict"
+    return function
+
+
+def serializer_for(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """Return the ``to_dict`` function of a dataclass, generating it on first use.
+
+    Parameters
+    ----------
+    cls : type
+        A dataclass, usually a schema class.
+
+    Returns
+    -------
+    Callable[[Any], Dict[str, Any]]
+        A function converting an instance of ``cls`` into a metadata dictionary.
+    """
+    try:
+        return _serializers[cls]
+    except KeyError:
+        pass
+    with _serializers_lock:
+        if cls not in _serializers:
+            _serializers[cls] = _compile(cls)
+        return _serializers[cls]
+
+
+def _encode_enum(member: Enum) -> Any:
+    """Return the string value of an enum member."""
+    val = getattr(member, "val", None)
+    if isinstance(val, str):
+        return val
+    if isinstance(member.value, str):
+        return member.value
+    return member.name.lower()
+
+
+def _encode(value: Any) -> Any:
+    """Convert a value into plain dictionaries, lists and scalars."""
+    cls = value.__class__
+    if cls in _PLAIN_TYPES:
+        return value
+    serializer = _serializers.get(cls)
+    if serializer is not None:
+        return serializer(value)
+    if isinstance(value, Enum):
+        return _encode_enum(value)
+    if isinstance(value, (dict, Mapping)):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_encode(item) for item in value]
+    if is_dataclass(cls):
+        return serializer_for(cls)(value)
+    return value
+
+
+def _encode_keyed(value: Mapping) -> Dict[str, Any]:
+    """Convert a mapping of objects keyed by keyname, dropping the repeated keyname."""
+    encoded = {}
+    for key, item in value.items():
+        item = _encode(item)
+        if isinstance(item, dict):
+            item.pop("keyname", None)
+        encoded[key] = item
+    return encoded
+
+
+def to_dict(obj: Any) -> Dict[str, Any]:
+    """Convert a schema object into its canonical metadata dictionary.
+
+    Parameters
+    ----------
+    obj : Any
+        A schema object, such as a ``ServiceInfo`` or a ``UseCaseInfo``.
+
+    Returns
+    -------
+    Dict[str, Any]
+        A new dictionary that ``from_dict`` of the same class accepts. It rebuilds an
+        equal object, except for unknown criticality levels, see the module notes.
+    """
+    return serializer_for(obj.__class__)(obj)
+
+
+def iter_json(obj: Any, **dumps_kwargs: Any) -> Iterator[str]:
+    """Encode a schema object as JSON, one chunk at a time.
+
+    The values of mapping and sequence fields, such as the use cases of a service, are
+    converted and encoded one by one, so a large service is never fully held as a
+    dictionary. Lazy use cases are built as they are written.
+
+    Parameters
+    ----------
+    obj : Any
+        A schema object.
+    **dumps_kwargs
+        Options for ``json.dumps``, such as ``ensure_ascii`` or ``sort_keys``.
+        Indentation is not supported.
+
+    Yields
+    ------
+    str
+        Consecutive chunks of the JSON document.
+    """
+    first = True
+    yield "{"
+    for name, key, kind in _serialized_fields(obj.__class__):
+        value = getattr(obj, name)
+        if value is None:
+            continue
+        yield ("" if first else ", ") + json.dumps(key, **dumps_kwargs) + ": "
+        first = False
+        if kind == "plain" or not isinstance(value, (list, tuple, dict, Mapping)):
+            yield json.dumps(_encode(value), **dumps_kwargs)
+            continue
+        if isinstance(value, (list, tuple)):
+            yield "["
+            for i, item in enumerate(value):
+                yield ("" if i == 0 else ", ") + json.dumps(_encode(item), **dumps_kwargs)
+            yield "]"
+            continue
+        yield "{"
+        for i, (item_key, item) in enumerate(value.items()):
+            encoded = _encode(item)
+            if kind == "keyed" and isinstance(encoded, dict):
+                encoded.pop("keyname", None)
+            yield (("" if i == 0 else ", ") + json.dumps(item_key, **dumps_kwargs) + ": "
+                   + json.dumps(encoded, **dumps_kwargs))
+        yield "}"
+    yield "}"
+
+
+def write_json(obj: Any, file: IO[str], **dumps_kwargs: Any) -> None:
+    """Write a schema object as JSON to a text file, streaming its nested values.
+
+    Parameters
+    ----------
+    obj : Any
+        A schema object.
+    file : IO[str]
+        The file to write to.
+    **dumps_kwargs
+        Options for ``json.dumps``, see ``iter_json``.
+    """
+    for chunk in iter_json(obj, **dumps_kwargs):
+        file.write(chunk)
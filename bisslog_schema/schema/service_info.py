@@ -5,13 +5,19 @@ This module defines the ServiceInfo dataclass that extends EntityInfo to include
 details such as service type, owning team, and associated use cases.
 """
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, Set, List
+from typing import Optional, Dict, Any, Set, List, Mapping
 
 from ..commands.analyze_metadata_file.metadata_analysis_report import MetadataAnalysisReport
+from .base_obj_schema import MAPPING_TYPES
 from .entity_info import EntityInfo
+from .intern_table import current_intern_table, intern_object
+from .lazy_use_cases import LazyUseCases
+from .slots import add_slots
+from .use_case_indexes import UseCaseIndexes
 from .use_case_info import UseCaseInfo
 
 
+@add_slots(extra_slots=("_indexes",))
 @dataclass
 class ServiceInfo(EntityInfo):
     """
@@ -28,13 +34,15 @@ class ServiceInfo(EntityInfo):
         The type of the service (e.g., API, batch job, etc.).
     team : Optional[str]
         The team responsible for the service.
-    use_cases : Dict[str, UseCaseInfo]
-        Dictionary of use cases associated with the service.
+    use_cases : Mapping[str, UseCaseInfo]
+        Dictionary of use cases associated with the service. When the service is
+        loaded in lazy mode it is a ``LazyUseCases`` mapping.
     """
 
     service_type: Optional[str] = None
     team: Optional[str] = None
-    use_cases: Dict[str, UseCaseInfo] = field(default_factory=dict)
+    use_cases: Mapping[str, UseCaseInfo] = field(default_factory=dict,
+                                                 metadata={"serialize": "keyed"})
 
     @classmethod
     def analyze(cls, data: Dict[str, Any]) -> MetadataAnalysisReport:
@@ -85,20 +93,18 @@ class ServiceInfo(EntityInfo):
             for use_case_keyname, use_case_info_dict in use_cases.items():
                 # Use case data validation
                 metadata_analysis_report.critical_validation_count += 1
-                if not isinstance(use_case_info_dict, dict):
+                if not isinstance(use_case_info_dict, MAPPING_TYPES):
                     msg = f"Use case data for '{use_case_keyname}' must be a dictionary."
                     metadata_analysis_report.errors.append(msg)
                     continue
 
-                metadata_analysis_report.critical_validation_count += 2 + (
-                    len(use_case_info_dict.get("triggers") or [])
-                    if isinstance(use_case_info_dict, dict) else 0
-                )
+                metadata_analysis_report.critical_validation_count += 2 + len(
+                    use_case_info_dict.get("triggers") or [])
                 errors.extend(cls._validate_not_repetition_fields(
                     use_case_keyname, use_case_info_dict, check_repetition))
 
-                use_case_info_dict["keyname"] = use_case_keyname
-                use_case_analysis_report = UseCaseInfo.analyze(use_case_info_dict)
+                use_case_analysis_report = UseCaseInfo.analyze(use_case_info_dict,
+                                                               use_case_keyname)
                 sub_reports["use_cases"].append(use_case_analysis_report)
         metadata_analysis_report.critical_validation_count += len(validations)
         metadata_analysis_report.errors += errors
@@ -131,8 +137,8 @@ class ServiceInfo(EntityInfo):
                 field_name, use_case_keyname, use_case_info_dict.get(field_name), check_repetition)
 
         for trigger in use_case_info_dict.get("triggers", []):
-            if (not isinstance(trigger, dict) or trigger.get("type") != "http"
-                    or not isinstance(trigger.get("options"), dict)
+            if (not isinstance(trigger, MAPPING_TYPES) or trigger.get("type") != "http"
+                    or not isinstance(trigger.get("options"), MAPPING_TYPES)
                     or trigger["options"].get("path") is None):
                 continue
             errors += cls._validate_not_repetition(
@@ -165,7 +171,7 @@ class ServiceInfo(EntityInfo):
         return []
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ServiceInfo":
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> "ServiceInfo":
         """Create a ServiceInfo instance from a dictionary.
 
         This method parses a dictionary structure to create a ServiceInfo object,
@@ -175,6 +181,9 @@ class ServiceInfo(EntityInfo):
         ----------
         data : dict
             A dictionary containing service information, including nested use case data.
+        lazy : bool, default=False
+            If True, use cases are kept raw and each ``UseCaseInfo`` is validated and
+            built on first access. See ``materialize_all``.
 
         Returns
         -------
@@ -186,15 +195,56 @@ class ServiceInfo(EntityInfo):
         ValueError
             If required fields are missing or invalid.
         """
-        return cls(
+        return intern_object(cls(
             name=cls._validate_name(data.get("name")),
             description=cls._validate_description(data.get("description")),
             type=cls._validate_type(data.get("type")),
             tags=cls._validate_tags(data.get("tags", {})),
             service_type=cls._validate_service_type(data.get("service_type")),
             team=cls._validate_team(data.get("team")),
-            use_cases=cls._validate_use_cases(data.get("use_cases", {})),
-        )
+            use_cases=cls._validate_use_cases(data.get("use_cases", {}), lazy),
+        ))
+
+    @property
+    def indexes(self) -> UseCaseIndexes:
+        """Lookup indexes of the use cases by route, queue, route key, actor, tag and
+        criticality, built on first access.
+
+        The indexes are rebuilt when ``use_cases`` is reassigned. After changing the
+        use cases in place, call ``invalidate_indexes``.
+
+        Returns
+        -------
+        UseCaseIndexes
+            The cached indexes.
+        """
+        indexes = getattr(self, "_indexes", None)
+        if indexes is None or indexes.use_cases is not self.use_cases:
+            indexes = self._indexes = UseCaseIndexes(self.use_cases)
+        return indexes
+
+    def invalidate_indexes(self) -> None:
+        """Drop the cached lookup indexes, so the next access rebuilds them."""
+        self._indexes = None
+
+    def materialize_all(self) -> "ServiceInfo":
+        """Build every pending use case of a lazily loaded service.
+
+        Useful in CI to surface all the use case validation errors up front.
+
+        Returns
+        -------
+        ServiceInfo
+            The same instance, with all its use cases built.
+
+        Raises
+        ------
+        ValueError
+            If any of the use cases is invalid.
+        """
+        if isinstance(self.use_cases, LazyUseCases):
+            self.use_cases.materialize_all()
+        return self
 
     @classmethod
     def _validate_name(cls, name: Optional[str]) -> str:
@@ -282,12 +332,13 @@ class ServiceInfo(EntityInfo):
         ValueError
             If the use cases are not a dictionary or contain invalid data.
         """
-        if use_cases is not None and not isinstance(use_cases, dict):
+        if use_cases is not None and not isinstance(use_cases, MAPPING_TYPES):
             raise ValueError("The 'use_cases' field must be a dictionary if provided.")
         return use_cases
 
     @classmethod
-    def _validate_use_cases(cls, use_cases: Dict[str, Any]) -> Dict[str, UseCaseInfo]:
+    def _validate_use_cases(cls, use_cases: Dict[str, Any],
+                            lazy: bool = False) -> Mapping[str, UseCaseInfo]:
         """
         Validate the `use_cases` field and convert each use case info.
 
@@ -295,10 +346,13 @@ class ServiceInfo(EntityInfo):
         ----------
         use_cases : Dict[str, Any]
             The use cases dictionary to validate.
+        lazy : bool, default=False
+            If True, return a ``LazyUseCases`` mapping that converts each use case
+            on first access.
 
         Returns
         -------
-        Dict[str, UseCaseInfo]
+        Mapping[str, UseCaseInfo]
             The validated use cases dictionary.
 
         Raises
@@ -307,13 +361,37 @@ class ServiceInfo(EntityInfo):
             If the use cases are not a dictionary or contain invalid data.
         """
         use_cases = cls._validate_use_cases_field(use_cases)
-        validated_use_cases = {}
-        for key, value in use_cases.items():
-            if not isinstance(value, dict):
-                raise ValueError(f"Use case data for '{key}' must be a dictionary.")
-            value["keyname"] = key
-            try:
-                validated_use_cases[key] = UseCaseInfo.from_dict(value)
-            except (TypeError, ValueError) as e:
-                raise ValueError(f"Error creating UseCaseInfo for '{key}': {e.args[0]}") from e
-        return validated_use_cases
+        if lazy:
+            table = current_intern_table()
+            return LazyUseCases(use_cases, cls._build_use_case if table is None
+                                else table.bind(cls._build_use_case))
+        return {key: cls._build_use_case(key, value) for key, value in use_cases.items()}
+
+    @staticmethod
+    def _build_use_case(key: str, value: Any) -> UseCaseInfo:
+        """
+        Validate the raw data of a single use case and convert it.
+
+        Parameters
+        ----------
+        key : str
+            The keyname of the use case.
+        value : Any
+            The raw use case data.
+
+        Returns
+        -------
+        UseCaseInfo
+            The built use case.
+
+        Raises
+        ------
+        ValueError
+            If the use case data is invalid.
+        """
+        if not isinstance(value, MAPPING_TYPES):
+            raise ValueError(f"Use case data for '{key}' must be a dictionary.")
+        try:
+            return UseCaseInfo.from_dict(value, key)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Error creating UseCaseInfo for '{key}': {e.args[0]}") from e
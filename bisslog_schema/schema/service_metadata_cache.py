@@ -0,0 +1,191 @@
+"""
+Module providing an in-process cache of parsed service metadata for threaded servers.
+
+Entries are keyed by the resolved path of the metadata file (or ``metadata.d/``
+directory) and the reader options that change the result, and validated against its
+modification time and size, so edited files are parsed again. Concurrent lookups of the
+same file share a single in-flight parse instead of starting duplicates, and the cache
+is bounded by entries and bytes with LRU eviction.
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .metadata_directory import stat_signature
+from .service_info import ServiceInfo
+
+
+class _InFlight:
+    """Parse in progress that concurrent callers wait for."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[ServiceInfo] = None
+        self.error: Optional[BaseException] = None
+
+
+class ServiceMetadataCache:
+    """Thread-safe in-memory cache of ``ServiceInfo`` objects with single-flight parsing.
+
+    Cached objects are shared between all the callers, so they must be treated as
+    read-only.
+
+    Parameters
+    ----------
+    max_entries : int, default=128
+        Maximum number of cached services before evicting the least recently used.
+    max_bytes : Optional[int], default=None
+        Maximum total size, measured as the size of the source files, of the cached
+        services. None means no limit.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups served from the cache.
+    misses : int
+        Number of lookups that parsed the metadata.
+    waits : int
+        Number of lookups that waited for a parse started by another thread.
+    evictions : int
+        Number of entries evicted to respect the limits.
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: Optional[int] = None):
+        if max_entries < 1:
+            raise ValueError("The 'max_entries' must be greater or equal than 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("The 'max_bytes' must be greater or equal than 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, Tuple], Tuple[Tuple, ServiceInfo, int]]" = \
+            OrderedDict()
+        self._in_flight: Dict[Tuple[Tuple[str, Tuple], Tuple], _InFlight] = {}
+        self._bytes = 0
+
+    def get_or_parse(self, path: str, parse: Callable[[], ServiceInfo],
+                     options: Tuple[Any, ...] = ()) -> ServiceInfo:
+        """Return the cached service of a metadata path, parsing it on a miss.
+
+        If another thread is already parsing the same version of the file with the same
+        options, this call waits for it and returns its result (or raises its error).
+
+        Parameters
+        ----------
+        path : str
+            Path of the metadata file or directory, as resolved by ``_find_path``.
+        parse : Callable[[], ServiceInfo]
+            Function parsing the metadata, called on a miss.
+        options : Tuple[Any, ...], default=()
+            Hashable reader options that change the result, such as ``lazy`` or the
+            ``LoadLimits``, so services parsed with other options are cached separately.
+
+        Returns
+        -------
+        ServiceInfo
+            The cached or freshly parsed service.
+        """
+        real_path = os.path.realpath(path)
+        key = (real_path, options)
+        # stat the resolved path, so every spelling of a file has the same signature
+        signature = stat_signature(real_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            flight = self._in_flight.get((key, signature))
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[(key, signature)] = _InFlight()
+                self.misses += 1
+            else:
+                self.waits += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = parse()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[(key, signature)]
+                if flight.error is None:
+                    self._store(key, signature, flight.result)
+            flight.done.set()
+        return flight.result
+
+    def _store(self, key: Tuple[str, Tuple], signature: Tuple, service_info: ServiceInfo) -> None:
+        """Add an entry and evict the least recently used ones. Requires the lock."""
+        self._discard(key)
+        size = sum(file_size for _, _, file_size in signature)
+        self._entries[key] = (signature, service_info, size)
+        self._bytes += size
+        while self._entries and (len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes)):
+            self._discard(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _discard(self, key: Tuple[str, Tuple]) -> bool:
+        """Remove an entry if present. Requires the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[2]
+        return True
+
+    def invalidate(self, path: str) -> bool:
+        """Remove the entries of a metadata path, whatever their options.
+
+        Parameters
+        ----------
+        path : str
+            Path of the metadata file or directory.
+
+        Returns
+        -------
+        bool
+            True if an entry was removed.
+        """
+        real_path = os.path.realpath(path)
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == real_path]
+            for key in keys:
+                self._discard(key)
+            return bool(keys)
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return the cache statistics.
+
+        Returns
+        -------
+        Dict[str, int]
+            Hits, misses, waits, evictions, current entries and bytes.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "waits": self.waits,
+                    "evictions": self.evictions, "entries": len(self._entries),
+                    "bytes": self._bytes}
+
+
+shared_metadata_cache = ServiceMetadataCache()
@@ -0,0 +1,88 @@
+"""
+Module providing ``add_slots``, a class decorator giving dataclasses a ``__slots__`` layout.
+
+Slotted instances store their fields in fixed slots instead of a per-instance
+``__dict__``, which makes every schema object noticeably smaller when whole fleets are
+loaded in memory. ``@dataclass(slots=True)`` is only available since Python 3.10 and
+breaks the zero-argument ``super()`` of the class methods, so this decorator does the
+same for every supported version and rebinds those references to the new class.
+"""
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Iterator, Optional, Tuple, Type, TypeVar, Union
+
+T = TypeVar("T")
+
+
+def _slot_names(cls: type) -> Iterator[str]:
+    """Yield the slot names declared by a class and its bases."""
+    for base in cls.__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        yield from (slots,) if isinstance(slots, str) else slots
+
+
+def _functions_of(value: Any) -> Iterator[Any]:
+    """Yield the plain functions behind a class attribute."""
+    if isinstance(value, (classmethod, staticmethod)):
+        value = value.__func__
+    if isinstance(value, property):
+        yield from (f for f in (value.fget, value.fset, value.fdel) if f is not None)
+    elif hasattr(value, "__code__"):
+        yield value
+
+
+def add_slots(cls: Optional[Type[T]] = None, *,
+              extra_slots: Tuple[str, ...] = ()) -> Union[Type[T], Callable[[Type[T]], Type[T]]]:
+    """Recreate a dataclass with ``__slots__`` for the fields it declares.
+
+    Fields already stored in the slots of a base class are not declared again. Every
+    base must also use ``__slots__`` (an empty one is enough), otherwise the instances
+    would still get a ``__dict__``. It can be used as ``@add_slots`` or, to declare
+    extra slots, as ``@add_slots(extra_slots=(...))``.
+
+    Parameters
+    ----------
+    cls : type, optional
+        A class already processed by ``@dataclass``.
+    extra_slots : Tuple[str, ...], default=()
+        Slots for private state that is not a field, such as caches. They are not
+        compared, shown in the repr nor passed to ``__init__``.
+
+    Returns
+    -------
+    type
+        The slotted class, or a decorator when ``cls`` is not given.
+
+    Raises
+    ------
+    TypeError
+        If the class is not a dataclass or already defines ``__slots__``.
+    """
+    if cls is None:
+        return lambda wrapped: add_slots(wrapped, extra_slots=extra_slots)
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} must be a dataclass to add slots")
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already specifies __slots__")
+
+    inherited = set(_slot_names(cls))
+    own = tuple(f.name for f in fields(cls) if f.name not in inherited) + tuple(extra_slots)
+    cls_dict = dict(cls.__dict__)
+    for name in own:
+        cls_dict.pop(name, None)  # the defaults live in the generated __init__
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__slots__"] = own
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+
+    # Rebind the ``__class__`` cell used by zero-argument ``super()``
+    for value in cls_dict.values():
+        for function in _functions_of(value):
+            for cell in function.__closure__ or ():
+                try:
+                    if cell.cell_contents is cls:
+                        cell.cell_contents = slotted
+                except ValueError:  # empty cell
+                    continue
+    return slotted
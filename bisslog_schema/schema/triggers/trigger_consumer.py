@@ -4,12 +4,15 @@ from typing import Optional, Dict, Any
 
 from .trigger_mappable import TriggerMappable
 from .trigger_options import TriggerOptions
+from ..intern_table import intern_object
+from ..slots import add_slots
 from ...schema.enums.event_delivery_semantic import EventDeliverySemantic
 from ...commands.analyze_metadata_file.metadata_analysis_report import MetadataAnalysisReport
 
 expected_keys = ("event", "context")
 
 
+@add_slots
 @dataclass
 class TriggerConsumer(TriggerOptions, TriggerMappable):
     """Options for configuring a consumer trigger (e.g., queue consumer).
@@ -124,7 +127,7 @@ class TriggerConsumer(TriggerOptions, TriggerMappable):
         mapper: Optional[Dict[str, str]] = data.get("mapper")
         cls.verify_source_prefix(mapper, expected_keys)
 
-        return cls(
+        return intern_object(cls(
             queue=cls._validate_required_str_field("queue", data.get("queue")),
             partition=cls._validate_optional_str_field("partition", data.get("partition")),
             delivery_semantic=cls._validate_delivery_semantic(data.get("delivery_semantic")),
@@ -134,4 +137,4 @@ class TriggerConsumer(TriggerOptions, TriggerMappable):
                 "dead_letter_queue", data.get("dead_letter_queue")),
             batch_size=cls._validate_optional_int_field("batch_size", data.get("batch_size"), 0),
             mapper=mapper,
-        )
+        ), share=True)
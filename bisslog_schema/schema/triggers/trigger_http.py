@@ -5,11 +5,14 @@ from typing import Optional, Dict, Any, List, Union
 
 from .trigger_mappable import TriggerMappable
 from .trigger_options import TriggerOptions
+from ..intern_table import intern_object
+from ..slots import add_slots
 from ...commands.analyze_metadata_file.metadata_analysis_report import MetadataAnalysisReport
 
 expected_keys = ("path_query", "body", "params", "headers", "context")
 
 
+@add_slots
 @dataclass
 class TriggerHttp(TriggerOptions, TriggerMappable):
     """Options for configuring an HTTP trigger.
@@ -111,7 +114,7 @@ class TriggerHttp(TriggerOptions, TriggerMappable):
             An instance of TriggerHttp.
         """
         mapper = cls.verify_source_prefix(data.get("mapper"), expected_keys)
-        return cls(
+        return intern_object(cls(
             method=cls._validate_required_str_field(
                 "method", data.get("method", "GET")).upper(),
             authenticator=data.get("authenticator"),
@@ -125,7 +128,7 @@ class TriggerHttp(TriggerOptions, TriggerMappable):
             rate_limit=cls._validate_rate_limit(data.get("rate_limit")),
             retry_policy=cls._validate_optional_str_field("retry_policy", data.get("retry_policy")),
             mapper=mapper,
-        )
+        ), share=True)
     @staticmethod
     def _validate_allowed_origins(allowed_origins: Optional[Any]) -> Optional[List[str]]:
         if allowed_origins is None:
@@ -134,7 +137,7 @@ class TriggerHttp(TriggerOptions, TriggerMappable):
         if isinstance(allowed_origins, str):
             return [origin.strip() for origin in allowed_origins.split(",")]
 
-        if (not isinstance(allowed_origins, list) or
+        if (not isinstance(allowed_origins, (list, tuple)) or
                 not all(isinstance(item, str) for item in allowed_origins)):
             raise TypeError("The 'allowed_origins' field must be a list of strings.")
 
@@ -2,12 +2,15 @@
 from dataclasses import dataclass
 from typing import Dict, Any, Union, Optional
 
-from ..base_obj_schema import BaseObjSchema
+from ..base_obj_schema import BaseObjSchema, MAPPING_TYPES
 from ...commands.analyze_metadata_file.metadata_analysis_report import MetadataAnalysisReport
 from ..enums.trigger_type import TriggerEnum
+from ..intern_table import intern_object
+from ..slots import add_slots
 from .trigger_options import TriggerOptions
 
 
+@add_slots
 @dataclass
 class TriggerInfo(BaseObjSchema):
     """Represents a complete trigger configuration including its type and specific options.
@@ -56,14 +59,14 @@ class TriggerInfo(BaseObjSchema):
 
 
         if (trigger_type is not None and isinstance(trigger_type, TriggerEnum)
-                and isinstance(options, dict)):
+                and isinstance(options, MAPPING_TYPES)):
             try:
                 options = trigger_type.cls.from_dict(options)
             except Exception as e:
                 raise ValueError("Error parsing options for trigger"
                                  f" type '{trigger_type}': {e}") from e
 
-        return TriggerInfo(type=trigger_type, options=options, keyname=key_name)
+        return intern_object(TriggerInfo(type=trigger_type, options=options, keyname=key_name))
 
     @classmethod
     def analyze(cls, data: Dict[str, Any], use_case_name: str,
@@ -139,7 +142,7 @@ class TriggerInfo(BaseObjSchema):
         options = data_validated.get("options")
 
         if (trigger_type is not None and isinstance(trigger_type, TriggerEnum)
-                and isinstance(options, dict)):
+                and isinstance(options, MAPPING_TYPES)):
             sub_reports["options"] = [
                 trigger_type.cls.analyze(options, keyname, use_case_name)
             ]
@@ -195,7 +198,7 @@ class TriggerInfo(BaseObjSchema):
         ValueError
             If there is an error parsing the options for the trigger type.
         """
-        if not isinstance(options, (dict, TriggerOptions)):
+        if not isinstance(options, (*MAPPING_TYPES, TriggerOptions)):
             raise TypeError("The 'options' field must be a dictionary "
                             "or an instance of TriggerOptions.")
         return options
@@ -10,8 +10,10 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Iterable
 
 from ...commands.analyze_metadata_file.metadata_analysis_report import MetadataAnalysisReport
+from ..slots import add_slots
 
 
+@add_slots
 @dataclass
 class TriggerMappable:
     """A class that represents a mapping from external trigger values to internal values.
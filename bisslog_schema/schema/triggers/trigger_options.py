@@ -11,6 +11,8 @@ class TriggerOptions(BaseObjSchema, metaclass=ABCMeta):
 
     All trigger option classes must implement the from_dict method for deserialization."""
 
+    __slots__ = ()
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TriggerOptions":
         """Deserialize a dictionary into a TriggerOptions instance.
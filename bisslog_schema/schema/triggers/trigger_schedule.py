@@ -19,8 +19,11 @@ except ImportError:
         _ZONE_INFO_AVAILABLE = False
 
 from .trigger_options import TriggerOptions
+from ..intern_table import intern_object
+from ..slots import add_slots
 
 
+@add_slots
 @dataclass
 class TriggerSchedule(TriggerOptions):
     """
@@ -188,5 +191,6 @@ class TriggerSchedule(TriggerOptions):
         retry_policy = cls._validate_optional_str_field("retry_policy", data.get("retry_policy"))
         max_attempts = cls._validate_optional_int_field("max_attempts", data.get("max_attempts"), 0)
 
-        return cls(cronjob=cronjob, event=data.get("event"), timezone=timezone,
-                   description=description, retry_policy=retry_policy, max_attempts=max_attempts)
+        return intern_object(cls(
+            cronjob=cronjob, event=data.get("event"), timezone=timezone, description=description,
+            retry_policy=retry_policy, max_attempts=max_attempts), share=True)
@@ -1,14 +1,17 @@
 """Module defining trigger websocket configuration class."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 
 from .trigger_mappable import TriggerMappable
 from .trigger_options import TriggerOptions
+from ..intern_table import intern_object
+from ..slots import add_slots
 from ...commands.analyze_metadata_file.metadata_analysis_report import MetadataAnalysisReport
 
 expected_keys = ("connection_id", "route_key", "body", "headers")
 
 
+@add_slots
 @dataclass
 class TriggerWebsocket(TriggerOptions, TriggerMappable):
     """Options for configuring a WebSocket trigger.
@@ -17,7 +20,7 @@ class TriggerWebsocket(TriggerOptions, TriggerMappable):
     ----------
     route_key : str, optional
         The route key associated with the WebSocket connection."""
-    route_key: Optional[str] = None
+    route_key: Optional[str] = field(default=None, metadata={"key": "routeKey"})
 
     @classmethod
     def analyze(cls, data: Dict[str, Any], trigger_keyname: str,
@@ -67,4 +70,4 @@ class TriggerWebsocket(TriggerOptions, TriggerMappable):
         cls.verify_source_prefix(mapper, expected_keys)
         route_key = cls._validate_required_str_field(
             "route_key", data.get("routeKey") or data.get("route_key"))
-        return cls(route_key=route_key, mapper=mapper)
+        return intern_object(cls(route_key=route_key, mapper=mapper), share=True)
@@ -0,0 +1,105 @@
+"""
+Module providing lookup indexes over the use cases of a service.
+
+Dispatch code resolving a request, a message or a websocket route to its use case
+would otherwise scan every use case and trigger on each lookup. ``UseCaseIndexes``
+walks the use cases once and answers those lookups from dictionaries. It is built
+lazily and cached by ``ServiceInfo``, see ``ServiceInfo.indexes``.
+"""
+from bisect import bisect_left
+from typing import Dict, Hashable, List, Mapping, Optional, Tuple, Union
+
+from .enums.criticality import CriticalityEnum
+from .triggers.trigger_consumer import TriggerConsumer
+from .triggers.trigger_http import TriggerHttp
+from .triggers.trigger_websocket import TriggerWebsocket
+from .use_case_info import UseCaseInfo
+
+
+def _criticality_level(criticality: Union[str, CriticalityEnum, int]) -> int:
+    """Return the integer level of a criticality, given as a member, a name or a level."""
+    if isinstance(criticality, str):
+        # pylint: disable=protected-access
+        criticality = UseCaseInfo._parse_criticality(criticality)
+    return criticality.value if isinstance(criticality, CriticalityEnum) else criticality
+
+
+class UseCaseIndexes:
+    """Lookup indexes over a mapping of use cases.
+
+    When two use cases declare the same HTTP route or websocket route key, the first
+    one is indexed; ``ServiceInfo.analyze`` reports repeated HTTP routes.
+
+    Parameters
+    ----------
+    use_cases : Mapping[str, UseCaseInfo]
+        The use cases to index, keyed by keyname. Lazy mappings are fully built.
+
+    Attributes
+    ----------
+    use_cases : Mapping[str, UseCaseInfo]
+        The indexed mapping, used to detect when the service gets new use cases.
+    """
+
+    def __init__(self, use_cases: Mapping[str, UseCaseInfo]):
+        self.use_cases = use_cases
+        self._routes: Dict[Tuple[str, str], UseCaseInfo] = {}
+        self._queues: Dict[str, List[UseCaseInfo]] = {}
+        self._route_keys: Dict[str, UseCaseInfo] = {}
+        self._actors: Dict[str, List[str]] = {}
+        self._tags: Dict[str, Dict[str, List[str]]] = {}
+        self._criticality: Dict[int, List[str]] = {}
+
+        for keyname, use_case in use_cases.items():
+            for trigger in use_case.triggers:
+                options = trigger.options
+                if isinstance(options, TriggerHttp) and options.path is not None:
+                    self._routes.setdefault(((options.method or "GET").upper(), options.path),
+                                            use_case)
+                elif isinstance(options, TriggerConsumer) and options.queue is not None:
+                    queue_use_cases = self._queues.setdefault(options.queue, [])
+                    if not queue_use_cases or queue_use_cases[-1] is not use_case:
+                        queue_use_cases.append(use_case)
+                elif isinstance(options, TriggerWebsocket) and options.route_key is not None:
+                    self._route_keys.setdefault(options.route_key, use_case)
+            if use_case.actor is not None:
+                self._actors.setdefault(use_case.actor, []).append(keyname)
+            for key, value in (use_case.tags or {}).items():
+                if isinstance(value, Hashable):
+                    self._tags.setdefault(key, {}).setdefault(value, []).append(keyname)
+            if use_case.criticality is not None:
+                self._criticality.setdefault(
+                    _criticality_level(use_case.criticality), []).append(keyname)
+        self._levels = sorted(self._criticality)
+
+    def find_by_route(self, method: str, path: str) -> Optional[UseCaseInfo]:
+        """Return the use case of an HTTP route, matching the declared path template."""
+        return self._routes.get((method.upper(), path))
+
+    def find_by_queue(self, queue: str) -> List[UseCaseInfo]:
+        """Return the use cases consuming a queue."""
+        return list(self._queues.get(queue, ()))
+
+    def find_by_route_key(self, route_key: str) -> Optional[UseCaseInfo]:
+        """Return the use case of a websocket route key."""
+        return self._route_keys.get(route_key)
+
+    def find_by_actor(self, actor: str) -> List[str]:
+        """Return the keynames of the use cases of an actor."""
+        return list(self._actors.get(actor, ()))
+
+    def find_by_tag(self, key: str, value: Optional[str] = None) -> List[str]:
+        """Return the keynames of the use cases with a tag, with any value if not given."""
+        values = self._tags.get(key, {})
+        if value is not None:
+            return list(values.get(value, ()))
+        return [keyname for keynames in values.values() for keyname in keynames]
+
+    def find_by_criticality(self, criticality: Union[str, CriticalityEnum, int],
+                            at_least: bool = False) -> List[str]:
+        """Return the keynames of the use cases with a criticality, or a higher one."""
+        level = _criticality_level(criticality)
+        if not at_least:
+            return list(self._criticality.get(level, ()))
+        return [keyname for found in self._levels[bisect_left(self._levels, level):]
+                for keyname in self._criticality[found]]
@@ -8,12 +8,16 @@ from typing import List, Optional, Union, Any, Dict
 from json import dumps
 
 from ..commands.analyze_metadata_file.metadata_analysis_report import MetadataAnalysisReport
+from .base_obj_schema import MAPPING_TYPES
 from .entity_info import EntityInfo
 from .enums.criticality import CriticalityEnum
 from .external_interaction import ExternalInteraction
+from .intern_table import intern_object
+from .slots import add_slots
 from .triggers.trigger_info import TriggerInfo
 
 
+@add_slots
 @dataclass
 class UseCaseInfo(EntityInfo):
     """
@@ -37,14 +41,18 @@ class UseCaseInfo(EntityInfo):
     external_interactions: List[ExternalInteraction] = field(default_factory=list)
 
     @classmethod
-    def analyze(cls, data: dict) -> MetadataAnalysisReport:
+    def analyze(cls, data: dict, keyname: Optional[str] = None) -> MetadataAnalysisReport:
         """
         Validates the provided data against the UseCaseInfo schema.
 
+        The data is only read, so the same dictionary can be analyzed concurrently.
+
         Parameters
         ----------
         data : dict
             The data to validate.
+        keyname : str, optional
+            Keyname of the use case. Defaults to the 'keyname' field of the data.
 
         Returns
         -------
@@ -57,7 +65,8 @@ class UseCaseInfo(EntityInfo):
             If validation fails.
         """
         metadata_analysis_report = super().analyze(data)
-        keyname = data["keyname"]
+        if keyname is None:
+            keyname = data["keyname"]
 
         # Validate main fields
         validated_data, errors = cls._validate_main_fields(data, data.get("name") or keyname)
@@ -119,14 +128,18 @@ class UseCaseInfo(EntityInfo):
         return sub_reports
 
     @classmethod
-    def from_dict(cls, data: dict) -> "UseCaseInfo":
+    def from_dict(cls, data: dict, keyname: Optional[str] = None) -> "UseCaseInfo":
         """
         Creates a UseCaseInfo instance from a dictionary.
 
+        The data is only read, so the same dictionary can be parsed concurrently.
+
         Parameters
         ----------
         data : dict
             Dictionary containing use case information.
+        keyname : str, optional
+            Keyname of the use case. Defaults to the 'keyname' field of the data.
 
         Returns
         -------
@@ -144,8 +157,8 @@ class UseCaseInfo(EntityInfo):
             data.get("external_interactions", [])
         )
 
-        return cls(
-            keyname=data["keyname"],
+        return intern_object(cls(
+            keyname=data["keyname"] if keyname is None else keyname,
             name=cls._validate_required_str_field("name", data.get("name")),
             description=cls._validate_description(data.get("description")),
             type=cls._validate_type(data.get("type")),
@@ -154,7 +167,7 @@ class UseCaseInfo(EntityInfo):
             external_interactions=external_interactions,
             criticality=criticality,
             actor=cls._validate_optional_str_field("actor", data.get("actor")),
-        )
+        ))
 
     @classmethod
     def _validate_triggers(cls, triggers: Any) -> list:
@@ -179,7 +192,7 @@ class UseCaseInfo(EntityInfo):
         if not isinstance(triggers, (list, tuple)):
             raise ValueError("The 'triggers' field must be a list.")
         for trigger in triggers:
-            if not isinstance(trigger, dict):
+            if not isinstance(trigger, MAPPING_TYPES):
                 raise ValueError("Each trigger must be a dictionary.")
         return triggers
 
@@ -231,16 +244,16 @@ class UseCaseInfo(EntityInfo):
             return None
         if isinstance(external_interactions_data, (list, tuple)):
             for ei_data in external_interactions_data:
-                if not isinstance(ei_data, dict):
+                if not isinstance(ei_data, MAPPING_TYPES):
                     raise ValueError("Each external interaction must be a dictionary.")
             external_interactions = external_interactions_data
-        elif isinstance(external_interactions_data, dict):
+        elif isinstance(external_interactions_data, MAPPING_TYPES):
             external_interactions = []
             for key, ei_data in external_interactions_data.items():
-                if not isinstance(ei_data, dict):
+                if not isinstance(ei_data, MAPPING_TYPES):
                     raise ValueError("Each external interaction must be a dictionary.")
-                ei_data["keyname"] = key
-                external_interactions.append(ei_data)
+                # a keyed copy, the caller's data is left untouched
+                external_interactions.append({**ei_data, "keyname": key})
         else:
             raise ValueError("Invalid external interactions data -> "
                              f"{dumps(external_interactions_data)}")
@@ -256,7 +269,7 @@ class UseCaseInfo(EntityInfo):
             return []
 
         new_ext_interactions_parsed = []
-        for ei_data in external_interactions_data:
+        for ei_data in ext_interactions:
             try:
                 new_ext_interactions_parsed.append(ExternalInteraction.from_dict(ei_data))
             except Exception as e:
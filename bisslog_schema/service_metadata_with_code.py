@@ -16,6 +16,7 @@ ServiceInfoWithCode
 from dataclasses import dataclass
 from typing import Dict, Union, Callable, Any
 
+from .schema.frozen import FrozenDict, frozen_class
 from .schema.service_info import ServiceInfo
 from .use_case_code_inspector.use_case_code_metadata import UseCaseCodeInfo
 
@@ -31,8 +32,23 @@ class ServiceInfoWithCode:
     ----------
     declared_metadata : ServiceInfo
         The service information provided explicitly by the user (e.g., via a YAML or JSON spec).
+        It may be a frozen snapshot, see ``ServiceInfo.freeze``.
     discovered_use_cases : Dict[str, UseCaseCodeInfo]
         Use cases detected from the source code implementation.
     """
     declared_metadata: ServiceInfo
     discovered_use_cases: Dict[str, Union[UseCaseCodeInfo, Callable[..., Any]]]
+
+    def freeze(self) -> "ServiceInfoWithCode":
+        """Return an immutable, hashable snapshot carrying the frozen declared metadata.
+
+        The discovered use cases become a ``FrozenDict``; the code metadata is already
+        immutable and the use case objects themselves are kept as they are.
+
+        Returns
+        -------
+        ServiceInfoWithCode
+            An instance of the frozen variant of this class.
+        """
+        return frozen_class(type(self))(self.declared_metadata.freeze(),
+                                        FrozenDict(self.discovered_use_cases))
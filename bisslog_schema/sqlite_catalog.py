@@ -0,0 +1,611 @@
+"""
+Module for indexing the metadata of a fleet of services in a local SQLite database.
+
+Services, use cases, triggers and external interactions are written to normalized
+tables, indexed by HTTP route, queue, team, tags and criticality, so questions like
+"which services consume this queue" are answered by a query instead of re-reading
+every metadata file. Each service stores the hash of its metadata, and ``sync`` only
+parses and rewrites the services whose files changed.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional
+
+from .fleet_metadata_reader import discover_metadata_files
+from .schema.python_artifact import source_hash
+from .schema.read_metadata import read_service_metadata
+from .schema.service_info import ServiceInfo
+from .schema.triggers.trigger_consumer import TriggerConsumer
+from .schema.triggers.trigger_http import TriggerHttp
+from .schema.triggers.trigger_schedule import TriggerSchedule
+from .schema.triggers.trigger_websocket import TriggerWebsocket
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS services (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT,
+    type TEXT,
+    service_type TEXT,
+    team TEXT,
+    source_path TEXT,
+    content_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS service_tags (
+    service_id INTEGER NOT NULL REFERENCES services(id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS use_cases (
+    id INTEGER PRIMARY KEY,
+    service_id INTEGER NOT NULL REFERENCES services(id) ON DELETE CASCADE,
+    keyname TEXT NOT NULL,
+    name TEXT,
+    description TEXT,
+    type TEXT,
+    actor TEXT,
+    criticality INTEGER,
+    UNIQUE (service_id, keyname)
+);
+CREATE TABLE IF NOT EXISTS use_case_tags (
+    use_case_id INTEGER NOT NULL REFERENCES use_cases(id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS triggers (
+    id INTEGER PRIMARY KEY,
+    use_case_id INTEGER NOT NULL REFERENCES use_cases(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    keyname TEXT,
+    type TEXT,
+    method TEXT,
+    path TEXT,
+    queue TEXT,
+    route_key TEXT,
+    cronjob TEXT,
+    options TEXT
+);
+CREATE TABLE IF NOT EXISTS external_interactions (
+    id INTEGER PRIMARY KEY,
+    use_case_id INTEGER NOT NULL REFERENCES use_cases(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    keyname TEXT NOT NULL,
+    type_interaction TEXT,
+    type_interaction_standard TEXT,
+    operation TEXT,
+    description TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_services_team ON services(team);
+CREATE INDEX IF NOT EXISTS idx_services_source_path ON services(source_path);
+CREATE INDEX IF NOT EXISTS idx_service_tags ON service_tags(key, value);
+CREATE INDEX IF NOT EXISTS idx_service_tags_service ON service_tags(service_id);
+CREATE INDEX IF NOT EXISTS idx_use_cases_criticality ON use_cases(criticality);
+CREATE INDEX IF NOT EXISTS idx_use_case_tags ON use_case_tags(key, value);
+CREATE INDEX IF NOT EXISTS idx_use_case_tags_use_case ON use_case_tags(use_case_id);
+CREATE INDEX IF NOT EXISTS idx_triggers_route ON triggers(path, method);
+CREATE INDEX IF NOT EXISTS idx_triggers_queue ON triggers(queue);
+CREATE INDEX IF NOT EXISTS idx_triggers_use_case ON triggers(use_case_id);
+CREATE INDEX IF NOT EXISTS idx_external_interactions_keyname
+    ON external_interactions(keyname);
+CREATE INDEX IF NOT EXISTS idx_external_interactions_use_case
+    ON external_interactions(use_case_id);
+"""
+
+_USE_CASE_QUERY = """
+SELECT s.name, s.team, u.keyname, u.name, u.criticality
+FROM use_cases u JOIN services s ON s.id = u.service_id
+"""
+
+
+def _enum_value(member: Enum) -> Any:
+    """Return the identifier of an enum member as written in the metadata."""
+    for attribute in ("val", "main_identifier"):
+        if hasattr(member, attribute):
+            return getattr(member, attribute)
+    return member.value
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize enums by identifier and any other object by its string."""
+    if isinstance(value, Enum):
+        return _enum_value(value)
+    return str(value)
+
+
+def _to_json(value: Any) -> Optional[str]:
+    """Dump a value as JSON, None stays NULL."""
+    if value is None:
+        return None
+    return json.dumps(value, sort_keys=True, default=_json_default)
+
+
+def _tag_value(value: Any) -> Any:
+    """Return a tag value as stored: scalars as they are, other values as JSON."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return _to_json(value)
+
+
+def service_content_hash(service_info: ServiceInfo) -> str:
+    """Return the SHA-256 of the content of a service.
+
+    Parameters
+    ----------
+    service_info : ServiceInfo
+        The service.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest.
+    """
+    return hashlib.sha256(_to_json(asdict(service_info)).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CatalogUseCase:
+    """A use case found by a catalog query.
+
+    Attributes
+    ----------
+    service : str
+        Name of the service.
+    team : Optional[str]
+        Team owning the service.
+    keyname : str
+        Keyname of the use case.
+    name : Optional[str]
+        Name of the use case.
+    criticality : Optional[int]
+        Criticality level of the use case, see ``CriticalityEnum``.
+    """
+    service: str
+    team: Optional[str]
+    keyname: str
+    name: Optional[str]
+    criticality: Optional[int]
+
+
+@dataclass
+class CatalogSyncResult:
+    """Summary of a ``SQLiteCatalog.sync`` run.
+
+    Attributes
+    ----------
+    inserted : List[str]
+        Paths of the services added to the catalog.
+    updated : List[str]
+        Paths of the services whose metadata changed.
+    unchanged : List[str]
+        Paths skipped because their hash did not change.
+    removed : List[str]
+        Names of the services removed because their metadata is gone.
+    failures : Dict[str, str]
+        Error description of each file that could not be loaded, keyed by path.
+    """
+    inserted: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    failures: Dict[str, str] = field(default_factory=dict)
+
+
+class SQLiteCatalog:
+    """Local SQLite index of service metadata with incremental upsert.
+
+    Parameters
+    ----------
+    path : str, default=":memory:"
+        Path of the database file. The tables are created if missing.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(_SCHEMA)
+        self._in_transaction = False
+        self._savepoints = 0
+
+    @contextmanager
+    def _transaction(self):
+        """Commit on exit, or open a savepoint in the transaction of the caller.
+
+        A failure inside a nested block only rolls back the writes of that block, so
+        the caller can record it and go on.
+        """
+        if self._in_transaction:
+            self._savepoints += 1
+            name = f"sp_{self._savepoints}"
+            self._connection.execute(f"SAVEPOINT {name}")
+            try:
+                yield
+            except BaseException:
+                self._connection.execute(f"ROLLBACK TO {name}")
+                raise
+            finally:
+                self._connection.execute(f"RELEASE {name}")
+            return
+        self._in_transaction = True
+        try:
+            with self._connection:
+                # begun explicitly, so that savepoints never become the outer transaction
+                self._connection.execute("BEGIN")
+                yield
+        finally:
+            self._in_transaction = False
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> "SQLiteCatalog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM services").fetchone()[0]
+
+    def __contains__(self, service_name: object) -> bool:
+        return isinstance(service_name, str) and self.content_hash(service_name) is not None
+
+    def content_hash(self, service_name: str) -> Optional[str]:
+        """Return the stored content hash of a service.
+
+        Parameters
+        ----------
+        service_name : str
+            Name of the service.
+
+        Returns
+        -------
+        Optional[str]
+            The hash, or None if the service is not in the catalog.
+        """
+        row = self._connection.execute(
+            "SELECT content_hash FROM services WHERE name = ?", (service_name,)).fetchone()
+        return row[0] if row else None
+
+    def upsert(self, service_info: ServiceInfo, content_hash: Optional[str] = None,
+               source_path: Optional[str] = None) -> bool:
+        """Insert or replace a service, unless its content hash did not change.
+
+        Parameters
+        ----------
+        service_info : ServiceInfo
+            The service to store.
+        content_hash : Optional[str], default=None
+            Hash identifying the content. Defaults to ``service_content_hash``.
+        source_path : Optional[str], default=None
+            Path of the metadata the service was read from.
+
+        Returns
+        -------
+        bool
+            True if the service was written, False if it was already up to date.
+        """
+        if content_hash is None:
+            content_hash = service_content_hash(service_info)
+        if self.content_hash(service_info.name) == content_hash:
+            return False
+        with self._transaction():
+            self._connection.execute("DELETE FROM services WHERE name = ?",
+                                     (service_info.name,))
+            if source_path is not None:
+                self._connection.execute("DELETE FROM services WHERE source_path = ?",
+                                         (source_path,))
+            self._insert_service(service_info, content_hash, source_path)
+        return True
+
+    def _insert_service(self, service_info: ServiceInfo, content_hash: str,
+                        source_path: Optional[str]) -> None:
+        """Write the rows of a service. Requires an open transaction.
+
+        The content hash is written last, once every row of the service is inserted.
+        """
+        execute = self._connection.execute
+        service_id = execute(
+            "INSERT INTO services (name, description, type, service_type, team, source_path, "
+            "content_hash) VALUES (?, ?, ?, ?, ?, ?, '')",
+            (service_info.name, service_info.description, service_info.type,
+             service_info.service_type, service_info.team, source_path)).lastrowid
+        self._connection.executemany(
+            "INSERT INTO service_tags (service_id, key, value) VALUES (?, ?, ?)",
+            [(service_id, key, _tag_value(value))
+             for key, value in (service_info.tags or {}).items()])
+
+        for keyname, use_case in service_info.use_cases.items():
+            criticality = use_case.criticality
+            use_case_id = execute(
+                "INSERT INTO use_cases (service_id, keyname, name, description, type, actor, "
+                "criticality) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (service_id, keyname, use_case.name, use_case.description, use_case.type,
+                 use_case.actor,
+                 criticality.value if isinstance(criticality, Enum) else criticality)).lastrowid
+            self._connection.executemany(
+                "INSERT INTO use_case_tags (use_case_id, key, value) VALUES (?, ?, ?)",
+                [(use_case_id, key, _tag_value(value))
+                 for key, value in (use_case.tags or {}).items()])
+            self._connection.executemany(
+                "INSERT INTO triggers (use_case_id, position, keyname, type, method, path, "
+                "queue, route_key, cronjob, options) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(use_case_id, position, *self._trigger_row(trigger))
+                 for position, trigger in enumerate(use_case.triggers)])
+            self._connection.executemany(
+                "INSERT INTO external_interactions (use_case_id, position, keyname, "
+                "type_interaction, type_interaction_standard, operation, description) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(use_case_id, position, interaction.keyname, interaction.type_interaction,
+                  _enum_value(interaction.type_interaction_standard)
+                  if interaction.type_interaction_standard is not None else None,
+                  _to_json(interaction.operation), interaction.description)
+                 for position, interaction in enumerate(use_case.external_interactions)])
+        execute("UPDATE services SET content_hash = ? WHERE id = ?", (content_hash, service_id))
+
+    @staticmethod
+    def _trigger_row(trigger) -> tuple:
+        """Return the keyname, type, method, path, queue, route key, cronjob and options."""
+        options = trigger.options
+        method = path = queue = route_key = cronjob = None
+        if isinstance(options, TriggerHttp):
+            method, path = (options.method or "GET").upper(), options.path
+        elif isinstance(options, TriggerConsumer):
+            queue = options.queue
+        elif isinstance(options, TriggerWebsocket):
+            route_key = options.route_key
+        elif isinstance(options, TriggerSchedule):
+            cronjob = options.cronjob
+        trigger_type = trigger.type
+        return (trigger.keyname,
+                _enum_value(trigger_type) if isinstance(trigger_type, Enum) else trigger_type,
+                method, path, queue, route_key, cronjob,
+                _to_json(options if isinstance(options, dict) else {
+                    option.name: getattr(options, option.name) for option in fields(options)
+                    if getattr(options, option.name) is not None}))
+
+    def upsert_file(self, path: str, encoding: str = "utf-8") -> Optional[bool]:
+        """Insert or replace the service of a metadata file if the file changed.
+
+        The file is hashed first, and only parsed when the hash differs from the
+        stored one.
+
+        Parameters
+        ----------
+        path : str
+            Path of the metadata file or ``metadata.d/`` directory.
+        encoding : str, default="utf-8"
+            The file encoding to use when reading the file.
+
+        Returns
+        -------
+        Optional[bool]
+            None if the service was not in the catalog, True if it was updated and
+            False if it was unchanged.
+
+        Raises
+        ------
+        ValueError
+            If the metadata is invalid or its service name is used by another file.
+        """
+        source_path = os.path.realpath(path)
+        digest = source_hash(path)
+        row = self._connection.execute(
+            "SELECT content_hash FROM services WHERE source_path = ?",
+            (source_path,)).fetchone()
+        if row is not None and row[0] == digest:
+            return False
+        service_info = read_service_metadata(path, encoding, executor="thread")
+        owner = self._connection.execute(
+            "SELECT source_path FROM services WHERE name = ?", (service_info.name,)).fetchone()
+        if owner is not None and owner[0] not in (None, source_path) and os.path.exists(owner[0]):
+            raise ValueError(f"Service name '{service_info.name}' is already defined in "
+                             f"{owner[0]}")
+        self.upsert(service_info, digest, source_path)
+        return None if row is None else True
+
+    def remove(self, service_name: str) -> bool:
+        """Remove a service with all its use cases.
+
+        Parameters
+        ----------
+        service_name : str
+            Name of the service.
+
+        Returns
+        -------
+        bool
+            True if the service was in the catalog.
+        """
+        with self._transaction():
+            return self._connection.execute(
+                "DELETE FROM services WHERE name = ?", (service_name,)).rowcount > 0
+
+    def sync(self, root_or_glob: str, *, encoding: str = "utf-8",
+             prune: bool = True) -> CatalogSyncResult:
+        """Bring the catalog up to date with the metadata files of a fleet.
+
+        Parameters
+        ----------
+        root_or_glob : str
+            Root directory of the fleet or glob pattern, see ``discover_metadata_files``.
+        encoding : str, default="utf-8"
+            The file encoding to use when reading the files.
+        prune : bool, default=True
+            If True, the services read from a metadata path that this sync did not find
+            are removed. Services upserted without a source path are kept.
+
+        Returns
+        -------
+        CatalogSyncResult
+            The inserted, updated, unchanged and removed services and the failures.
+        """
+        with self._transaction():
+            return self._sync(root_or_glob, encoding, prune)
+
+    def _sync(self, root_or_glob: str, encoding: str, prune: bool) -> CatalogSyncResult:
+        """Sync the catalog inside a single transaction.
+
+        Each file is written in its own savepoint, so a file failing halfway leaves
+        no rows and no new content hash behind, and is retried by the next sync.
+        """
+        result = CatalogSyncResult()
+        seen = set()
+        for path in discover_metadata_files(root_or_glob):
+            seen.add(os.path.realpath(path))
+            try:
+                with self._transaction():
+                    changed = self.upsert_file(path, encoding)
+            except Exception as e:  # pylint: disable=broad-except
+                result.failures[path] = f"{type(e).__name__}: {e}"
+                continue
+            if changed is None:
+                result.inserted.append(path)
+            elif changed:
+                result.updated.append(path)
+            else:
+                result.unchanged.append(path)
+
+        if prune:
+            rows = self._connection.execute(
+                "SELECT name, source_path FROM services WHERE source_path IS NOT NULL"
+            ).fetchall()
+            for name, source_path in rows:
+                if source_path not in seen and self.remove(name):
+                    result.removed.append(name)
+        return result
+
+    def _use_cases(self, where: str, parameters: tuple) -> List[CatalogUseCase]:
+        """Run a use case query."""
+        rows = self._connection.execute(
+            f"{_USE_CASE_QUERY} WHERE {where} ORDER BY s.name, u.keyname", parameters)
+        return [CatalogUseCase(*row) for row in rows]
+
+    def find_by_queue(self, queue: str) -> List[CatalogUseCase]:
+        """Return the use cases consuming from a queue.
+
+        Parameters
+        ----------
+        queue : str
+            Name of the queue.
+
+        Returns
+        -------
+        List[CatalogUseCase]
+            The matching use cases.
+        """
+        return self._use_cases(
+            "u.id IN (SELECT use_case_id FROM triggers WHERE queue = ?)", (queue,))
+
+    def find_by_route(self, method: Optional[str], path: str) -> List[CatalogUseCase]:
+        """Return the use cases triggered by an HTTP route.
+
+        Parameters
+        ----------
+        method : Optional[str]
+            HTTP method. None matches any method.
+        path : str
+            Route path as declared in the metadata.
+
+        Returns
+        -------
+        List[CatalogUseCase]
+            The matching use cases.
+        """
+        if method is None:
+            return self._use_cases(
+                "u.id IN (SELECT use_case_id FROM triggers WHERE path = ?)", (path,))
+        return self._use_cases(
+            "u.id IN (SELECT use_case_id FROM triggers WHERE path = ? AND method = ?)",
+            (path, method.upper()))
+
+    def find_by_external_interaction(self, keyname: str) -> List[CatalogUseCase]:
+        """Return the use cases interacting with an external component.
+
+        Parameters
+        ----------
+        keyname : str
+            Keyname of the external interaction, e.g. a database.
+
+        Returns
+        -------
+        List[CatalogUseCase]
+            The matching use cases.
+        """
+        return self._use_cases(
+            "u.id IN (SELECT use_case_id FROM external_interactions WHERE keyname = ?)",
+            (keyname,))
+
+    def find_by_tag(self, key: str, value: Optional[str] = None) -> List[CatalogUseCase]:
+        """Return the use cases tagged with a key, on the use case or its service.
+
+        Parameters
+        ----------
+        key : str
+            Tag key.
+        value : Optional[str], default=None
+            Tag value. None matches any value. Lists and mappings are stored as JSON
+            with sorted keys, e.g. ``'["a", "b"]'``.
+
+        Returns
+        -------
+        List[CatalogUseCase]
+            The matching use cases.
+        """
+        condition = "key = ?" if value is None else "key = ? AND value = ?"
+        parameters = (key,) if value is None else (key, value)
+        return self._use_cases(
+            f"u.id IN (SELECT use_case_id FROM use_case_tags WHERE {condition}) OR "
+            f"s.id IN (SELECT service_id FROM service_tags WHERE {condition})",
+            parameters * 2)
+
+    def find_by_criticality(self, minimum: int) -> List[CatalogUseCase]:
+        """Return the use cases with at least a criticality level.
+
+        Parameters
+        ----------
+        minimum : int
+            Minimum criticality level, e.g. ``CriticalityEnum.HIGH.value``.
+
+        Returns
+        -------
+        List[CatalogUseCase]
+            The matching use cases.
+        """
+        return self._use_cases("u.criticality >= ?", (minimum,))
+
+    def services_by_team(self, team: str) -> List[str]:
+        """Return the names of the services owned by a team.
+
+        Parameters
+        ----------
+        team : str
+            Name of the team.
+
+        Returns
+        -------
+        List[str]
+            Sorted service names.
+        """
+        return [name for name, in self._connection.execute(
+            "SELECT name FROM services WHERE team = ? ORDER BY name", (team,))]
+
+    def iter_services(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the service rows.
+
+        Yields
+        ------
+        Dict[str, Any]
+            Name, team, source path and content hash of each service, by name.
+        """
+        rows = self._connection.execute(
+            "SELECT name, team, source_path, content_hash FROM services ORDER BY name")
+        for name, team, source_path, content_hash in rows:
+            yield {"name": name, "team": team, "source_path": source_path,
+                   "content_hash": content_hash}
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from bisslog_schema import (aread_service_metadata, aread_full_service_metadata,
+                            aread_many_service_metadata, read_service_metadata)
+from bisslog_schema.service_metadata_with_code import ServiceInfoWithCode
+
+
+def test_aread_service_metadata():
+    service_info = asyncio.run(aread_service_metadata("examples/webhook.yml"))
+
+    assert service_info == read_service_metadata("examples/webhook.yml")
+
+
+def test_aread_full_service_metadata(tmp_path):
+    metadata = tmp_path / "metadata.yml"
+    metadata.write_text("name: sample\nuse_cases:\n  use_case_1:\n    name: one\n"
+                        "  use_case_2:\n    name: two\n", encoding="utf-8")
+
+    result = asyncio.run(aread_full_service_metadata(
+        str(metadata), "tests/integration/data/use_cases_sample"))
+
+    assert isinstance(result, ServiceInfoWithCode)
+    assert set(result.declared_metadata.use_cases) == {"use_case_1", "use_case_2"}
+    assert set(result.discovered_use_cases) == {"use_case_1", "use_case_2"}
+
+
+def test_aread_many_respects_concurrency_limit():
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def slow_read(path, *_args, **_kwargs):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return path
+
+    with patch("bisslog_schema.async_metadata_reader.read_service_metadata", slow_read):
+        result = asyncio.run(aread_many_service_metadata(
+            [f"path-{i}" for i in range(10)], max_concurrency=3))
+
+    assert result == [f"path-{i}" for i in range(10)]
+    assert max_running <= 3
+
+
+def test_aread_many_invalid_concurrency():
+    with pytest.raises(ValueError, match="max_concurrency"):
+        asyncio.run(aread_many_service_metadata([], max_concurrency=0))
+
+
+def test_aread_service_metadata_cancellation():
+    release = threading.Event()
+
+    def blocking_read(*_args, **_kwargs):
+        release.wait(5)
+
+    async def main():
+        limiter = asyncio.Semaphore(1)
+        task = asyncio.ensure_future(aread_service_metadata("x", limiter=limiter))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # the read is still running in its worker thread and keeps its slot
+        held_while_running = limiter.locked()
+        release.set()
+        await asyncio.wait_for(limiter.acquire(), 5)
+        return held_while_running
+
+    with patch("bisslog_schema.async_metadata_reader.read_service_metadata", blocking_read):
+        assert asyncio.run(main()) is True
+
+
+def test_cancelled_before_start_releases_the_limiter():
+    calls = []
+
+    async def main():
+        limiter = asyncio.Semaphore(1)
+        await limiter.acquire()
+        task = asyncio.ensure_future(aread_service_metadata("x", limiter=limiter))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        limiter.release()
+        await asyncio.wait_for(limiter.acquire(), 1)
+
+    with patch("bisslog_schema.async_metadata_reader.read_service_metadata",
+               lambda *args, **kwargs: calls.append(args)):
+        asyncio.run(main())
+    assert calls == []
+
+
+def test_executor_option_is_forwarded_to_the_reader(tmp_path):
+    directory = tmp_path / "metadata.d"
+    directory.mkdir()
+    (directory / "service.yml").write_text("name: svc\n", encoding="utf-8")
+    (directory / "a.yml").write_text("a:\n  name: a\n", encoding="utf-8")
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as loop_executor:
+            return await aread_service_metadata(str(directory), executor="thread",
+                                                loop_executor=loop_executor)
+
+    assert set(asyncio.run(main()).use_cases) == {"a"}
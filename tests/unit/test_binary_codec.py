@@ -0,0 +1,112 @@
+import copy
+import pickle
+from decimal import Decimal
+
+import pytest
+
+from bisslog_schema.schema.binary_codec import decode, encode
+from bisslog_schema.schema.enums.criticality import CriticalityEnum
+from bisslog_schema.schema.frozen import FrozenDict
+from bisslog_schema.schema.service_info import ServiceInfo
+
+SERVICE = {
+    "name": "users", "type": "microservice", "service_type": "functional", "team": "core",
+    "tags": {"domain": "identity"},
+    "use_cases": {
+        "getUser": {
+            "name": "get user", "criticality": "very_high", "actor": "employee",
+            "tags": {"accessibility": "private"},
+            "triggers": [
+                {"type": "http", "options": {"method": "GET", "path": "/users/{uid}",
+                                             "rate_limit": "100r/m", "timeout": 500,
+                                             "cacheable": True, "allow_cors": False,
+                                             "allowed_origins": ["https://a.example"]}},
+                {"type": "consumer", "options": {"queue": "user-events", "batch_size": 10,
+                                                 "delivery_semantic": "exactly-once"}},
+            ],
+            "external_interactions": [{"keyname": "db", "type_interaction": "db",
+                                       "operation": ["get", "list"]}],
+        },
+        "notifyUser": {
+            "name": "notify user", "criticality": "low", "actor": "employee",
+            "triggers": [{"type": "websocket", "options": {"routeKey": "notify"}}],
+        },
+    },
+}
+
+
+def test_round_trip():
+    service_info = ServiceInfo.from_dict(SERVICE)
+
+    decoded = decode(encode(service_info))
+
+    assert decoded == service_info
+    assert decoded.use_cases["getUser"].criticality is CriticalityEnum.VERY_HIGH
+    assert decode(encode(service_info.use_cases["notifyUser"])) == \
+        service_info.use_cases["notifyUser"]
+    assert decode(encode(ServiceInfo.from_dict(SERVICE, lazy=True))) == service_info
+
+
+def test_strings_are_written_once():
+    service_info = ServiceInfo.from_dict(SERVICE)
+    data = encode(service_info)
+
+    assert data.count(b"employee") == 1
+    decoded = decode(data)
+    assert decoded.use_cases["getUser"].actor is decoded.use_cases["notifyUser"].actor
+
+
+def test_frozen_snapshots_stay_frozen():
+    frozen = ServiceInfo.from_dict(SERVICE).freeze()
+
+    decoded = decode(encode(frozen))
+
+    assert decoded == frozen and hash(decoded) == hash(frozen)
+    assert isinstance(decoded.use_cases, FrozenDict)
+    assert pickle.loads(pickle.dumps(frozen, protocol=5)) == frozen
+
+
+def test_other_values_are_embedded():
+    value = {"price": Decimal("1.5"), "ratio": 0.25, "delta": -3, "flags": (True, None),
+             "ids": frozenset({1, 2})}
+
+    assert decode(encode(value)) == value
+
+
+@pytest.mark.parametrize("data, message", [
+    (b"JSON{}", "Not a bisslog-schema"),
+    (b"BSBC\x63", "Unsupported binary payload version"),
+])
+def test_invalid_payloads(data, message):
+    with pytest.raises(ValueError, match=message):
+        decode(data)
+
+
+def test_truncated_and_padded_payloads():
+    data = encode(ServiceInfo.from_dict(SERVICE))
+
+    with pytest.raises(ValueError, match="Truncated"):
+        decode(data[:-3])
+    with pytest.raises(ValueError, match="Unexpected data"):
+        decode(data + b"\x00")
+
+
+def test_pickling_is_unchanged():
+    service_info = ServiceInfo.from_dict(SERVICE)
+    use_case = service_info.use_cases["getUser"]
+
+    # default reduction, with the slot names: the codec layout stays out of pickle
+    assert b"keyname" in pickle.dumps(use_case, protocol=5)
+    for protocol in (2, 5):
+        assert pickle.loads(pickle.dumps(service_info, protocol=protocol)) == service_info
+
+
+def test_copies():
+    service_info = ServiceInfo.from_dict(SERVICE)
+
+    shallow = copy.copy(service_info)
+    deep = copy.deepcopy(service_info)
+
+    assert shallow == service_info == deep
+    assert shallow.use_cases is service_info.use_cases
+    assert deep.use_cases["getUser"] is not service_info.use_cases["getUser"]
@@ -18,6 +18,7 @@ class TestCLICommandParsing:
         args.format_file = "yaml"
         args.encoding = "utf-8"
         args.min_warnings = None
+        args.yaml_loader = "auto"
         return args
 
     @patch('bisslog_schema.cli.analyze_command')
@@ -33,7 +34,8 @@ class TestCLICommandParsing:
             "/test/path.yaml",
             format_file="json",
             encoding="utf-8",
-            min_warnings=0.7
+            min_warnings=0.7,
+            yaml_loader="auto"
         )
 
 class TestCLIErrorHandling:
@@ -76,3 +78,25 @@ class TestArgumentValidation:
                     main()
                     mock_print.assert_called_once_with("Error: Invalid format", file=sys.stderr)
                     mock_exit.assert_called_once_with(2)
+
+
+class TestCompileCommand:
+    """Test suite for the compile subcommand."""
+
+    @patch('bisslog_schema.cli.compile_command')
+    def test_compile_arguments(self, mock_compile):
+        """Test the compile subcommand forwards its arguments."""
+        with patch.object(sys, "argv", ["bisslog_schema", "compile", "metadata.yml",
+                                        "-o", "out.bscat", "--yaml-loader", "python"]):
+            main()
+        mock_compile.assert_called_once_with("metadata.yml", "out.bscat", encoding="utf-8",
+                                             yaml_loader="python", target="catalog")
+
+    @patch('bisslog_schema.cli.compile_command')
+    def test_compile_python_target(self, mock_compile):
+        """Test the compile subcommand forwards the python target."""
+        with patch.object(sys, "argv", ["bisslog_schema", "compile", "metadata.yml",
+                                        "--target", "python"]):
+            main()
+        mock_compile.assert_called_once_with("metadata.yml", None, encoding="utf-8",
+                                             yaml_loader="auto", target="python")
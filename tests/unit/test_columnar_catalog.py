@@ -0,0 +1,144 @@
+import math
+
+import pytest
+
+from bisslog_schema import ColumnarCatalog
+from bisslog_schema.columnar_catalog import DictionaryColumn
+from bisslog_schema.schema.enums.criticality import CriticalityEnum
+from bisslog_schema.schema.service_info import ServiceInfo
+
+
+def _service(name, team):
+    return {
+        "name": name, "team": team, "service_type": "functional",
+        "use_cases": {
+            f"get{name}": {
+                "name": f"get {name}", "criticality": "high", "actor": "user",
+                "triggers": [
+                    {"type": "http", "options": {"method": "get", "path": f"/{name}",
+                                                 "timeout": 1000}},
+                    {"type": "consumer", "options": {"queue": f"{name}-events",
+                                                     "max_retries": 3}},
+                ],
+                "external_interactions": [{"keyname": "db", "type_interaction": "db",
+                                           "operation": ["get", "list"]}],
+            },
+            f"list{name}": {
+                "name": f"list {name}", "criticality": 20,
+                "triggers": [{"type": "http", "options": {"path": f"/{name}/all",
+                                                          "timeout": "3000"}},
+                             {"type": "schedule", "options": {"cronjob": "0 * * * *"}}],
+                "external_interactions": [{"keyname": "events",
+                                           "type_interaction": "notif"}],
+            },
+        },
+    }
+
+
+SERVICES = [_service("orders", "core"), _service("billing", "finance"),
+            _service("users", "core")]
+
+
+@pytest.fixture(params=["objects", "dicts"])
+def catalog(request):
+    if request.param == "objects":
+        return ColumnarCatalog.from_services(ServiceInfo.from_dict(s) for s in SERVICES)
+    return ColumnarCatalog.from_dicts(SERVICES)
+
+
+def test_tables(catalog):
+    assert (len(catalog.services), len(catalog.use_cases), len(catalog.triggers),
+            len(catalog.external_interactions)) == (3, 6, 12, 6)
+    assert catalog.services.to_pylist("use_cases") == [2, 2, 2]
+    assert catalog.use_cases.to_pylist("criticality")[:2] == [CriticalityEnum.HIGH.value,
+                                                             CriticalityEnum.LOW.value]
+    assert catalog.triggers.to_pylist("method")[:4] == ["GET", None, "GET", None]
+    timeouts = catalog.triggers.to_pylist("timeout")[:4]
+    assert timeouts[0] == 1000 and math.isnan(timeouts[1]) and timeouts[2] == 3000
+    assert catalog.external_interactions.to_pylist("type_interaction_standard")[:2] == \
+        ["database", "notifier"]
+    assert catalog.external_interactions.to_pylist("operation")[0] == "get,list"
+    assert catalog.triggers.to_pylist("use_case_row")[:4] == [0, 0, 1, 1]
+
+
+def test_string_columns_are_dictionary_encoded(catalog):
+    team = catalog.triggers["team"]
+
+    assert isinstance(team, DictionaryColumn)
+    assert team.categories == ["core", "finance"]
+    assert team.codes.tolist() == [0] * 4 + [1] * 4 + [0] * 4
+
+
+def test_filter_and_where(catalog):
+    triggers = catalog.triggers
+
+    http = triggers.filter(type="http", team="core")
+    assert len(http) == 4 and set(http.to_pylist("service")) == {"orders", "users"}
+    assert triggers.where(path=lambda path: path is not None and path.endswith("/all")) \
+        .tolist() == [2, 6, 10]
+    assert len(triggers.filter(timeout=lambda t: t > 2000)) == 3
+    assert len(triggers.filter(service=["orders", "billing"], type={"consumer"})) == 2
+    assert len(triggers.filter()) == 12
+    with pytest.raises(KeyError):
+        triggers.where(missing=1)
+
+
+def test_value_counts_and_group_by(catalog):
+    assert catalog.use_cases.value_counts("criticality") == {
+        CriticalityEnum.HIGH.value: 3, CriticalityEnum.LOW.value: 3}
+    assert catalog.triggers.value_counts("max_retries") == {None: 9, 3: 3}
+    assert catalog.triggers.group_by(["team", "type"]) == {
+        ("core", "http"): 4, ("core", "consumer"): 2, ("core", "schedule"): 2,
+        ("finance", "http"): 2, ("finance", "consumer"): 1, ("finance", "schedule"): 1}
+    assert catalog.triggers.group_by("team", "timeout", "mean") == {"core": 2000,
+                                                                    "finance": 2000}
+    assert catalog.triggers.group_by("service", "timeout", "count")["orders"] == 2
+    assert catalog.triggers.group_by("type", "timeout", "max") == {"http": 3000}
+    with pytest.raises(ValueError, match="Unknown aggregate"):
+        catalog.triggers.group_by("team", "timeout", "median")
+    with pytest.raises(ValueError, match="requires a value column"):
+        catalog.triggers.group_by("team", aggregate="sum")
+
+
+def test_slice_is_zero_copy(catalog):
+    view = catalog.triggers.slice(4, 8)
+
+    assert len(view) == 4 and set(view.to_pylist("service")) == {"billing"}
+    assert view["timeout"].obj is catalog.triggers["timeout"].obj
+    assert view["team"].codes.obj is catalog.triggers["team"].codes.obj
+    assert next(view.iter_rows())["path"] == "/billing"
+
+
+def test_from_dicts_rejects_invalid_criticality():
+    with pytest.raises(ValueError, match="Invalid criticality"):
+        ColumnarCatalog.from_dicts([{"name": "s", "use_cases": {"u": {"criticality": "x"}}}])
+
+
+def test_to_numpy(catalog):
+    numpy = pytest.importorskip("numpy")
+
+    timeouts = catalog.triggers.to_numpy("timeout")
+    assert numpy.nanmax(timeouts) == 3000
+    assert list(catalog.triggers.to_numpy("team")[:5]) == ["core"] * 4 + ["finance"]
+
+
+def test_from_dicts_and_from_services_build_the_same_columns():
+    websocket = {"name": "chat", "team": "core", "use_cases": {"connect": {
+        "name": "connect", "criticality": "critical",
+        "triggers": [{"type": "websocket", "options": {"routeKey": "$connect"}}],
+        "external_interactions": {"sessions": {"type_interaction": "cache",
+                                               "operation": "set"}}}}}
+    unknown_level = {"name": "legacy", "use_cases": {"a": {"name": "a", "criticality": 60}}}
+    services = SERVICES + [websocket, unknown_level]
+
+    from_dicts = ColumnarCatalog.from_dicts(services)
+    from_services = ColumnarCatalog.from_services(ServiceInfo.from_dict(s) for s in services)
+
+    assert from_dicts.triggers.to_pylist("route_key")[-1] == "$connect"
+    assert math.isnan(from_services.use_cases.to_pylist("criticality")[-1])
+    assert from_dicts.use_cases.value_counts("criticality")[None] == 1
+    for table in ("services", "use_cases", "triggers", "external_interactions"):
+        left, right = getattr(from_dicts, table), getattr(from_services, table)
+        assert left.column_names == right.column_names
+        for name in left.column_names:
+            assert repr(left.to_pylist(name)) == repr(right.to_pylist(name)), (table, name)
@@ -0,0 +1,99 @@
+import struct
+
+import pytest
+
+from bisslog_schema import read_service_metadata
+from bisslog_schema.commands.compile_metadata.compile_metadata import compile_command
+from bisslog_schema.schema.compiled_catalog import CompiledCatalog, compile_catalog
+from bisslog_schema.schema.service_info import ServiceInfo
+
+
+def _service(n=200):
+    use_cases = {}
+    for i in range(n):
+        triggers = [{"type": "http", "options": {"method": ("get", "post")[i % 2],
+                                                 "path": f"/items/{i}"}}]
+        if i % 5 == 0:
+            triggers.append({"type": "consumer", "options": {"queue": f"queue-{i % 3}"}})
+        use_cases[f"useCase{i}"] = {"name": f"use case {i}", "triggers": triggers}
+    return ServiceInfo.from_dict({"name": "catalog", "team": "core", "use_cases": use_cases})
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = tmp_path / "service.bscat"
+    compile_catalog(_service(), str(path))
+    return path
+
+
+def test_lookup_by_keyname(catalog_path):
+    service_info = _service()
+    with CompiledCatalog(str(catalog_path)) as catalog:
+        assert len(catalog) == 200
+        assert catalog["useCase17"] == service_info.use_cases["useCase17"]
+        assert catalog.get("missing") is None
+        assert "useCase3" in catalog and "missing" not in catalog
+        with pytest.raises(KeyError):
+            catalog["missing"]
+
+
+def test_lookup_by_route_and_queue(catalog_path):
+    with CompiledCatalog(str(catalog_path)) as catalog:
+        assert [uc.keyname for uc in catalog.find_by_route("POST", "/items/7")] == ["useCase7"]
+        assert [uc.keyname for uc in catalog.find_by_route(None, "/items/8")] == ["useCase8"]
+        assert catalog.find_by_route("GET", "/items/7") == []
+        queued = {uc.keyname for uc in catalog.find_by_queue("queue-1")}
+        assert queued == {f"useCase{i}" for i in range(0, 200, 5) if i % 3 == 1}
+
+
+def test_load_service_info(catalog_path):
+    with CompiledCatalog(str(catalog_path)) as catalog:
+        assert catalog.service_info.name == "catalog"
+        assert catalog.service_info.use_cases == {}
+        loaded = catalog.load_service_info()
+    assert loaded == _service()
+    assert list(loaded.use_cases) == list(_service().use_cases)
+
+
+def test_not_a_catalog(tmp_path):
+    path = tmp_path / "other.bscat"
+    path.write_bytes(b"x" * 200)
+
+    with pytest.raises(ValueError, match="not a compiled metadata catalog"):
+        CompiledCatalog(str(path))
+
+
+def test_unsupported_version(catalog_path):
+    data = bytearray(catalog_path.read_bytes())
+    struct.pack_into("<H", data, 5, 99)
+    catalog_path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="Unsupported catalog version 99"):
+        CompiledCatalog(str(catalog_path))
+
+
+def test_corrupted_header(catalog_path):
+    data = bytearray(catalog_path.read_bytes())
+    data[10] ^= 0xFF
+    catalog_path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="Corrupted header"):
+        CompiledCatalog(str(catalog_path))
+
+
+def test_corrupted_record(catalog_path):
+    data = bytearray(catalog_path.read_bytes())
+    data[200] ^= 0xFF
+    catalog_path.write_bytes(bytes(data))
+
+    with CompiledCatalog(str(catalog_path)) as catalog:
+        with pytest.raises(ValueError, match="Corrupted record"):
+            catalog.load_service_info()
+
+
+def test_compile_command(tmp_path, capsys):
+    output = compile_command("examples/webhook.yml", str(tmp_path / "webhook.bscat"))
+
+    assert "Compiled" in capsys.readouterr().out
+    with CompiledCatalog(output) as catalog:
+        assert catalog.load_service_info() == read_service_metadata("examples/webhook.yml")
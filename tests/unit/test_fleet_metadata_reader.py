@@ -0,0 +1,79 @@
+import shutil
+
+import pytest
+
+from bisslog_schema import read_fleet_metadata, iter_fleet_metadata
+from bisslog_schema.fleet_metadata_reader import FleetCatalog, discover_metadata_files
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    for name in ("webhook", "users"):
+        (tmp_path / name).mkdir()
+    shutil.copy("examples/webhook.yml", tmp_path / "webhook" / "metadata.yml")
+    shutil.copy("examples/user-management.yml", tmp_path / "users" / "metadata.yaml")
+    (tmp_path / "broken").mkdir()
+    (tmp_path / "broken" / "metadata.json").write_text('{"description": "no name"}')
+    (tmp_path / "copy").mkdir()
+    shutil.copy("examples/webhook.yml", tmp_path / "copy" / "metadata.yml")
+    (tmp_path / "split" / "metadata.d").mkdir(parents=True)
+    (tmp_path / "split" / "metadata.d" / "service.yml").write_text("name: split\n")
+    (tmp_path / "split" / "metadata.d" / "a.yml").write_text("a:\n  name: a\n")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "metadata.yml").write_text("name: hidden\n")
+    return tmp_path
+
+
+def test_discover_metadata_files(fleet):
+    paths = discover_metadata_files(str(fleet))
+
+    assert [p[len(str(fleet)) + 1:] for p in paths] == [
+        "broken/metadata.json", "copy/metadata.yml", "split/metadata.d",
+        "users/metadata.yaml", "webhook/metadata.yml"]
+
+
+def test_discover_metadata_files_glob(fleet):
+    assert len(discover_metadata_files(f"{fleet}/*/metadata.yml")) == 2
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_read_fleet_metadata(fleet, executor):
+    catalog = read_fleet_metadata(str(fleet), workers=2, executor=executor)
+
+    assert set(catalog.services) == {"webhook receiver", "user management", "split"}
+    assert len(catalog) == 3
+    assert "split" in catalog
+    assert set(catalog["split"].use_cases) == {"a"}
+    assert str(fleet / "broken" / "metadata.json") in catalog.failures
+    assert catalog.paths["webhook receiver"] == str(fleet / "copy" / "metadata.yml")
+    assert "already defined" in catalog.failures[str(fleet / "webhook" / "metadata.yml")]
+    stats = catalog.stats()
+    assert stats["files"] == 5
+    assert stats["failures"] == 2
+    assert stats["max_seconds"] >= stats["mean_seconds"] > 0
+
+
+def test_catalog_keeps_the_smallest_path_whatever_the_order(fleet):
+    results = sorted(iter_fleet_metadata(str(fleet), executor="thread"),
+                     key=lambda result: result.path)
+    forward, backward = FleetCatalog(), FleetCatalog()
+
+    for result in results:
+        forward.add(result)
+    for result in reversed(results):
+        backward.add(result)
+
+    assert forward.paths == backward.paths
+    assert forward.failures == backward.failures
+
+
+def test_iter_fleet_metadata_streams_results(fleet):
+    results = list(iter_fleet_metadata(str(fleet), workers=2, executor="thread"))
+
+    assert len(results) == 5
+    assert sum(result.error is not None for result in results) == 1
+
+
+def test_iter_fleet_metadata_invalid_executor(fleet):
+    with pytest.raises(ValueError, match="Unknown executor"):
+        list(iter_fleet_metadata(str(fleet), executor="gpu"))
@@ -0,0 +1,133 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
+from bisslog_schema.schema import FrozenDict, freeze
+from bisslog_schema.schema.frozen import FrozenSchema
+from bisslog_schema.schema.service_info import ServiceInfo
+from bisslog_schema.schema.triggers.trigger_http import TriggerHttp
+from bisslog_schema.schema.triggers.trigger_info import TriggerInfo
+from bisslog_schema.schema.use_case_info import UseCaseInfo
+from bisslog_schema.service_metadata_with_code import ServiceInfoWithCode
+from bisslog_schema.use_case_code_inspector.use_case_code_metadata import UseCaseCodeInfoObject
+
+SERVICE = {
+    "name": "users", "tags": {"domain": "identity"},
+    "use_cases": {
+        "getUser": {
+            "name": "get user", "tags": {"accessibility": "private"},
+            "triggers": [{"type": "http", "options": {"method": "get", "path": "/users/{uid}",
+                                                      "mapper": {"path_query.uid": "uid"}}}],
+            "external_interactions": [{"keyname": "db", "type_interaction": "db",
+                                       "operation": ["get", "list"]}],
+        },
+        "addUser": {
+            "name": "add user",
+            "triggers": [{"type": "http", "options": {"method": "post", "path": "/users"}}],
+        },
+    },
+}
+
+
+@pytest.fixture
+def service_info():
+    return ServiceInfo.from_dict(SERVICE)
+
+
+def test_freeze_is_deep(service_info):
+    frozen = service_info.freeze()
+    use_case = frozen.use_cases["getUser"]
+    trigger = use_case.triggers[0]
+
+    assert isinstance(frozen, ServiceInfo) and isinstance(frozen, FrozenSchema)
+    assert type(frozen).__name__ == "FrozenServiceInfo"
+    assert isinstance(frozen.use_cases, FrozenDict) and isinstance(frozen.tags, FrozenDict)
+    assert isinstance(use_case.triggers, tuple) and isinstance(use_case, UseCaseInfo)
+    assert isinstance(trigger.options, TriggerHttp) and isinstance(trigger.options,
+                                                                   FrozenSchema)
+    assert isinstance(trigger.options.mapper, FrozenDict)
+    assert use_case.external_interactions[0].operation == ("get", "list")
+    assert service_info.use_cases["getUser"].triggers[0].options.mapper == {
+        "path_query.uid": "uid"}
+    assert not isinstance(service_info, FrozenSchema)
+
+
+def test_frozen_fields_cannot_be_assigned(service_info):
+    use_case = service_info.use_cases["getUser"].freeze()
+
+    with pytest.raises(FrozenInstanceError):
+        use_case.name = "other"
+    with pytest.raises(FrozenInstanceError):
+        del use_case.triggers
+    with pytest.raises(TypeError):
+        use_case.tags["accessibility"] = "public"
+
+
+def test_frozen_objects_are_hashable_and_comparable(service_info):
+    first = service_info.use_cases["getUser"].freeze()
+    second = ServiceInfo.from_dict(SERVICE).use_cases["getUser"].freeze()
+    other = service_info.use_cases["addUser"].freeze()
+
+    assert first == second and hash(first) == hash(second)
+    assert first != other
+    assert {first: 1}[second] == 1
+    assert len({first, second, other}) == 2
+    assert first.freeze() is first
+    assert hash(TriggerInfo(type="http", options={"a": [1]}).freeze())
+
+
+def test_hash_is_cached(service_info):
+    frozen = service_info.freeze()
+
+    assert frozen._hash is None
+    value = hash(frozen)
+    assert frozen._hash == value == hash(frozen)
+
+
+def test_frozen_service_indexes(service_info):
+    frozen = service_info.freeze()
+
+    assert frozen.indexes.find_by_route("POST", "/users").keyname == "addUser"
+    assert frozen.indexes is frozen.indexes
+
+
+def test_replace_copy_and_pickle(service_info):
+    frozen = service_info.freeze()
+
+    renamed = replace(frozen, name="accounts")
+    assert isinstance(renamed, FrozenSchema) and renamed.name == "accounts"
+    assert isinstance(renamed.use_cases, FrozenDict)
+    assert copy.deepcopy(frozen) == frozen
+    hash(frozen)
+    restored = pickle.loads(pickle.dumps(frozen))
+    assert restored._hash is None
+    assert restored == frozen and type(restored) is type(frozen)
+
+
+def test_freeze_lazy_use_cases():
+    frozen = ServiceInfo.from_dict(SERVICE, lazy=True).freeze()
+
+    assert frozen == ServiceInfo.from_dict(SERVICE).freeze()
+
+
+def test_freeze_values():
+    assert freeze({"a": [1, {"b": {2}}]}) == FrozenDict(a=(1, FrozenDict(b=frozenset({2}))))
+    assert freeze("text") == "text"
+    assert FrozenDict(a=1) == {"a": 1}
+    assert pickle.loads(pickle.dumps(FrozenDict(a=1))) == FrozenDict(a=1)
+
+
+def test_service_info_with_code_carries_a_snapshot(service_info):
+    code_info = UseCaseCodeInfoObject("getUser", None, "users.get", False, "get_user")
+    with_code = ServiceInfoWithCode(service_info, {"getUser": code_info})
+
+    frozen = with_code.freeze()
+
+    assert isinstance(frozen, ServiceInfoWithCode)
+    assert isinstance(frozen.declared_metadata, FrozenSchema)
+    assert frozen.discovered_use_cases["getUser"] is code_info
+    assert hash(frozen) == hash(with_code.freeze())
+    with pytest.raises(FrozenInstanceError):
+        frozen.declared_metadata = service_info
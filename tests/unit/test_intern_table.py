@@ -0,0 +1,127 @@
+import copy
+import gc
+import json
+import pickle
+import threading
+
+from bisslog_schema import read_fleet_metadata, read_service_metadata
+from bisslog_schema.schema.intern_table import (InternTable, SharedDict, current_intern_table,
+                                                interning)
+from bisslog_schema.schema.service_info import ServiceInfo
+
+
+def _service(name, team="core"):
+    return {
+        "name": name, "team": team, "tags": {"tier": "gold"},
+        "use_cases": {
+            f"get{name}": {
+                "name": f"get {name}", "tags": {"domain": "users"},
+                "triggers": [
+                    {"type": "http", "options": {"method": "get", "path": f"/{name}",
+                                                 "apigw": "public",
+                                                 "mapper": {"body": "data"}}},
+                    {"type": "consumer", "options": {"queue": "events", "max_retries": 3}},
+                ],
+                "external_interactions": [{"keyname": "users_db",
+                                           "type_interaction": "database"}],
+            },
+            f"list{name}": {
+                "name": f"list {name}", "tags": {"domain": "users"},
+                "triggers": [{"type": "http", "options": {"method": "get",
+                                                          "path": f"/{name}/all",
+                                                          "mapper": {"body": "data"}}}],
+                "external_interactions": [{"keyname": "users_db",
+                                           "type_interaction": "database"}],
+            },
+        },
+    }
+
+
+def test_from_dict_shares_identical_values():
+    with interning() as table:
+        first = ServiceInfo.from_dict(json.loads(json.dumps(_service("orders"))))
+        second = ServiceInfo.from_dict(json.loads(json.dumps(_service("billing"))))
+
+    get_orders, list_orders = first.use_cases.values()
+    get_billing = second.use_cases["getbilling"]
+    assert get_orders.external_interactions[0] is list_orders.external_interactions[0]
+    assert get_orders.external_interactions[0] is get_billing.external_interactions[0]
+    assert get_orders.triggers[1].options is get_billing.triggers[1].options
+    assert get_orders.triggers[0].options is not get_billing.triggers[0].options
+    assert get_orders.triggers[0].options.mapper is list_orders.triggers[0].options.mapper
+    assert get_orders.tags is get_billing.tags and isinstance(get_orders.tags, SharedDict)
+    assert first.team is second.team
+    assert first == ServiceInfo.from_dict(_service("orders"))
+
+    stats = table.stats()
+    assert stats["shared_strings"] > 0 and stats["shared_objects"] > 0
+    assert stats["bytes_saved"] > 0
+    assert current_intern_table() is None
+
+
+def test_without_table_nothing_is_shared():
+    service_info = ServiceInfo.from_dict(_service("orders"))
+    get_orders, list_orders = service_info.use_cases.values()
+
+    assert get_orders.external_interactions[0] is not list_orders.external_interactions[0]
+    assert type(get_orders.tags) is dict
+
+
+def test_values_of_different_types_are_not_merged():
+    table = InternTable()
+    assert table.intern_value({"a": 1}) is table.intern_value({"a": 1})
+    assert table.intern_value({"a": True}) is not table.intern_value({"a": 1})
+    assert table.intern_value({"a": [1]}) is not table.intern_value({"a": (1,)})
+    unhashable = {"a": {1, 2}}
+    assert table.intern_value(unhashable) is unhashable
+
+
+def test_canonical_objects_are_weakly_referenced():
+    table = InternTable()
+    with interning(table):
+        service_info = ServiceInfo.from_dict(_service("orders"))
+    assert len(table) > 0
+
+    del service_info
+    gc.collect()
+    assert len(table) == 0
+
+
+def test_lazy_use_cases_are_built_with_the_table():
+    with interning() as table:
+        service_info = ServiceInfo.from_dict(_service("orders"), lazy=True)
+    get_orders, list_orders = service_info.use_cases.values()
+
+    assert get_orders.external_interactions[0] is list_orders.external_interactions[0]
+    assert table.shared_objects > 0
+
+
+def test_interning_is_scoped_to_the_context():
+    seen = []
+    with interning():
+        thread = threading.Thread(target=lambda: seen.append(current_intern_table()))
+        thread.start()
+        thread.join()
+    assert seen == [None]
+
+
+def test_shared_objects_round_trip():
+    with interning():
+        service_info = ServiceInfo.from_dict(_service("orders"))
+
+    assert pickle.loads(pickle.dumps(service_info)) == service_info
+    assert copy.deepcopy(service_info) == service_info
+
+
+def test_loaders_accept_a_table(tmp_path):
+    for name in ("orders", "billing"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "metadata.json").write_text(json.dumps(_service(name)))
+    table = InternTable()
+
+    orders = read_service_metadata(str(tmp_path / "orders" / "metadata.json"), intern=table)
+    catalog = read_fleet_metadata(str(tmp_path), executor="thread", intern=table)
+
+    interaction = orders.use_cases["getorders"].external_interactions[0]
+    assert catalog["billing"].use_cases["getbilling"].external_interactions[0] is interaction
+    assert catalog["orders"].use_cases["listorders"].external_interactions[0] is interaction
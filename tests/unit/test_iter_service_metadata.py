@@ -0,0 +1,64 @@
+import pytest
+
+from bisslog_schema import iter_service_metadata, read_service_metadata
+from bisslog_schema.commands.analyze_metadata_file.analyze_metadata import (generate_reports,
+                                                                           generate_report)
+
+
+@pytest.fixture
+def fleet_file(tmp_path):
+    path = tmp_path / "fleet.yml"
+    with open("examples/webhook.yml", encoding="utf-8") as webhook, \
+            open("examples/user-management.yml", encoding="utf-8") as users:
+        path.write_text(f"{webhook.read()}\n---\n{users.read()}\n---\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("yaml_loader", ["c", "python"])
+def test_iter_service_metadata(fleet_file, yaml_loader):
+    services = list(iter_service_metadata(str(fleet_file), yaml_loader=yaml_loader))
+
+    assert services == [read_service_metadata("examples/webhook.yml"),
+                        read_service_metadata("examples/user-management.yml")]
+
+
+def test_iter_service_metadata_is_lazy(tmp_path):
+    path = tmp_path / "fleet.yml"
+    path.write_text("name: first\n---\ndescription: missing name\n---\nname: third\n",
+                    encoding="utf-8")
+    iterator = iter_service_metadata(str(path))
+
+    assert next(iterator).name == "first"
+    with pytest.raises(ValueError, match="Document 1 of the metadata is invalid"):
+        next(iterator)
+
+
+def test_iter_service_metadata_not_a_dict(tmp_path):
+    path = tmp_path / "fleet.yml"
+    path.write_text("name: first\n---\n- a\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Document 1 of the metadata must be a dictionary"):
+        list(iter_service_metadata(str(path)))
+
+
+def test_iter_service_metadata_single_json(tmp_path):
+    path = tmp_path / "metadata.json"
+    path.write_text('{"name": "svc"}', encoding="utf-8")
+
+    assert [service.name for service in iter_service_metadata(str(path))] == ["svc"]
+
+
+def test_generate_reports(fleet_file):
+    reports = list(generate_reports(str(fleet_file)))
+
+    assert reports == [generate_report("examples/webhook.yml"),
+                       generate_report("examples/user-management.yml")]
+
+
+def test_generate_reports_not_a_dict(tmp_path):
+    path = tmp_path / "fleet.yml"
+    path.write_text("- a\n", encoding="utf-8")
+
+    report, = generate_reports(str(path))
+
+    assert report.critical_errors_count() == 1
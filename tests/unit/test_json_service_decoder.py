@@ -0,0 +1,79 @@
+import json
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from bisslog_schema.schema.json_service_decoder import loads_service_info
+from bisslog_schema.schema.read_metadata import read_service_metadata
+from bisslog_schema.schema.service_info import ServiceInfo
+
+
+def _two_pass_error(data):
+    with pytest.raises((TypeError, ValueError)) as exc_info:
+        ServiceInfo.from_dict(json.loads(json.dumps(data)))
+    return exc_info
+
+
+@pytest.mark.parametrize("path", ["examples/webhook.yml", "examples/user-management.yml"])
+def test_decoder_matches_two_pass(path):
+    with open(path, encoding="utf-8") as file:
+        document = json.dumps(yaml.safe_load(file))
+
+    assert loads_service_info(document) == ServiceInfo.from_dict(json.loads(document))
+
+
+@pytest.mark.parametrize("data", [
+    {"name": "svc", "use_cases": {"a": "not a dict"}},
+    {"name": "svc", "use_cases": {"a": {"name": 123}}},
+    {"name": "svc", "use_cases": {"a": {"name": "a", "triggers": [{"type": "consumer"}]}}},
+    {"name": "svc", "use_cases": ["a"]},
+    {"description": "no name", "use_cases": {}},
+])
+def test_decoder_raises_same_errors(data):
+    expected = _two_pass_error(data)
+
+    with pytest.raises(expected.type) as exc_info:
+        loads_service_info(json.dumps(data))
+    assert str(exc_info.value) == str(expected.value)
+
+
+def test_decoder_ignores_nested_use_cases_keys():
+    data = {"name": "svc", "tags": {"use_cases": {"x": {}}},
+            "use_cases": {"a": {"name": "a", "tags": {"use_cases": "tag"}}}}
+
+    service_info = loads_service_info(json.dumps(data))
+
+    assert service_info.tags == {"use_cases": {"x": {}}}
+    assert service_info.use_cases["a"].tags == {"use_cases": "tag"}
+
+
+@pytest.mark.parametrize("document", ["[]", "{\"name\": ", "{\"name\": \"a\",}"])
+def test_decoder_invalid_documents(document):
+    with pytest.raises(ValueError):
+        loads_service_info(document)
+
+
+def test_read_service_metadata_streams_json_when_opted_in(tmp_path):
+    path = tmp_path / "metadata.json"
+    with open("examples/webhook.yml", encoding="utf-8") as file:
+        path.write_text(json.dumps(yaml.safe_load(file)), encoding="utf-8")
+
+    with patch("bisslog_schema.schema.read_metadata.read_metadata_file") as read_file:
+        service_info = read_service_metadata(str(path), stream_json=True)
+        read_file.assert_not_called()
+    assert service_info == read_service_metadata("examples/webhook.yml")
+    with patch("bisslog_schema.schema.read_metadata.load_service_info") as load:
+        assert read_service_metadata(str(path)) == service_info
+        load.assert_not_called()
+
+
+def test_decoder_falls_back_without_json_internals():
+    document = json.dumps({"name": "svc", "use_cases": {"a": {"name": "a"}}})
+
+    with patch("bisslog_schema.schema.json_service_decoder.JSONObject", None):
+        service_info = loads_service_info(document)
+        with pytest.raises(ValueError, match="must be an object"):
+            loads_service_info("[]")
+
+    assert service_info == loads_service_info(document)
@@ -0,0 +1,69 @@
+from unittest.mock import patch
+
+import pytest
+
+from bisslog_schema.schema.lazy_use_cases import LazyUseCases
+from bisslog_schema.schema.read_metadata import read_service_metadata
+from bisslog_schema.schema.service_info import ServiceInfo
+from bisslog_schema.schema.use_case_info import UseCaseInfo
+
+
+def _service_data():
+    return {
+        "name": "OrderService",
+        "use_cases": {
+            "createOrder": {"name": "create order"},
+            "getOrder": {"name": "get order"},
+            "brokenOrder": {"name": 123},
+        }
+    }
+
+
+def test_lazy_does_not_build_on_len_keys_and_iteration():
+    with patch.object(UseCaseInfo, "from_dict", wraps=UseCaseInfo.from_dict) as from_dict:
+        service_info = ServiceInfo.from_dict(_service_data(), lazy=True)
+
+        assert isinstance(service_info.use_cases, LazyUseCases)
+        assert len(service_info.use_cases) == 3
+        assert set(service_info.use_cases.keys()) == {"createOrder", "getOrder", "brokenOrder"}
+        assert list(service_info.use_cases) == ["createOrder", "getOrder", "brokenOrder"]
+        assert "getOrder" in service_info.use_cases
+        from_dict.assert_not_called()
+
+
+def test_lazy_builds_on_first_access_and_memoizes():
+    service_info = ServiceInfo.from_dict(_service_data(), lazy=True)
+    use_cases = service_info.use_cases
+
+    assert not use_cases.is_materialized("createOrder")
+    use_case = use_cases["createOrder"]
+    assert isinstance(use_case, UseCaseInfo)
+    assert use_case.keyname == "createOrder"
+    assert use_cases.is_materialized("createOrder")
+    assert use_cases["createOrder"] is use_case
+    assert not use_cases.is_materialized("getOrder")
+
+
+def test_lazy_error_surfaces_on_access():
+    service_info = ServiceInfo.from_dict(_service_data(), lazy=True)
+
+    with pytest.raises(ValueError, match="Error creating UseCaseInfo for 'brokenOrder'"):
+        service_info.use_cases["brokenOrder"]
+    with pytest.raises(KeyError):
+        service_info.use_cases["missing"]
+
+
+def test_materialize_all_surfaces_errors():
+    service_info = ServiceInfo.from_dict(_service_data(), lazy=True)
+
+    with pytest.raises(ValueError, match="Error creating UseCaseInfo for 'brokenOrder'"):
+        service_info.materialize_all()
+
+
+def test_read_service_metadata_lazy_equals_eager():
+    lazy = read_service_metadata("examples/webhook.yml", lazy=True)
+    eager = read_service_metadata("examples/webhook.yml")
+
+    assert isinstance(lazy.use_cases, LazyUseCases)
+    assert lazy.materialize_all() is lazy
+    assert lazy == eager
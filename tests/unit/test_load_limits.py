@@ -0,0 +1,103 @@
+import json
+import time
+import tracemalloc
+
+import pytest
+
+from bisslog_schema import read_service_metadata
+from bisslog_schema.commands.analyze_metadata_file.analyze_metadata import generate_report
+from bisslog_schema.schema import LoadLimits, MetadataLimitExceeded
+from bisslog_schema.schema.read_metadata import read_metadata_file
+
+
+def _alias_bomb(levels=9):
+    lines = ["name: bomb", "a0: &a0 [x, x, x, x, x, x, x, x, x]"]
+    for i in range(1, levels):
+        aliases = ", ".join([f"*a{i - 1}"] * 9)
+        lines.append(f"a{i}: &a{i} [{aliases}]")
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def write(tmp_path):
+    def _write(name, content):
+        path = tmp_path / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+    return _write
+
+
+@pytest.mark.parametrize("yaml_loader", ["c", "python"])
+@pytest.mark.parametrize("content, limits, limit", [
+    (_alias_bomb(), LoadLimits(), "max_expanded_nodes"),
+    ("a: " + "[" * 5000 + "]" * 5000 + "\n", LoadLimits(), "max_depth"),
+    ("a: [" + ", ".join(["1"] * 200_000) + "]\n", LoadLimits(max_nodes=10_000), "max_nodes"),
+], ids=["alias-bomb", "deep-nesting", "many-nodes"])
+def test_pathological_yaml_fails_fast(write, yaml_loader, content, limits, limit):
+    path = write("metadata.yml", content)
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    with pytest.raises(MetadataLimitExceeded, match=limit):
+        read_metadata_file(path, yaml_loader=yaml_loader, limits=limits)
+
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert elapsed < 5
+    assert peak < 16 * 1024 * 1024
+
+
+def test_alias_bomb_below_limits_loads(write):
+    path = write("metadata.yml", _alias_bomb(levels=3))
+
+    data = read_metadata_file(path, limits=LoadLimits())
+
+    assert len(data["a2"]) == 9
+
+
+def test_max_aliases(write):
+    path = write("metadata.yml", "a: &a x\nb: [" + ", ".join(["*a"] * 11) + "]\n")
+
+    with pytest.raises(MetadataLimitExceeded, match="max_aliases"):
+        read_metadata_file(path, limits=LoadLimits(max_aliases=10))
+
+
+def test_max_file_size(write):
+    path = write("metadata.yml", "name: " + "x" * 2000 + "\n")
+
+    with pytest.raises(MetadataLimitExceeded, match="max_file_size"):
+        read_service_metadata(path, limits=LoadLimits(max_file_size=1024))
+
+
+def test_max_seconds(write):
+    path = write("metadata.yml", "a: [" + ", ".join(["1"] * 20_000) + "]\n")
+
+    with pytest.raises(MetadataLimitExceeded, match="max_seconds"):
+        read_metadata_file(path, limits=LoadLimits(max_seconds=0))
+
+
+@pytest.mark.parametrize("document, limit", [
+    ("[" * 100_000 + "]" * 100_000, "max_depth"),
+    ("[" * 100 + "]" * 100, "max_depth"),
+    (json.dumps({"name": "svc", "tags": {str(i): i for i in range(2000)}}), "max_nodes"),
+], ids=["very-deep", "deep", "many-nodes"])
+def test_pathological_json(write, document, limit):
+    path = write("metadata.json", document)
+
+    with pytest.raises(MetadataLimitExceeded, match=limit):
+        read_service_metadata(path, limits=LoadLimits(max_nodes=1000))
+
+
+def test_limits_on_valid_metadata():
+    assert read_service_metadata("examples/webhook.yml", limits=LoadLimits()) == \
+           read_service_metadata("examples/webhook.yml")
+    assert generate_report("examples/webhook.yml", limits=LoadLimits()) == \
+           generate_report("examples/webhook.yml")
+
+
+def test_generate_report_with_limits(write):
+    path = write("metadata.yml", _alias_bomb())
+
+    with pytest.raises(MetadataLimitExceeded):
+        generate_report(path, limits=LoadLimits())
@@ -0,0 +1,119 @@
+import os
+import shutil
+
+import pytest
+
+from bisslog_schema.schema.load_limits import LoadLimits, MetadataLimitExceeded
+from bisslog_schema.schema.metadata_cache import MetadataDiskCache
+from bisslog_schema.schema.read_metadata import read_service_metadata
+from bisslog_schema.schema.service_info import ServiceInfo
+
+
+@pytest.fixture
+def metadata_path(tmp_path):
+    path = tmp_path / "metadata.yml"
+    shutil.copy("examples/webhook.yml", path)
+    return str(path)
+
+
+def test_cache_miss_then_hit(tmp_path, metadata_path):
+    cache = MetadataDiskCache(str(tmp_path / "cache"))
+
+    first = read_service_metadata(metadata_path, cache=cache)
+    second = read_service_metadata(metadata_path, cache=cache)
+
+    assert isinstance(second, ServiceInfo)
+    assert first == second
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_cache_invalidated_when_file_changes(tmp_path, metadata_path):
+    cache = MetadataDiskCache(str(tmp_path / "cache"))
+    read_service_metadata(metadata_path, cache=cache)
+
+    with open(metadata_path, "a", encoding="utf-8") as file:
+        file.write("\n# edited\n")
+    read_service_metadata(metadata_path, cache=cache)
+
+    assert cache.hits == 0
+    assert cache.misses == 2
+
+
+def test_cache_corrupted_entry_falls_back_to_parse(tmp_path, metadata_path):
+    cache_dir = tmp_path / "cache"
+    cache = MetadataDiskCache(str(cache_dir))
+    expected = read_service_metadata(metadata_path, cache=cache)
+
+    entry, = os.listdir(cache_dir)
+    with open(cache_dir / entry, "r+b") as file:
+        file.seek(40)
+        file.write(b"garbage")
+
+    assert read_service_metadata(metadata_path, cache=cache) == expected
+    assert cache.misses == 2
+    assert read_service_metadata(metadata_path, cache=cache) == expected
+    assert cache.hits == 1
+
+
+def test_cache_lru_eviction(tmp_path):
+    cache = MetadataDiskCache(str(tmp_path / "cache"), max_entries=2)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"metadata-{i}.yml"
+        path.write_text(f"name: service {i}\n", encoding="utf-8")
+        paths.append(str(path))
+
+    read_service_metadata(paths[0], cache=cache)
+    oldest, = cache._entries()
+    read_service_metadata(paths[1], cache=cache)
+    os.utime(oldest, ns=(1, 1))
+    read_service_metadata(paths[2], cache=cache)
+
+    assert cache.stats()["entries"] == 2
+    assert not os.path.exists(oldest)
+    assert read_service_metadata(paths[2], cache=cache).name == "service 2"
+    assert cache.hits == 1
+
+
+def test_cache_invalid_max_entries(tmp_path):
+    with pytest.raises(ValueError, match="max_entries"):
+        MetadataDiskCache(str(tmp_path), max_entries=0)
+
+
+def test_cache_keyed_by_reader_options(tmp_path, metadata_path):
+    cache = MetadataDiskCache(str(tmp_path / "cache"))
+    read_service_metadata(metadata_path, cache=cache)
+
+    with pytest.raises(MetadataLimitExceeded, match="max_file_size"):
+        read_service_metadata(metadata_path, cache=cache, limits=LoadLimits(max_file_size=10))
+
+    assert cache.hits == 0
+    assert cache.load(metadata_path) is None
+    assert cache.load(metadata_path, ("utf-8", "auto", None)) is not None
+
+
+def test_cache_write_errors_do_not_fail_the_read(tmp_path, metadata_path, monkeypatch):
+    cache = MetadataDiskCache(str(tmp_path / "cache"))
+
+    def fail(*args, **kwargs):
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr("bisslog_schema.schema.metadata_cache.os.replace", fail)
+
+    assert read_service_metadata(metadata_path, cache=cache).name
+    assert cache.stats() == {"hits": 0, "misses": 1, "entries": 0}
+    assert os.listdir(tmp_path / "cache") == []
+
+
+def test_cache_fingerprint_taken_before_parsing(tmp_path, metadata_path):
+    cache = MetadataDiskCache(str(tmp_path / "cache"))
+
+    def parse_while_editing():
+        service_info = read_service_metadata(metadata_path)
+        with open(metadata_path, "a", encoding="utf-8") as file:
+            file.write("\n# edited during the parse\n")
+        return service_info
+
+    cache.get_or_parse(metadata_path, parse_while_editing)
+
+    assert cache.load(metadata_path) is None
@@ -0,0 +1,108 @@
+import json
+
+import pytest
+
+from bisslog_schema.schema.metadata_cache import MetadataDiskCache
+from bisslog_schema.schema.metadata_directory import list_metadata_directory
+from bisslog_schema.schema.read_metadata import read_service_metadata, read_metadata_file
+from bisslog_schema.schema.use_case_info import UseCaseInfo
+
+
+@pytest.fixture
+def metadata_dir(tmp_path):
+    directory = tmp_path / "metadata.d"
+    (directory / "orders").mkdir(parents=True)
+    (directory / "service.yml").write_text(
+        "name: order service\nteam: orders\nuse_cases:\n  ping:\n    name: ping\n",
+        encoding="utf-8")
+    (directory / "create_order.yml").write_text(
+        "createOrder:\n  name: create order\n  criticality: high\n", encoding="utf-8")
+    (directory / "orders" / "group.json").write_text(json.dumps({"use_cases": {
+        "getOrder": {"name": "get order"},
+        "listOrders": {"name": "list orders"},
+    }}), encoding="utf-8")
+    return directory
+
+
+def test_list_metadata_directory_header_first(metadata_dir):
+    files = list_metadata_directory(str(metadata_dir))
+
+    assert files[0].endswith("service.yml")
+    assert len(files) == 3
+
+
+@pytest.mark.parametrize("executor", ["process", "thread", "none"])
+def test_read_service_metadata_from_directory(metadata_dir, executor):
+    service_info = read_service_metadata(str(metadata_dir), executor=executor, max_workers=2)
+
+    assert service_info.name == "order service"
+    assert set(service_info.use_cases) == {"ping", "createOrder", "getOrder", "listOrders"}
+    assert all(isinstance(uc, UseCaseInfo) for uc in service_info.use_cases.values())
+    assert service_info.use_cases["createOrder"].keyname == "createOrder"
+
+
+def test_directory_duplicate_keynames(metadata_dir):
+    (metadata_dir / "duplicate.yml").write_text("getOrder:\n  name: other\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="UseCaseInfo 'getOrder' error: Keyname 'getOrder' "
+                                         "is already used."):
+        read_metadata_file(str(metadata_dir), executor="none")
+
+
+def test_directory_service_fields_from_fragments(metadata_dir):
+    (metadata_dir / "extra.yml").write_text(
+        "team: orders\ndescription: orders API\nuse_cases:\n  cancel:\n    name: cancel\n",
+        encoding="utf-8")
+
+    data = read_metadata_file(str(metadata_dir))
+
+    assert data["description"] == "orders API"
+    assert "cancel" in data["use_cases"]
+
+
+def test_directory_conflicting_service_fields(metadata_dir):
+    (metadata_dir / "conflict.yml").write_text(
+        "team: billing\nuse_cases:\n  cancel:\n    name: cancel\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Service field 'team' of .*conflict.yml conflicts "
+                                         "with .*service.yml"):
+        read_metadata_file(str(metadata_dir), executor="none")
+
+
+def test_directory_default_executor_does_not_spawn_processes(metadata_dir, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("a process pool was created")
+
+    monkeypatch.setattr("bisslog_schema.schema.metadata_directory.ProcessPoolExecutor", fail)
+
+    assert read_service_metadata(str(metadata_dir)).name == "order service"
+
+
+def test_directory_without_header(tmp_path):
+    (tmp_path / "use_case.yml").write_text("a:\n  name: a\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="must contain one of"):
+        read_metadata_file(str(tmp_path))
+
+
+def test_directory_invalid_executor(metadata_dir):
+    with pytest.raises(ValueError, match="Unknown executor"):
+        read_metadata_file(str(metadata_dir), executor="gpu")
+
+
+def test_default_metadata_directory(metadata_dir, monkeypatch):
+    monkeypatch.chdir(metadata_dir.parent)
+
+    assert read_service_metadata(executor="thread").name == "order service"
+
+
+def test_cache_detects_changes_in_directory(metadata_dir, tmp_path):
+    cache = MetadataDiskCache(str(tmp_path / "cache"))
+    read_service_metadata(str(metadata_dir), cache=cache, executor="none")
+    read_service_metadata(str(metadata_dir), cache=cache, executor="none")
+    (metadata_dir / "orders" / "new.yml").write_text("newOne:\n  name: new\n", encoding="utf-8")
+    service_info = read_service_metadata(str(metadata_dir), cache=cache, executor="none")
+
+    assert "newOne" in service_info.use_cases
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
@@ -0,0 +1,176 @@
+import copy
+
+import pytest
+import yaml
+
+from bisslog_schema import read_service_overlays
+from bisslog_schema.schema.metadata_overlay import apply_overlay, merge_patch
+from bisslog_schema.schema.service_info import ServiceInfo
+
+BASE = """
+name: orders
+team: core
+use_cases:
+  getOrder:
+    name: get order
+    triggers:
+      - type: http
+        options: {method: get, path: "/orders/{uid}", apigw: internal, timeout: 1000}
+      - type: consumer
+        keyname: replay
+        options: {queue: orders-dev}
+    external_interactions:
+      - keyname: orders_db
+        type_interaction: database
+  addOrder:
+    name: add order
+    triggers:
+      - type: http
+        options: {method: post, path: /orders}
+  debugDump:
+    name: debug dump
+"""
+
+PROD = """
+team: core-prod
+use_cases:
+  getOrder:
+    triggers:
+      0:
+        options: {apigw: public, timeout: 500}
+      replay:
+        options: {queue: orders-prod}
+  debugDump: null
+"""
+
+
+@pytest.fixture
+def metadata_dir(tmp_path):
+    (tmp_path / "metadata.yml").write_text(BASE)
+    (tmp_path / "prod.yml").write_text(PROD)
+    (tmp_path / "staging.yml").write_text(
+        "use_cases:\n  getOrder:\n    triggers:\n      replay:\n"
+        "        options: {queue: orders-staging}\n")
+    return tmp_path
+
+
+def test_merge_patch_does_not_modify_target():
+    target = {"a": {"b": 1, "c": [1, 2, 3]}, "d": {"e": 1}}
+    original = copy.deepcopy(target)
+    merged = merge_patch(target, {"a": {"b": None, "c": {1: 20, 2: None}}, "f": 2})
+
+    assert merged == {"a": {"c": [1, 20]}, "d": {"e": 1}, "f": 2}
+    assert target == original
+    assert merged["d"] is target["d"]
+
+
+def test_merge_patch_replaces_lists_and_scalars():
+    assert merge_patch({"a": [1, 2]}, {"a": [3]}) == {"a": [3]}
+    assert merge_patch({"a": 1}, {"a": {"b": 2}}) == {"a": {"b": 2}}
+    assert merge_patch({"a": 1}, 5) == 5
+
+
+def test_merge_patch_unknown_list_item():
+    with pytest.raises(ValueError, match="does not match"):
+        merge_patch([{"keyname": "a"}], {"b": {"x": 1}})
+    with pytest.raises(ValueError, match="does not match"):
+        merge_patch([1], {3: 2})
+
+
+def test_overlays_share_unchanged_objects(metadata_dir):
+    services = read_service_overlays(str(metadata_dir / "metadata.yml"),
+                                     [str(metadata_dir / "prod.yml"),
+                                      str(metadata_dir / "staging.yml")])
+    base = ServiceInfo.from_dict(yaml.safe_load(BASE))
+    prod, staging = services["prod"], services["staging"]
+
+    assert prod.team == "core-prod" and staging.team == "core"
+    assert "debugDump" not in prod.use_cases and "debugDump" in staging.use_cases
+
+    get_order = prod.use_cases["getOrder"]
+    assert get_order.triggers[0].options.apigw == "public"
+    assert get_order.triggers[0].options.timeout == 500
+    assert get_order.triggers[0].options.path == "/orders/{uid}"
+    assert get_order.triggers[1].options.queue == "orders-prod"
+    assert staging.use_cases["getOrder"].triggers[1].options.queue == "orders-staging"
+    assert staging.use_cases["getOrder"].triggers[0] == base.use_cases["getOrder"].triggers[0]
+
+    # Unchanged use cases and triggers are the very same objects in every environment
+    assert prod.use_cases["addOrder"] is staging.use_cases["addOrder"]
+    assert get_order.external_interactions[0] is \
+        staging.use_cases["getOrder"].external_interactions[0]
+
+
+def test_apply_overlay_keeps_base_untouched():
+    data = yaml.safe_load(BASE)
+    base = ServiceInfo.from_dict(data)
+    snapshot = copy.deepcopy(base)
+    overlay = yaml.safe_load(PROD)
+
+    prod, prod_data = apply_overlay(base, data, overlay)
+
+    assert base == snapshot
+    assert prod.use_cases["addOrder"] is base.use_cases["addOrder"]
+    assert prod.use_cases["getOrder"].external_interactions[0] is \
+        base.use_cases["getOrder"].external_interactions[0]
+    assert prod == ServiceInfo.from_dict(copy.deepcopy(prod_data))
+
+    staging, _ = apply_overlay(base, data, {"use_cases": {"getOrder": {"triggers": {
+        "replay": {"options": {"queue": "orders-staging"}}}}}})
+    assert staging.use_cases["getOrder"].triggers[0] is base.use_cases["getOrder"].triggers[0]
+    assert staging.use_cases["getOrder"].triggers[1] is not base.use_cases["getOrder"].triggers[1]
+
+
+def test_empty_overlay_shares_everything():
+    data = yaml.safe_load(BASE)
+    base = ServiceInfo.from_dict(data)
+    same, _ = apply_overlay(base, data, None)
+
+    assert same == base and same is not base
+    assert all(same.use_cases[k] is base.use_cases[k] for k in base.use_cases)
+
+
+def test_no_op_use_case_patch_reuses_base_use_case():
+    data = {"name": "s", "use_cases": {"a": {"name": "a"}}}
+    base = ServiceInfo.from_dict(data)
+    same, _ = apply_overlay(base, data, {"use_cases": {"a": {"name": "a"}}})
+
+    assert same.use_cases["a"] is base.use_cases["a"]
+
+
+def test_overlay_adds_use_case():
+    data = {"name": "s", "use_cases": {"a": {"name": "a"}}}
+    base = ServiceInfo.from_dict(data)
+    extended, _ = apply_overlay(base, data, {"use_cases": {"b": {"name": "b"}}})
+
+    assert set(extended.use_cases) == {"a", "b"}
+    assert extended.use_cases["b"].keyname == "b"
+    assert set(base.use_cases) == {"a"}
+
+
+@pytest.mark.parametrize("overlay, message", [
+    ([1, 2], "must be a dictionary"),
+    ({"use_cases": [1]}, "'use_cases' field must be a dictionary"),
+    ({"use_cases": {"a": {"name": 3}}}, "Error creating UseCaseInfo for 'a'"),
+])
+def test_invalid_overlay(overlay, message):
+    data = {"name": "s", "use_cases": {"a": {"name": "a"}}}
+    with pytest.raises(ValueError, match=message):
+        apply_overlay(ServiceInfo.from_dict(data), data, overlay)
+
+
+def test_invalid_overlay_file_is_named(metadata_dir):
+    (metadata_dir / "bad.yml").write_text("use_cases:\n  getOrder:\n    triggers:\n"
+                                          "      missing:\n        options: {}\n")
+    with pytest.raises(ValueError, match=r"Overlay 'bad' .* does not match"):
+        read_service_overlays(str(metadata_dir / "metadata.yml"),
+                              [str(metadata_dir / "bad.yml")])
+
+
+def test_repeated_overlay_names(metadata_dir):
+    (metadata_dir / "other").mkdir()
+    (metadata_dir / "other" / "prod.yml").write_text(PROD)
+    with pytest.raises(ValueError, match="Overlay name 'prod'"):
+        read_service_overlays(str(metadata_dir / "metadata.yml"),
+                              [str(metadata_dir / "prod.yml"),
+                               str(metadata_dir / "other" / "prod.yml")])
@@ -0,0 +1,136 @@
+import os
+import threading
+
+import pytest
+
+from bisslog_schema.metadata_watcher import MetadataWatcher
+
+BASE = """
+name: sample
+use_cases:
+  one:
+    name: one
+    triggers:
+      - type: http
+        options:
+          path: /one
+  two:
+    name: two
+    external_interactions:
+      - keyname: db
+        type_interaction: database
+"""
+
+
+def _write(path, content):
+    stat = os.stat(path) if path.exists() else None
+    path.write_text(content, encoding="utf-8")
+    if stat is not None:
+        # make the change visible even on filesystems with coarse mtime
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def metadata(tmp_path):
+    path = tmp_path / "metadata.yml"
+    _write(path, BASE)
+    return path
+
+
+def test_poll_without_changes(metadata):
+    watcher = MetadataWatcher(str(metadata))
+
+    assert set(watcher.service_info.use_cases) == {"one", "two"}
+    assert watcher.poll() is False
+
+
+def test_poll_rebuilds_only_changed_use_cases(metadata):
+    watcher = MetadataWatcher(str(metadata))
+    before = watcher.service_info
+    published = []
+    watcher.subscribe(published.append)
+
+    _write(metadata, BASE.replace("path: /one", "path: /uno") + "  three:\n    name: three\n")
+
+    assert watcher.poll() is True
+    after = watcher.service_info
+    assert published == [after]
+    assert after is not before
+    assert after.use_cases["two"] is before.use_cases["two"]
+    assert after.use_cases["one"] is not before.use_cases["one"]
+    assert after.use_cases["one"].triggers[0].options.path == "/uno"
+    assert before.use_cases["one"].triggers[0].options.path == "/one"
+    assert watcher.last_changes == {"added": ["three"], "removed": [], "changed": ["one"]}
+
+
+def test_poll_header_change_keeps_use_cases(metadata):
+    watcher = MetadataWatcher(str(metadata))
+    before = watcher.service_info
+
+    _write(metadata, BASE.replace("name: sample", "name: renamed\nteam: core"))
+    watcher.poll()
+
+    assert watcher.service_info.name == "renamed"
+    assert watcher.service_info.team == "core"
+    assert watcher.service_info.use_cases["one"] is before.use_cases["one"]
+    assert watcher.last_changes == {"added": [], "removed": [], "changed": []}
+
+
+def test_poll_removed_use_case(metadata):
+    watcher = MetadataWatcher(str(metadata))
+
+    _write(metadata, BASE.split("  two:")[0])
+    watcher.poll()
+
+    assert set(watcher.service_info.use_cases) == {"one"}
+    assert watcher.last_changes["removed"] == ["two"]
+
+
+def test_invalid_change_keeps_previous_service(metadata):
+    watcher = MetadataWatcher(str(metadata))
+    before = watcher.service_info
+
+    _write(metadata, BASE.replace("name: two", "name: 2"))
+    with pytest.raises(ValueError, match="Error creating UseCaseInfo for 'two'"):
+        watcher.poll()
+
+    assert watcher.service_info is before
+    assert watcher.poll() is False
+
+
+def test_unsubscribe(metadata):
+    watcher = MetadataWatcher(str(metadata))
+    published = []
+    unsubscribe = watcher.subscribe(published.append)
+    unsubscribe()
+
+    _write(metadata, BASE.replace("name: sample", "name: other"))
+    watcher.poll()
+
+    assert not published
+
+
+def test_background_thread_publishes_changes(metadata):
+    reloaded = threading.Event()
+    with MetadataWatcher(str(metadata), interval=0.01) as watcher:
+        watcher.subscribe(lambda _: reloaded.set())
+        _write(metadata, BASE.replace("name: sample", "name: other"))
+        assert reloaded.wait(5)
+
+    assert watcher.service_info.name == "other"
+
+
+def test_watch_metadata_directory(tmp_path):
+    directory = tmp_path / "metadata.d"
+    directory.mkdir()
+    _write(directory / "service.yml", "name: sample\n")
+    _write(directory / "a.yml", "a:\n  name: a\n")
+    _write(directory / "b.yml", "b:\n  name: b\n")
+    watcher = MetadataWatcher(str(directory), executor="none")
+    before = watcher.service_info
+
+    _write(directory / "b.yml", "b:\n  name: bee\n")
+    watcher.poll()
+
+    assert watcher.service_info.use_cases["a"] is before.use_cases["a"]
+    assert watcher.service_info.use_cases["b"].name == "bee"
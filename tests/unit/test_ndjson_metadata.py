@@ -0,0 +1,125 @@
+import json
+
+import pytest
+import yaml
+
+from bisslog_schema import read_service_metadata
+from bisslog_schema.commands.analyze_metadata_file.analyze_metadata import generate_report
+from bisslog_schema.schema.load_limits import LoadLimits, MetadataLimitExceeded
+from bisslog_schema.schema.ndjson_metadata import (DigestSet, analyze_ndjson_metadata,
+                                                   iter_ndjson_use_cases, read_ndjson_header,
+                                                   write_ndjson_metadata)
+
+
+def _ndjson_from(example, tmp_path):
+    with open(example, encoding="utf-8") as file:
+        data = yaml.safe_load(file)
+    path = tmp_path / "metadata.ndjson"
+    write_ndjson_metadata(data, str(path))
+    return path
+
+
+@pytest.mark.parametrize("example", ["examples/webhook.yml", "examples/user-management.yml"])
+def test_read_service_metadata_ndjson(example, tmp_path):
+    path = _ndjson_from(example, tmp_path)
+
+    assert read_service_metadata(str(path)) == read_service_metadata(example)
+
+
+@pytest.mark.parametrize("example", ["examples/webhook.yml", "examples/webhook-wrong.yml"])
+def test_analyze_ndjson_matches_totals(example, tmp_path):
+    path = _ndjson_from(example, tmp_path)
+    expected = generate_report(example)
+
+    report = generate_report(str(path))
+
+    assert report.total_critical_validations() == expected.total_critical_validations()
+    assert report.total_warning_validations() == expected.total_warning_validations()
+    assert report.critical_errors_count() == expected.critical_errors_count()
+    assert report.warning_errors_count() == expected.warning_errors_count()
+    assert report.sub_reports == {"use_cases": []}
+
+
+def test_iter_ndjson_use_cases(tmp_path):
+    path = _ndjson_from("examples/user-management.yml", tmp_path)
+
+    assert read_ndjson_header(str(path)).use_cases == {}
+    keynames = [use_case.keyname for use_case in iter_ndjson_use_cases(str(path))]
+    assert keynames == list(read_service_metadata("examples/user-management.yml").use_cases)
+
+
+@pytest.mark.parametrize("lines, message", [
+    ([], "header line is required"),
+    (['{"name": "svc", "use_cases": {}}'], "must not contain 'use_cases'"),
+    (['{"name": "svc"}', '{"name": "a"}'], "Line 2: the use case 'keyname'"),
+    (['{"name": "svc"}', '[1]'], "Line 2: the data must be a dictionary"),
+    (['{"name": "svc"}', '{"keyname": "a"'], "Line 2: invalid JSON"),
+    (['{"name": "svc"}', '{"keyname": "a", "name": "a"}', '', '{"keyname": "a"}'],
+     "Keyname 'a' is already used"),
+    (['{"name": "svc"}', '{"keyname": "a", "name": 1}'],
+     "Line 2: Error creating UseCaseInfo for 'a'"),
+])
+def test_iter_ndjson_use_cases_errors(tmp_path, lines, message):
+    path = tmp_path / "metadata.ndjson"
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+    with pytest.raises(ValueError, match=message):
+        list(iter_ndjson_use_cases(str(path)))
+
+
+def test_analyze_ndjson_collects_line_errors(tmp_path):
+    path = tmp_path / "metadata.ndjson"
+    lines = ['{"name": "svc"}', '{"keyname": "a"', '{"keyname": "b", "description": "same"}',
+             '{"keyname": "b"}', '{"keyname": "c", "description": "same"}']
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+    report = analyze_ndjson_metadata(str(path))
+
+    assert any("Line 2: invalid JSON" in error for error in report.errors)
+    assert any("Keyname 'b' is already used" in error for error in report.errors)
+
+
+def test_analyze_ndjson_saturated_uniqueness_checks(tmp_path):
+    path = tmp_path / "metadata.ndjson"
+    lines = [json.dumps({"name": "svc"})] + [
+        json.dumps({"keyname": f"uc{i}", "name": f"use case {i}"}) for i in range(5)]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+    report = analyze_ndjson_metadata(str(path), max_unique_values=3)
+
+    assert report.warnings[-1].startswith("Uniqueness of keyname")
+
+
+def test_digest_set_is_bounded():
+    values = DigestSet(max_entries=2)
+    for value in ("a", "b", "c"):
+        values.add(value)
+
+    assert "a" in values and "b" in values and "c" not in values
+    assert len(values) == 2
+    assert values.saturated
+
+
+@pytest.mark.parametrize("line, limit", [
+    ("[" * 100_000 + "]" * 100_000, "max_depth"),
+    (json.dumps({"keyname": "a", "name": "a", "tags": {str(i): i for i in range(2000)}}),
+     "max_nodes"),
+], ids=["very-deep", "many-nodes"])
+def test_ndjson_lines_are_checked_against_limits(tmp_path, line, limit):
+    path = tmp_path / "metadata.ndjson"
+    path.write_text(json.dumps({"name": "svc"}) + "\n" + line + "\n", encoding="utf-8")
+    limits = LoadLimits(max_nodes=1000)
+
+    with pytest.raises(MetadataLimitExceeded, match=f"Line 2: .*{limit}"):
+        read_service_metadata(str(path), limits=limits)
+    with pytest.raises(MetadataLimitExceeded, match=limit):
+        generate_report(str(path), limits=limits)
+
+
+def test_ndjson_max_seconds_is_checked_per_line(tmp_path):
+    path = tmp_path / "metadata.ndjson"
+    path.write_text(json.dumps({"name": "svc"}) + "\n"
+                    + json.dumps({"keyname": "a", "name": "a"}) + "\n", encoding="utf-8")
+
+    with pytest.raises(MetadataLimitExceeded, match="Line 1: .*max_seconds"):
+        list(iter_ndjson_use_cases(str(path), limits=LoadLimits(max_seconds=-1)))
@@ -0,0 +1,117 @@
+import shutil
+from types import ModuleType
+
+import pytest
+
+from bisslog_schema import read_service_metadata
+from bisslog_schema.commands.compile_metadata.compile_metadata import compile_command
+from bisslog_schema.schema.python_artifact import (StaleArtifactError, check_python_module,
+                                                   generate_python_module, load_python_module,
+                                                   source_hash, write_python_module)
+from bisslog_schema.schema.service_info import ServiceInfo
+
+
+@pytest.mark.parametrize("path", ["examples/webhook.yml", "examples/user-management.yml"])
+def test_round_trip(tmp_path, path):
+    service_info = read_service_metadata(path)
+    output = tmp_path / "service_metadata.py"
+    write_python_module(service_info, path, str(output))
+
+    assert load_python_module(str(output), path) == service_info
+
+
+def test_stale_module_is_detected(tmp_path):
+    source = tmp_path / "metadata.yml"
+    shutil.copy("examples/webhook.yml", source)
+    output = tmp_path / "webhook_metadata.py"
+    write_python_module(read_service_metadata(str(source)), str(source), str(output))
+    load_python_module(str(output), str(source))
+
+    with open(source, "a", encoding="utf-8") as file:
+        file.write("\n# edited\n")
+    with pytest.raises(StaleArtifactError, match="stale"):
+        load_python_module(str(output), str(source))
+    assert load_python_module(str(output)).name == read_service_metadata(str(source)).name
+
+
+def test_unsupported_version(tmp_path):
+    output = tmp_path / "old_metadata.py"
+    write_python_module(read_service_metadata("examples/webhook.yml"), "examples/webhook.yml",
+                        str(output))
+    output.write_text(output.read_text().replace("ARTIFACT_VERSION = 1", "ARTIFACT_VERSION = 0"))
+
+    with pytest.raises(StaleArtifactError, match="version"):
+        load_python_module(str(output), "examples/webhook.yml")
+
+
+def test_source_hash_of_directory(tmp_path):
+    directory = tmp_path / "metadata.d"
+    directory.mkdir()
+    (directory / "service.yml").write_text("name: dir service\n")
+    (directory / "users.yml").write_text(
+        "getUser:\n  name: get user\n  triggers:\n    - type: http\n")
+    digest = source_hash(str(directory))
+
+    assert digest == source_hash(str(shutil.copytree(directory, tmp_path / "copy.d")))
+    (directory / "users.yml").write_text(
+        "getUser:\n  name: get a user\n  triggers:\n    - type: http\n")
+    assert source_hash(str(directory)) != digest
+
+
+def test_shared_objects_are_built_once(tmp_path):
+    service_info = ServiceInfo.from_dict({"name": "shared", "use_cases": {
+        "a": {"name": "a", "triggers": [{"type": "consumer", "options": {"queue": "q"}}]},
+        "b": {"name": "b"}}})
+    service_info.use_cases["b"].triggers = service_info.use_cases["a"].triggers[:]
+    code = generate_python_module(service_info, "digest")
+    namespace = {}
+    exec(code, namespace)  # pylint: disable=exec-used
+
+    compiled = namespace["SERVICE_INFO"]
+    assert compiled == service_info
+    assert compiled.use_cases["a"].triggers[0] is compiled.use_cases["b"].triggers[0]
+    assert namespace["SOURCE_HASH"] == "digest"
+
+
+def test_unsupported_value():
+    service_info = ServiceInfo(name="odd", tags={"created": object()})
+    with pytest.raises(TypeError, match="ServiceInfo.tags: .*can not be compiled"):
+        generate_python_module(service_info, "digest")
+
+
+def test_yaml_timestamps_round_trip(tmp_path):
+    path = tmp_path / "metadata.yml"
+    path.write_text(
+        "name: dated\ntags:\n  since: 2024-01-02\nuse_cases:\n  a:\n    name: a\n"
+        "    triggers:\n      - type: event\n        options:\n"
+        "          starts: 2024-01-02T03:04:05+01:00\n          ends: 2024-01-02 03:04:05\n",
+        encoding="utf-8")
+    service_info = read_service_metadata(str(path))
+    output = tmp_path / "dated_metadata.py"
+
+    write_python_module(service_info, str(path), str(output))
+
+    assert "import datetime" in output.read_text(encoding="utf-8")
+    assert load_python_module(str(output), str(path)) == service_info
+
+
+def test_compile_command_python_target(tmp_path, capsys):
+    source = tmp_path / "user-management.yml"
+    shutil.copy("examples/user-management.yml", source)
+    output = compile_command(str(source), target="python")
+
+    assert output == str(tmp_path / "user_management.py")
+    assert "Compiled" in capsys.readouterr().out
+    assert load_python_module(output, str(source)) == read_service_metadata(str(source))
+
+
+def test_compile_command_invalid_target():
+    with pytest.raises(ValueError, match="Unsupported compile target"):
+        compile_command("examples/webhook.yml", target="wasm")
+
+
+def test_check_python_module_without_hash():
+    module = ModuleType("empty_module")
+    module.ARTIFACT_VERSION = 1
+    with pytest.raises(StaleArtifactError):
+        check_python_module(module, "examples/webhook.yml")
@@ -0,0 +1,76 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+from bisslog_schema.schema.service_info import ServiceInfo
+from bisslog_schema.schema.use_case_info import UseCaseInfo
+
+SERVICE = {
+    "name": "users", "service_type": "functional", "team": "core",
+    "tags": {"domain": "identity"},
+    "use_cases": {
+        "getUser": {
+            "name": "get user", "criticality": "high", "actor": "employee",
+            "tags": {"accessibility": "private"},
+            "triggers": [
+                {"type": "http", "options": {"method": "get", "path": "/users/{uid}",
+                                             "allowed_origins": ["https://a.example"],
+                                             "mapper": {"path_query.uid": "uid"}}},
+                {"type": "consumer", "options": {"queue": "user-events"}},
+            ],
+            "external_interactions": {"users_db": {"type_interaction": "db",
+                                                   "operation": ["get", "list"]}},
+        },
+        "createUser": {
+            "name": "create user", "actor": "employee",
+            "triggers": [{"type": "http", "options": {"method": "post", "path": "/users"}}],
+            "external_interactions": [{"keyname": "users_db", "type_interaction": "db",
+                                       "operation": "add"}],
+        },
+    },
+}
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def test_from_dict_and_analyze_leave_the_data_untouched():
+    data = copy.deepcopy(SERVICE)
+
+    service_info = ServiceInfo.from_dict(data)
+    report = ServiceInfo.analyze(data)
+
+    assert data == SERVICE
+    assert service_info.use_cases["getUser"].keyname == "getUser"
+    assert service_info.use_cases["getUser"].external_interactions[0].keyname == "users_db"
+    assert not report.errors
+
+
+def test_use_case_keyname_parameter():
+    data = SERVICE["use_cases"]["createUser"]
+
+    assert UseCaseInfo.from_dict(data, "createUser").keyname == "createUser"
+    assert not UseCaseInfo.analyze(data, "createUser").errors
+    assert "keyname" not in data
+
+
+def test_concurrent_parse_and_analyze_of_frozen_data():
+    frozen = _freeze(SERVICE)
+    expected = ServiceInfo.from_dict(frozen)
+    expected_report = ServiceInfo.analyze(copy.deepcopy(SERVICE))
+
+    def parse_and_analyze(_):
+        return ServiceInfo.from_dict(frozen), ServiceInfo.analyze(frozen)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(parse_and_analyze, range(64)))
+
+    for service_info, report in results:
+        assert service_info == expected
+        assert report.errors == expected_report.errors == []
+        assert report.critical_validation_count == expected_report.critical_validation_count
@@ -0,0 +1,162 @@
+import pytest
+
+from bisslog_schema import read_service_metadata
+from bisslog_schema.schema import MetadataDiskCache
+from bisslog_schema.schema.read_metadata import read_metadata_file
+from bisslog_schema.schema.ref_resolver import RefResolver
+
+COMMON = """
+triggers:
+  - type: http
+    options:
+      method: get
+      path: /shared
+      apigw: internal
+      authenticator: employee
+options:
+  internal:
+    apigw: internal
+    authenticator: employee
+external_interactions:
+  users_db:
+    keyname: users_db
+    type_interaction: database
+    operation: get_user
+"""
+
+SERVICE = """
+name: sample
+use_cases:
+  one:
+    name: one
+    triggers:
+      - $ref: common/shared.yml#/triggers/0
+      - type: http
+        options:
+          $ref: common/shared.yml#/options/internal
+          method: post
+          path: /one
+    external_interactions:
+      - $ref: common/shared.yml#/external_interactions/users_db
+  two:
+    name: two
+    triggers:
+      - $ref: common/shared.yml#/triggers/0
+      - type: consumer
+        options:
+          $ref: "#/definitions/queue"
+    external_interactions:
+      - $ref: common/shared.yml#/external_interactions/users_db
+definitions:
+  queue:
+    queue: events
+"""
+
+
+@pytest.fixture
+def service_path(tmp_path):
+    (tmp_path / "common").mkdir()
+    (tmp_path / "common" / "shared.yml").write_text(COMMON, encoding="utf-8")
+    path = tmp_path / "metadata.yml"
+    path.write_text(SERVICE, encoding="utf-8")
+    return path
+
+
+def test_read_metadata_file_resolves_refs(service_path):
+    data = read_metadata_file(str(service_path), resolve_refs=True)
+
+    one, two = data["use_cases"]["one"], data["use_cases"]["two"]
+    assert one["triggers"][0] is two["triggers"][0]
+    assert one["triggers"][0]["options"]["path"] == "/shared"
+    assert one["triggers"][1]["options"] == {"apigw": "internal", "authenticator": "employee",
+                                             "method": "post", "path": "/one"}
+    assert two["triggers"][1]["options"] == {"queue": "events"}
+
+
+def test_read_service_metadata_shares_objects(service_path):
+    service_info = read_service_metadata(str(service_path), resolve_refs=True)
+
+    one, two = service_info.use_cases["one"], service_info.use_cases["two"]
+    assert one.triggers[0] is two.triggers[0]
+    assert one.external_interactions[0] is two.external_interactions[0]
+    assert one.external_interactions[0].operation == "get_user"
+    assert two.triggers[1].options.queue == "events"
+
+
+def test_each_file_is_parsed_once(service_path):
+    calls = []
+
+    def read_file(path):
+        calls.append(path)
+        return read_metadata_file(path)
+
+    resolver = RefResolver(read_file)
+    resolver.load(str(service_path))
+
+    assert len(calls) == len(set(calls)) == 2
+    assert resolver.loaded_files == calls
+
+
+def test_circular_refs(tmp_path):
+    (tmp_path / "a.yml").write_text("x:\n  $ref: b.yml#/y\n", encoding="utf-8")
+    (tmp_path / "b.yml").write_text("y:\n  $ref: a.yml#/x\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Circular \\$ref"):
+        read_metadata_file(str(tmp_path / "a.yml"), resolve_refs=True)
+
+
+@pytest.mark.parametrize("ref, message", [
+    ("missing.yml#/a", "does not exist"),
+    ("#/nothing/here", "can not be found"),
+    ("#nothing", "Invalid JSON pointer"),
+])
+def test_invalid_refs(tmp_path, ref, message):
+    path = tmp_path / "metadata.yml"
+    path.write_text(f"name: x\nvalue:\n  $ref: '{ref}'\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match=message):
+        read_metadata_file(str(path), resolve_refs=True)
+
+
+def test_refs_are_not_resolved_by_default(service_path):
+    data = read_metadata_file(str(service_path))
+
+    assert data["use_cases"]["one"]["triggers"][0] == {"$ref": "common/shared.yml#/triggers/0"}
+
+
+def test_resolve_refs_with_cache(service_path, tmp_path):
+    with pytest.raises(ValueError, match="resolve_refs"):
+        read_service_metadata(str(service_path), cache=MetadataDiskCache(str(tmp_path / "cache")),
+                              resolve_refs=True)
+
+
+@pytest.mark.parametrize("ref", ["../outside/shared.yml#/value", "{outside}/shared.yml#/value"])
+def test_refs_outside_the_metadata_directory(tmp_path, ref):
+    (tmp_path / "outside").mkdir()
+    (tmp_path / "outside" / "shared.yml").write_text("value: secret\n", encoding="utf-8")
+    (tmp_path / "service").mkdir()
+    path = tmp_path / "service" / "metadata.yml"
+    ref = ref.format(outside=tmp_path / "outside")
+    path.write_text(f"name: x\nvalue:\n  $ref: '{ref}'\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="points outside of the metadata directory"):
+        read_metadata_file(str(path), resolve_refs=True)
+    with pytest.raises(ValueError, match="points outside of the metadata directory"):
+        read_service_metadata(str(path), resolve_refs=True)
+    assert read_metadata_file(str(path), resolve_refs=True,
+                              allow_external_refs=True)["value"] == "secret"
+
+
+def test_refs_between_files_of_a_metadata_directory(tmp_path):
+    directory = tmp_path / "metadata.d"
+    (directory / "orders").mkdir(parents=True)
+    (directory / ".shared").mkdir()
+    (directory / "service.yml").write_text("name: orders\n", encoding="utf-8")
+    (directory / ".shared" / "common.yml").write_text("ping:\n  name: ping\n",
+                                                      encoding="utf-8")
+    (directory / "orders" / "ping.yml").write_text(
+        "use_cases:\n  ping:\n    $ref: ../.shared/common.yml#/ping\n", encoding="utf-8")
+
+    data = read_metadata_file(str(directory), resolve_refs=True, executor="none")
+
+    assert data["use_cases"]["ping"] == {"name": "ping"}
@@ -0,0 +1,96 @@
+import io
+import json
+
+from bisslog_schema.schema.enums.criticality import CriticalityEnum
+from bisslog_schema.schema.serializer import iter_json, serializer_for, write_json
+from bisslog_schema.schema.service_info import ServiceInfo
+from bisslog_schema.schema.triggers.trigger_websocket import TriggerWebsocket
+from bisslog_schema.schema.use_case_info import UseCaseInfo
+
+SERVICE = {
+    "name": "users", "type": "microservice", "service_type": "functional", "team": "core",
+    "tags": {"domain": "identity"},
+    "use_cases": {
+        "getUser": {
+            "name": "get user", "criticality": "very_high", "actor": "employee",
+            "tags": {"accessibility": "private"},
+            "triggers": [
+                {"type": "http", "options": {"method": "GET", "path": "/users/{uid}",
+                                             "rate_limit": "100r/m", "timeout": 500,
+                                             "cacheable": True, "allow_cors": False,
+                                             "allowed_origins": ["https://a.example"],
+                                             "mapper": {"path_query.uid": "uid"}}},
+                {"type": "consumer", "options": {"queue": "user-events", "batch_size": 10,
+                                                 "delivery_semantic": "exactly-once"}},
+            ],
+            "external_interactions": [{"keyname": "db", "type_interaction": "db",
+                                       "operation": ["get", "list"]}],
+        },
+        "notifyUser": {
+            "name": "notify user", "criticality": "low", "actor": "system",
+            "triggers": [
+                {"type": "websocket", "options": {"routeKey": "notify"}},
+                {"type": "schedule", "options": {"cronjob": "0 * * * *", "timezone": "UTC"}},
+            ],
+        },
+    },
+}
+
+
+def test_to_dict_has_the_canonical_shape():
+    data = ServiceInfo.from_dict(SERVICE).to_dict()
+    use_case = data["use_cases"]["getUser"]
+
+    assert "description" not in data and "keyname" not in use_case
+    assert use_case["criticality"] == "very_high"
+    assert use_case["triggers"][0]["type"] == "http"
+    assert use_case["triggers"][0]["options"]["rate_limit"] == "100r/m"
+    assert use_case["triggers"][1]["options"]["delivery_semantic"] == "exactly-once"
+    assert use_case["triggers"][1]["options"]["batch_size"] == 10
+    assert use_case["external_interactions"] == [
+        {"keyname": "db", "type_interaction": "db", "operation": ["get", "list"]}]
+    assert data["use_cases"]["notifyUser"]["triggers"][0]["options"] == {"routeKey": "notify"}
+
+
+def test_round_trip():
+    service_info = ServiceInfo.from_dict(SERVICE)
+
+    assert ServiceInfo.from_dict(service_info.to_dict()) == service_info
+    assert ServiceInfo.from_dict(json.loads(service_info.to_json())) == service_info
+    assert not ServiceInfo.analyze(service_info.to_dict()).errors
+    use_case = service_info.use_cases["notifyUser"]
+    assert UseCaseInfo.from_dict(use_case.to_dict()) == use_case
+
+
+def test_unknown_criticality_level_reloads_as_medium():
+    use_case = UseCaseInfo.from_dict({"keyname": "u", "name": "u", "criticality": 60})
+
+    data = use_case.to_dict()
+
+    assert use_case.criticality is None
+    assert "criticality" not in data
+    assert UseCaseInfo.from_dict(data).criticality is CriticalityEnum.MEDIUM
+
+
+def test_frozen_and_lazy_objects_serialize_the_same():
+    expected = ServiceInfo.from_dict(SERVICE).to_dict()
+
+    assert ServiceInfo.from_dict(SERVICE).freeze().to_dict() == expected
+    assert ServiceInfo.from_dict(SERVICE, lazy=True).to_dict() == expected
+
+
+def test_streaming_json_writer():
+    service_info = ServiceInfo.from_dict(SERVICE, lazy=True)
+    buffer = io.StringIO()
+
+    write_json(service_info, buffer, sort_keys=True)
+
+    assert json.loads(buffer.getvalue()) == ServiceInfo.from_dict(SERVICE).to_dict()
+    assert len(list(iter_json(service_info))) > len(SERVICE["use_cases"])
+    assert "".join(iter_json(ServiceInfo(name="empty", use_cases={}))) == \
+        '{"name": "empty", "tags": {}, "use_cases": {}}'
+
+
+def test_serializers_are_generated_once_per_class():
+    assert serializer_for(TriggerWebsocket) is serializer_for(TriggerWebsocket)
+    assert serializer_for(TriggerWebsocket).__qualname__ == "TriggerWebsocket.to_dict"
@@ -0,0 +1,176 @@
+import os
+import shutil
+import threading
+import time
+
+import pytest
+
+from bisslog_schema import read_service_metadata
+from bisslog_schema.schema import (InternTable, LazyUseCases, LoadLimits, MetadataLimitExceeded,
+                                   ServiceMetadataCache)
+
+
+@pytest.fixture
+def metadata(tmp_path):
+    path = tmp_path / "metadata.yml"
+    shutil.copy("examples/webhook.yml", path)
+    return path
+
+
+def test_hits_and_misses(metadata):
+    cache = ServiceMetadataCache()
+
+    first = read_service_metadata(str(metadata), cache=cache)
+    second = read_service_metadata(str(metadata), cache=cache)
+
+    assert first is second
+    assert first == read_service_metadata("examples/webhook.yml")
+    assert cache.stats() == {"hits": 1, "misses": 1, "waits": 0, "evictions": 0,
+                             "entries": 1, "bytes": os.path.getsize(metadata)}
+
+
+def test_changed_file_is_parsed_again(metadata):
+    cache = ServiceMetadataCache()
+    first = read_service_metadata(str(metadata), cache=cache)
+
+    metadata.write_text(metadata.read_text().replace("webhook receiver", "other"))
+    stat = os.stat(metadata)
+    os.utime(metadata, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = read_service_metadata(str(metadata), cache=cache)
+    assert second.name == "other"
+    assert second is not first
+    assert cache.stats()["entries"] == 1
+
+
+def test_uses_service_metadata_path(metadata, monkeypatch):
+    cache = ServiceMetadataCache()
+    monkeypatch.setenv("SERVICE_METADATA_PATH", str(metadata))
+
+    first = read_service_metadata(cache=cache)
+
+    assert read_service_metadata(str(metadata), cache=cache) is first
+
+
+def test_path_spellings_share_one_entry(metadata, monkeypatch):
+    cache = ServiceMetadataCache()
+    monkeypatch.chdir(metadata.parent)
+    monkeypatch.setenv("SERVICE_METADATA_PATH", "metadata.yml")
+
+    first = read_service_metadata(str(metadata), cache=cache)
+
+    for path in (None, "metadata.yml", "./metadata.yml", str(metadata)):
+        assert read_service_metadata(path, cache=cache) is first
+    assert cache.stats()["hits"] == 4 and cache.stats()["misses"] == 1
+
+
+def test_concurrent_callers_share_one_parse(metadata):
+    cache = ServiceMetadataCache()
+    calls = []
+    release = threading.Event()
+
+    def parse():
+        calls.append(1)
+        release.wait(5)
+        return read_service_metadata(str(metadata))
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(
+        cache.get_or_parse(str(metadata), parse))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    while cache.stats()["waits"] < 7:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8 and all(result is results[0] for result in results)
+    assert cache.stats()["misses"] == 1
+
+
+def test_errors_are_shared_and_not_cached(metadata):
+    cache = ServiceMetadataCache()
+    calls = []
+
+    def parse():
+        calls.append(1)
+        raise ValueError("broken")
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="broken"):
+            cache.get_or_parse(str(metadata), parse)
+    assert len(calls) == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_by_entries_and_bytes(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"metadata{i}.yml"
+        path.write_text(f"name: svc{i}\n")
+        paths.append(str(path))
+
+    cache = ServiceMetadataCache(max_entries=2)
+    for path in paths[:2]:
+        read_service_metadata(path, cache=cache)
+    read_service_metadata(paths[0], cache=cache)
+    read_service_metadata(paths[2], cache=cache)
+    assert cache.stats()["evictions"] == 1
+    assert read_service_metadata(paths[0], cache=cache).name == "svc0"
+    assert cache.stats()["hits"] == 2
+
+    cache = ServiceMetadataCache(max_bytes=os.path.getsize(paths[0]) * 2)
+    for path in paths:
+        read_service_metadata(path, cache=cache)
+    assert cache.stats()["entries"] == 2
+
+
+def test_invalidate_and_clear(metadata):
+    cache = ServiceMetadataCache()
+    read_service_metadata(str(metadata), cache=cache)
+
+    assert cache.invalidate(str(metadata)) is True
+    assert cache.invalidate(str(metadata)) is False
+    read_service_metadata(str(metadata), cache=cache)
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["misses"] == 2
+
+
+def test_entries_are_keyed_by_reader_options(metadata):
+    cache = ServiceMetadataCache()
+
+    eager = read_service_metadata(str(metadata), cache=cache)
+    lazy = read_service_metadata(str(metadata), cache=cache, lazy=True)
+    with pytest.raises(MetadataLimitExceeded, match="max_file_size"):
+        read_service_metadata(str(metadata), cache=cache, limits=LoadLimits(max_file_size=10))
+
+    assert isinstance(lazy.use_cases, LazyUseCases)
+    assert not isinstance(eager.use_cases, LazyUseCases)
+    assert read_service_metadata(str(metadata), cache=cache, lazy=True) is lazy
+    assert cache.stats()["entries"] == 2
+    assert cache.invalidate(str(metadata)) is True
+    assert cache.stats()["entries"] == 0
+
+
+def test_interning_does_not_modify_shared_entries(metadata):
+    cache = ServiceMetadataCache()
+    plain = read_service_metadata(str(metadata), cache=cache)
+    triggers = [trigger for use_case in plain.use_cases.values() for trigger in use_case.triggers]
+    table = InternTable()
+
+    interned = read_service_metadata(str(metadata), cache=cache, intern=table)
+
+    assert interned is not plain and interned == plain
+    assert len(table) > 0
+    assert all(a is b for a, b in zip(triggers, (
+        trigger for use_case in plain.use_cases.values() for trigger in use_case.triggers)))
+    assert read_service_metadata(str(metadata), cache=cache, intern=table) is interned
+
+
+@pytest.mark.parametrize("kwargs", [{"max_entries": 0}, {"max_bytes": 0}])
+def test_invalid_limits(kwargs):
+    with pytest.raises(ValueError):
+        ServiceMetadataCache(**kwargs)
@@ -0,0 +1,95 @@
+import copy
+import pickle
+from dataclasses import dataclass, field, replace
+
+import pytest
+
+from bisslog_schema import read_service_metadata
+from bisslog_schema.schema.entity_info import EntityInfo
+from bisslog_schema.schema.external_interaction import ExternalInteraction
+from bisslog_schema.schema.service_info import ServiceInfo
+from bisslog_schema.schema.slots import add_slots
+from bisslog_schema.schema.triggers.trigger_consumer import TriggerConsumer
+from bisslog_schema.schema.triggers.trigger_http import TriggerHttp
+from bisslog_schema.schema.triggers.trigger_info import TriggerInfo
+from bisslog_schema.schema.triggers.trigger_schedule import TriggerSchedule
+from bisslog_schema.schema.triggers.trigger_websocket import TriggerWebsocket
+from bisslog_schema.schema.use_case_info import UseCaseInfo
+
+
+@pytest.mark.parametrize("cls", [EntityInfo, ServiceInfo, UseCaseInfo, TriggerInfo, TriggerHttp,
+                                 TriggerConsumer, TriggerSchedule, TriggerWebsocket,
+                                 ExternalInteraction])
+def test_schema_classes_have_no_instance_dict(cls):
+    assert "__slots__" in cls.__dict__
+    assert not hasattr(cls.__new__(cls), "__dict__")
+
+
+def test_public_attribute_api_is_kept():
+    service_info = read_service_metadata("examples/user-management.yml")
+    use_case = next(iter(service_info.use_cases.values()))
+    trigger = use_case.triggers[0]
+
+    use_case.actor = "someone"
+    assert use_case.actor == "someone"
+    assert isinstance(trigger.options.mapper, (dict, type(None)))
+    with pytest.raises(AttributeError):
+        use_case.undeclared = 1
+    assert replace(use_case, name="other").name == "other"
+    assert "UseCaseInfo(" in repr(use_case)
+
+
+def test_slotted_objects_round_trip():
+    service_info = read_service_metadata("examples/user-management.yml")
+
+    assert pickle.loads(pickle.dumps(service_info)) == service_info
+    assert copy.deepcopy(service_info) == service_info
+    assert copy.copy(service_info).use_cases is service_info.use_cases
+
+
+def test_zero_argument_super_keeps_working():
+    report = ServiceInfo.analyze({"name": "service", "use_cases": {
+        "a": {"name": "a", "triggers": [{"type": "http"}]}}})
+
+    assert not report.errors
+    assert UseCaseInfo.analyze({"keyname": "a", "name": "a"}).critical_validation_count > 0
+
+
+def test_add_slots_declares_only_own_fields():
+    @add_slots
+    @dataclass
+    class Base:
+        a: int = 1
+
+    assert Base.__slots__ == ("a",)
+
+    @add_slots
+    @dataclass
+    class Child(Base):
+        b: list = field(default_factory=list)
+
+        def total(self):
+            return super().__repr__()
+
+        @property
+        def double(self):
+            return self.__class__ is Child and self.a * 2
+
+    child = Child(b=[1])
+    assert Child.__slots__ == ("b",)
+    assert (child.a, child.b, child.double) == (1, [1], 2)
+    assert child.total().endswith("Child(a=1)")
+    assert Base() == Base(1)
+
+
+def test_add_slots_rejects_invalid_classes():
+    with pytest.raises(TypeError, match="must be a dataclass"):
+        add_slots(type("Plain", (), {}))
+
+    @dataclass
+    class Slotted:
+        __slots__ = ("a",)
+        a: int
+
+    with pytest.raises(TypeError, match="already specifies __slots__"):
+        add_slots(Slotted)
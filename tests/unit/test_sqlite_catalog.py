@@ -0,0 +1,170 @@
+import os
+
+import pytest
+
+from bisslog_schema import SQLiteCatalog
+from bisslog_schema.schema.enums.criticality import CriticalityEnum
+from bisslog_schema.schema.service_info import ServiceInfo
+from bisslog_schema.sqlite_catalog import CatalogUseCase, service_content_hash
+
+SERVICE = """
+name: {name}
+team: {team}
+tags: {{tier: {tier}}}
+use_cases:
+  get{name}:
+    name: get {name}
+    criticality: high
+    tags: {{domain: {name}}}
+    triggers:
+      - type: http
+        options: {{method: get, path: "/{name}/{{uid}}"}}
+      - type: consumer
+        options: {{queue: {queue}}}
+    external_interactions:
+      - keyname: {name}_db
+        type_interaction: database
+  list{name}:
+    name: list {name}
+    criticality: low
+    triggers:
+      - type: schedule
+        options: {{cronjob: "0 * * * *"}}
+"""
+
+
+def _write(root, name, team="core", tier="gold", queue="events"):
+    directory = root / name
+    directory.mkdir(exist_ok=True)
+    path = directory / "metadata.yml"
+    path.write_text(SERVICE.format(name=name, team=team, tier=tier, queue=queue))
+    return str(path)
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    _write(tmp_path, "orders", queue="orders-events")
+    _write(tmp_path, "billing", team="finance", tier="silver", queue="orders-events")
+    _write(tmp_path, "users")
+    return tmp_path
+
+
+def test_sync_and_queries(fleet):
+    with SQLiteCatalog() as catalog:
+        result = catalog.sync(str(fleet))
+
+        assert len(result.inserted) == 3 and not result.failures
+        assert len(catalog) == 3 and "orders" in catalog and "missing" not in catalog
+        assert [uc.service for uc in catalog.find_by_queue("orders-events")] == \
+            ["billing", "orders"]
+        assert catalog.find_by_route("GET", "/users/{uid}") == [CatalogUseCase(
+            "users", "core", "getusers", "get users", CriticalityEnum.HIGH.value)]
+        assert catalog.find_by_route("post", "/users/{uid}") == []
+        assert len(catalog.find_by_route(None, "/users/{uid}")) == 1
+        assert catalog.services_by_team("core") == ["orders", "users"]
+        assert {uc.keyname for uc in catalog.find_by_tag("domain", "billing")} == \
+            {"getbilling"}
+        assert {uc.service for uc in catalog.find_by_tag("tier", "silver")} == {"billing"}
+        assert len(catalog.find_by_tag("tier")) == 6
+        assert {uc.keyname for uc in catalog.find_by_criticality(
+            CriticalityEnum.HIGH.value)} == {"getorders", "getbilling", "getusers"}
+        assert [uc.service for uc in catalog.find_by_external_interaction("orders_db")] == \
+            ["orders"]
+
+
+def test_sync_only_rewrites_changed_files(fleet):
+    database = str(fleet / "catalog.db")
+    with SQLiteCatalog(database) as catalog:
+        catalog.sync(str(fleet))
+    orders_hash = SQLiteCatalog(database).content_hash("orders")
+
+    _write(fleet, "billing", team="payments", queue="payments-events")
+    with SQLiteCatalog(database) as catalog:
+        result = catalog.sync(str(fleet))
+
+        assert [os.path.basename(os.path.dirname(p)) for p in result.updated] == ["billing"]
+        assert len(result.unchanged) == 2 and not result.inserted
+        assert catalog.content_hash("orders") == orders_hash
+        assert catalog.services_by_team("payments") == ["billing"]
+        assert [uc.service for uc in catalog.find_by_queue("orders-events")] == ["orders"]
+
+
+def test_sync_prunes_removed_services(fleet):
+    with SQLiteCatalog() as catalog:
+        catalog.sync(str(fleet))
+        os.remove(fleet / "users" / "metadata.yml")
+        result = catalog.sync(str(fleet))
+
+        assert result.removed == ["users"]
+        assert "users" not in catalog
+        assert catalog.find_by_route("GET", "/users/{uid}") == []
+
+
+def test_sync_reports_failures(fleet):
+    (fleet / "broken").mkdir()
+    (fleet / "broken" / "metadata.yml").write_text("name: broken\nuse_cases: [1]\n")
+    _write(fleet / "broken", "orders")
+    with SQLiteCatalog() as catalog:
+        result = catalog.sync(str(fleet))
+
+    assert len(result.failures) == 2
+    assert any("already defined" in error for error in result.failures.values())
+    assert len(result.inserted) == 3
+
+
+def test_failed_file_is_rolled_back_and_retried(fleet, monkeypatch):
+    with SQLiteCatalog() as catalog:
+        catalog.sync(str(fleet))
+        previous_hash = catalog.content_hash("orders")
+        _write(fleet, "orders", team="platform")
+
+        def broken_row(trigger):
+            raise RuntimeError("broken row")
+
+        monkeypatch.setattr(SQLiteCatalog, "_trigger_row", staticmethod(broken_row))
+        result = catalog.sync(str(fleet))
+        assert list(result.failures.values()) == ["RuntimeError: broken row"]
+        assert catalog.content_hash("orders") == previous_hash
+        assert catalog.services_by_team("core") == ["orders", "users"]
+        assert len(catalog.find_by_route("GET", "/orders/{uid}")) == 1
+
+        monkeypatch.undo()
+        result = catalog.sync(str(fleet))
+        assert result.updated == [str(fleet / "orders" / "metadata.yml")]
+        assert catalog.services_by_team("platform") == ["orders"]
+
+
+def test_non_scalar_tag_values_are_stored_as_json():
+    service_info = ServiceInfo.from_dict({"name": "s", "tags": {"owners": ["a", "b"]},
+                                          "use_cases": {"u": {"name": "u",
+                                                              "tags": {"sla": {"p99": 200}}}}})
+    with SQLiteCatalog() as catalog:
+        assert catalog.upsert(service_info) is True
+        assert catalog.content_hash("s") == service_content_hash(service_info)
+        assert len(catalog.find_by_tag("owners", '["a", "b"]')) == 1
+        assert len(catalog.find_by_tag("sla", '{"p99": 200}')) == 1
+
+
+def test_upsert_skips_unchanged_content():
+    service_info = ServiceInfo.from_dict({"name": "s", "team": "a", "use_cases": {
+        "u": {"name": "u", "triggers": [{"type": "websocket",
+                                         "options": {"route_key": "$connect"}}]}}})
+    with SQLiteCatalog() as catalog:
+        assert catalog.upsert(service_info) is True
+        assert catalog.upsert(service_info) is False
+        assert catalog.content_hash("s") == service_content_hash(service_info)
+
+        service_info.team = "b"
+        assert catalog.upsert(service_info) is True
+        assert catalog.services_by_team("b") == ["s"]
+        assert catalog.remove("s") is True and catalog.remove("s") is False
+        assert len(catalog) == 0
+
+
+def test_iter_services(fleet):
+    with SQLiteCatalog() as catalog:
+        catalog.sync(str(fleet))
+        services = list(catalog.iter_services())
+
+    assert [service["name"] for service in services] == ["billing", "orders", "users"]
+    assert services[0]["source_path"] == os.path.realpath(fleet / "billing" / "metadata.yml")
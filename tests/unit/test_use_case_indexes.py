@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+
+import pytest
+
+from bisslog_schema.schema.enums.criticality import CriticalityEnum
+from bisslog_schema.schema.service_info import ServiceInfo
+from bisslog_schema.schema.slots import add_slots
+from bisslog_schema.schema.use_case_indexes import UseCaseIndexes
+
+SERVICE = {
+    "name": "users",
+    "use_cases": {
+        "getUser": {
+            "name": "get user",
+            "actor": "employee",
+            "criticality": "high",
+            "tags": {"accessibility": "private"},
+            "triggers": [{"type": "http", "options": {"method": "get", "path": "/users/{uid}"}},
+                         {"type": "consumer", "options": {"queue": "user-events"}},
+                         {"type": "consumer", "options": {"queue": "user-events"}}],
+        },
+        "createUser": {
+            "name": "create user",
+            "actor": "employee",
+            "criticality": "low",
+            "tags": {"accessibility": "public"},
+            "triggers": [{"type": "http", "options": {"method": "post", "path": "/users"}},
+                         {"type": "consumer", "options": {"queue": "user-events"}}],
+        },
+        "notifyUser": {
+            "name": "notify user",
+            "actor": "system",
+            "criticality": 100,
+            "tags": {"channel": "ws"},
+            "triggers": [{"type": "websocket", "options": {"route_key": "notify"}}],
+        },
+    },
+}
+
+
+@pytest.fixture
+def service_info():
+    return ServiceInfo.from_dict(SERVICE)
+
+
+def test_find_by_route_route_key_and_queue(service_info):
+    indexes = service_info.indexes
+
+    assert indexes.find_by_route("GET", "/users/{uid}").keyname == "getUser"
+    assert indexes.find_by_route("post", "/users").keyname == "createUser"
+    assert indexes.find_by_route("DELETE", "/users") is None
+    assert indexes.find_by_route_key("notify").keyname == "notifyUser"
+    assert indexes.find_by_route_key("missing") is None
+    assert [uc.keyname for uc in indexes.find_by_queue("user-events")] == ["getUser",
+                                                                          "createUser"]
+    assert indexes.find_by_queue("missing") == []
+
+
+def test_find_by_actor_and_tag(service_info):
+    indexes = service_info.indexes
+
+    assert indexes.find_by_actor("employee") == ["getUser", "createUser"]
+    assert indexes.find_by_tag("accessibility", "public") == ["createUser"]
+    assert indexes.find_by_tag("accessibility") == ["getUser", "createUser"]
+    assert indexes.find_by_tag("missing") == []
+
+
+def test_find_by_criticality(service_info):
+    indexes = service_info.indexes
+
+    assert indexes.find_by_criticality(CriticalityEnum.HIGH) == ["getUser"]
+    assert indexes.find_by_criticality("low") == ["createUser"]
+    assert indexes.find_by_criticality(70, at_least=True) == ["getUser", "notifyUser"]
+    assert indexes.find_by_criticality(CriticalityEnum.MEDIUM) == []
+
+
+def test_indexes_are_cached_and_rebuilt_on_new_use_cases(service_info):
+    indexes = service_info.indexes
+    assert service_info.indexes is indexes
+
+    service_info.use_cases = {"getUser": service_info.use_cases["getUser"]}
+    assert service_info.indexes is not indexes
+    assert service_info.indexes.find_by_route("POST", "/users") is None
+
+
+def test_invalidate_indexes_after_in_place_changes(service_info):
+    indexes = service_info.indexes
+    del service_info.use_cases["createUser"]
+    assert indexes.find_by_route("POST", "/users") is not None
+
+    service_info.invalidate_indexes()
+    assert service_info.indexes.find_by_route("POST", "/users") is None
+
+
+def test_cached_indexes_are_not_fields(service_info):
+    service_info.indexes
+
+    assert service_info == ServiceInfo.from_dict(SERVICE)
+    assert "_indexes" not in repr(service_info)
+
+
+def test_lazy_use_cases_are_indexed():
+    indexes = UseCaseIndexes(ServiceInfo.from_dict(SERVICE, lazy=True).use_cases)
+
+    assert indexes.find_by_route("GET", "/users/{uid}").keyname == "getUser"
+
+
+def test_add_slots_with_extra_slots():
+    @add_slots(extra_slots=("_cache",))
+    @dataclass
+    class Cached:
+        a: int = 0
+
+    instance = Cached()
+    instance._cache = 1
+    assert Cached.__slots__ == ("a", "_cache")
+    assert not hasattr(instance, "__dict__")
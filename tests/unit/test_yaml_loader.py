@@ -0,0 +1,76 @@
+import glob
+import random
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from bisslog_schema.schema.read_metadata import (read_metadata_file, resolve_yaml_loader,
+                                                 yaml_loader_name, read_service_metadata)
+
+requires_libyaml = pytest.mark.skipif(not getattr(yaml, "__with_libyaml__", False),
+                                      reason="PyYAML built without libyaml")
+
+
+def _random_scalar(rnd: random.Random):
+    return rnd.choice([
+        rnd.randint(-10 ** 6, 10 ** 6), rnd.random() * 1000, rnd.choice([True, False, None]),
+        "".join(rnd.choice("abcXYZ019 _-/{}:#'\"ñ") for _ in range(rnd.randint(0, 20))),
+        "2024-01-01", "0x1F", "1e3", "yes", "~", "",
+    ])
+
+
+def _random_document(rnd: random.Random, depth: int = 0):
+    if depth > 3 or rnd.random() < 0.3:
+        return _random_scalar(rnd)
+    if rnd.random() < 0.5:
+        return [_random_document(rnd, depth + 1) for _ in range(rnd.randint(0, 5))]
+    return {f"key_{rnd.randint(0, 100)}": _random_document(rnd, depth + 1)
+            for _ in range(rnd.randint(0, 5))}
+
+
+def test_python_loader_always_available():
+    assert resolve_yaml_loader("python") is yaml.SafeLoader
+    assert yaml_loader_name("python") == "python"
+
+
+def test_unknown_loader():
+    with pytest.raises(ValueError, match="Unknown YAML loader"):
+        resolve_yaml_loader("fast")
+
+
+@requires_libyaml
+def test_auto_prefers_c_loader():
+    assert resolve_yaml_loader("auto") is yaml.CSafeLoader
+    assert yaml_loader_name() == "c"
+
+
+def test_auto_falls_back_without_libyaml():
+    with patch.object(yaml, "CSafeLoader", None):
+        assert resolve_yaml_loader("auto") is yaml.SafeLoader
+        with pytest.raises(ValueError, match="not available"):
+            resolve_yaml_loader("c")
+
+
+@requires_libyaml
+@pytest.mark.parametrize("path", sorted(glob.glob("examples/*.yml")))
+def test_loaders_produce_same_dicts_on_examples(path):
+    assert read_metadata_file(path, yaml_loader="c") == \
+           read_metadata_file(path, yaml_loader="python")
+
+
+@requires_libyaml
+@pytest.mark.parametrize("seed", range(20))
+def test_loaders_produce_same_dicts_on_generated_corpus(tmp_path, seed):
+    rnd = random.Random(seed)
+    path = tmp_path / "generated.yml"
+    path.write_text(yaml.safe_dump(_random_document(rnd), allow_unicode=True,
+                                   default_flow_style=rnd.choice([True, False, None])),
+                    encoding="utf-8")
+    assert read_metadata_file(str(path), yaml_loader="c") == \
+           read_metadata_file(str(path), yaml_loader="python")
+
+
+def test_read_service_metadata_with_python_loader():
+    assert read_service_metadata("examples/webhook.yml", yaml_loader="python") == \
+           read_service_metadata("examples/webhook.yml")